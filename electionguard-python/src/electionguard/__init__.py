@@ -7,6 +7,7 @@ from electionguard import ballot_box
 from electionguard import ballot_code
 from electionguard import ballot_compact
 from electionguard import ballot_validator
+from electionguard import ballot_wire
 from electionguard import chaum_pedersen
 from electionguard import constants
 from electionguard import data_store
@@ -15,6 +16,7 @@ from electionguard import decrypt_with_shares
 from electionguard import decryption
 from electionguard import decryption_mediator
 from electionguard import decryption_share
+from electionguard import deferred_proofs
 from electionguard import discrete_log
 from electionguard import election
 from electionguard import election_builder
@@ -22,6 +24,7 @@ from electionguard import election_object_base
 from electionguard import election_polynomial
 from electionguard import elgamal
 from electionguard import encrypt
+from electionguard import encrypt_service
 from electionguard import group
 from electionguard import guardian
 from electionguard import hash
@@ -29,7 +32,9 @@ from electionguard import key_ceremony
 from electionguard import key_ceremony_mediator
 from electionguard import logs
 from electionguard import manifest
+from electionguard import nonce_plan
 from electionguard import nonces
+from electionguard import precompute
 from electionguard import proof
 from electionguard import rsa
 from electionguard import scheduler
@@ -38,6 +43,8 @@ from electionguard import singleton
 from electionguard import tally
 from electionguard import type
 from electionguard import utils
+from electionguard import verification
+from electionguard import zero_encryption
 
 from electionguard.auxiliary import (
     AUXILIARY_PUBLIC_KEY,
@@ -88,35 +95,55 @@ from electionguard.ballot_compact import (
     expand_compact_submitted_ballot,
 )
 from electionguard.ballot_validator import (
+    BallotVerificationCache,
+    BallotVerificationRecord,
+    ballot_ciphertext_hash,
     ballot_is_valid_for_election,
     ballot_is_valid_for_style,
     contest_is_valid_for_style,
     selection_is_valid_for_style,
 )
+from electionguard.ballot_wire import (
+    ELEMENT_MOD_P_SIZE,
+    ELEMENT_MOD_Q_SIZE,
+    WIRE_FORMAT_VERSION,
+    WIRE_MAGIC,
+    WireBuffer,
+    decode_ballot,
+    encode_ballot,
+)
 from electionguard.chaum_pedersen import (
+    BATCH_VERIFICATION_EXPONENT_BITS,
     ChaumPedersenProof,
     ConstantChaumPedersenProof,
+    DEFAULT_BATCH_SIZE,
     DisjunctiveChaumPedersenProof,
     make_chaum_pedersen,
     make_constant_chaum_pedersen,
     make_disjunctive_chaum_pedersen,
     make_disjunctive_chaum_pedersen_one,
     make_disjunctive_chaum_pedersen_zero,
+    verify_disjunctive_chaum_pedersen_batch,
 )
 from electionguard.constants import (
     EXTRA_SMALL_TEST_CONSTANTS,
     ElectionConstants,
     LARGE_TEST_CONSTANTS,
     MEDIUM_TEST_CONSTANTS,
+    PRIME_OPTION_ENV,
     PrimeOption,
     SMALL_TEST_CONSTANTS,
     STANDARD_CONSTANTS,
+    constants_context,
     create_constants,
     get_cofactor,
     get_constants,
+    get_constants_for_option,
     get_generator,
     get_large_prime,
     get_small_prime,
+    reset_constants,
+    set_constants,
 )
 from electionguard.data_store import (
     DataStore,
@@ -169,10 +196,21 @@ from electionguard.decryption_share import (
     create_ciphertext_decryption_selection,
     get_shares_for_selection,
 )
+from electionguard.deferred_proofs import (
+    complete_ballot_proofs,
+    complete_contest_proofs,
+    complete_proofs,
+    complete_selection_proof,
+    complete_shard_proofs,
+)
 from electionguard.discrete_log import (
     DLOG_CACHE,
     DLOG_MAX,
+    DLOG_TABLE_ENV,
+    DLOG_TABLE_MAGIC,
     DiscreteLog,
+    DiscreteLogTable,
+    MappedDiscreteLogTable,
     compute_discrete_log,
     compute_discrete_log_cache,
 )
@@ -212,42 +250,65 @@ from electionguard.elgamal import (
 from electionguard.encrypt import (
     EncryptionDevice,
     EncryptionMediator,
+    EncryptionStreamStats,
+    STREAM_BATCH_SIZE,
+    chain_ballot_code,
     contest_from,
     encrypt_ballot,
     encrypt_ballot_contests,
     encrypt_contest,
     encrypt_selection,
     generate_device_uuid,
+    master_nonce_for,
     selection_from,
 )
+from electionguard.encrypt_service import (
+    AsyncEncryptionMediator,
+    DEFAULT_MAX_QUEUED,
+)
 from electionguard.group import (
     BaseElement,
+    DEFAULT_WINDOW_SIZE,
     ElementModP,
     ElementModPOrQ,
     ElementModPOrQorInt,
     ElementModPorInt,
     ElementModQ,
     ElementModQorInt,
+    FixedBaseTable,
+    MAX_CACHED_HEX,
+    MAX_FIXED_BASE_TABLES,
+    MAX_KNOWN_RESIDUES,
+    RESIDUE_BATCH_EXPONENT_BITS,
     a_minus_b_q,
     a_plus_bc_q,
     add_q,
+    clear_hex_cache,
+    clear_known_residues,
     div_p,
     div_q,
     g_pow_p,
+    get_fixed_base_table,
+    get_generator_table,
     hex_to_int,
     hex_to_p,
     hex_to_q,
     int_to_hex,
     int_to_p,
     int_to_q,
+    is_known_residue,
+    is_valid_residues,
     mult_inv_p,
     mult_p,
     mult_q,
+    multi_pow_p,
     negate_q,
     pow_p,
     pow_q,
     rand_q,
     rand_range_q,
+    register_fixed_base,
+    set_generator_table_window_size,
 )
 from electionguard.guardian import (
     Guardian,
@@ -261,6 +322,7 @@ from electionguard.hash import (
     CRYPTO_HASHABLE_T,
     CryptoHashCheckable,
     CryptoHashable,
+    HashPrefix,
     hash_elems,
 )
 from electionguard.key_ceremony import (
@@ -324,9 +386,27 @@ from electionguard.manifest import (
     generate_placeholder_selection_from,
     generate_placeholder_selections_from,
 )
+from electionguard.nonce_plan import (
+    BallotNonces,
+    ContestNonces,
+    SelectionNonces,
+    plan_ballot_nonces,
+    plan_contest_nonces,
+    plan_selection_nonces,
+)
 from electionguard.nonces import (
     Nonces,
 )
+from electionguard.precompute import (
+    DEFAULT_POOL_DEPTH,
+    EncryptionPool,
+    EncryptionPoolStats,
+    PrecomputedExponentiation,
+    PrecomputedSelection,
+    SELECTION_EXPONENTIATIONS,
+    make_constant_chaum_pedersen_precomputed,
+    precompute_exponentiation,
+)
 from electionguard.proof import (
     Proof,
     ProofUsage,
@@ -354,6 +434,7 @@ from electionguard.singleton import (
     Singleton,
 )
 from electionguard.tally import (
+    ACCUMULATE_CHUNK_SIZE,
     CiphertextTally,
     CiphertextTallyContest,
     CiphertextTallySelection,
@@ -361,8 +442,12 @@ from electionguard.tally import (
     PlaintextTallyContest,
     PlaintextTallySelection,
     PublishedCiphertextTally,
+    merge_published_tallies,
+    merge_tallies,
     tally_ballot,
+    tally_ballot_shards,
     tally_ballots,
+    tally_shard,
 )
 from electionguard.type import (
     BALLOT_ID,
@@ -382,21 +467,36 @@ from electionguard.utils import (
     to_iso_date_string,
     to_ticks,
 )
+from electionguard.verification import (
+    DeferredVerifier,
+    VerificationMode,
+    VerificationPolicy,
+)
+from electionguard.zero_encryption import (
+    ZeroEncryption,
+    ZeroEncryptionStore,
+)
 
 __all__ = [
+    "ACCUMULATE_CHUNK_SIZE",
     "AUXILIARY_PUBLIC_KEY",
     "AUXILIARY_SECRET_KEY",
     "AnnotatedString",
+    "AsyncEncryptionMediator",
     "AuxiliaryDecrypt",
     "AuxiliaryEncrypt",
     "AuxiliaryKeyPair",
     "AuxiliaryPublicKey",
     "BALLOT_ID",
+    "BATCH_VERIFICATION_EXPONENT_BITS",
     "BYTE_ORDER",
     "BackupVerificationState",
     "BallotBox",
     "BallotBoxState",
+    "BallotNonces",
     "BallotStyle",
+    "BallotVerificationCache",
+    "BallotVerificationRecord",
     "BaseElement",
     "CONTEST_ID",
     "CRYPTO_HASHABLE_ALL",
@@ -425,15 +525,26 @@ __all__ = [
     "ContactInformation",
     "ContestDescription",
     "ContestDescriptionWithPlaceholders",
+    "ContestNonces",
     "CryptoHashCheckable",
     "CryptoHashable",
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_MAX_QUEUED",
+    "DEFAULT_POOL_DEPTH",
+    "DEFAULT_WINDOW_SIZE",
     "DLOG_CACHE",
     "DLOG_MAX",
+    "DLOG_TABLE_ENV",
+    "DLOG_TABLE_MAGIC",
     "DataStore",
     "DecryptionMediator",
     "DecryptionShare",
+    "DeferredVerifier",
     "DiscreteLog",
+    "DiscreteLogTable",
     "DisjunctiveChaumPedersenProof",
+    "ELEMENT_MOD_P_SIZE",
+    "ELEMENT_MOD_Q_SIZE",
     "ELGAMAL_PUBLIC_KEY",
     "ELGAMAL_SECRET_KEY",
     "ENCRYPTED_MESSAGE",
@@ -460,13 +571,18 @@ __all__ = [
     "ElementModQorInt",
     "EncryptionDevice",
     "EncryptionMediator",
+    "EncryptionPool",
+    "EncryptionPoolStats",
+    "EncryptionStreamStats",
     "ExtendedData",
     "FORMAT",
+    "FixedBaseTable",
     "GUARDIAN_ID",
     "GeopoliticalUnit",
     "Guardian",
     "GuardianPair",
     "GuardianRecord",
+    "HashPrefix",
     "ISO_ENCODING",
     "InternalManifest",
     "InternationalizedText",
@@ -477,14 +593,19 @@ __all__ = [
     "LagrangeCoefficientsRecord",
     "Language",
     "MAX_BITS",
+    "MAX_CACHED_HEX",
+    "MAX_FIXED_BASE_TABLES",
+    "MAX_KNOWN_RESIDUES",
     "MEDIATOR_ID",
     "MEDIUM_TEST_CONSTANTS",
     "MESSAGE",
     "Manifest",
+    "MappedDiscreteLogTable",
     "NO_VOTE",
     "Nonces",
     "OrderedObjectBase",
     "PADDING",
+    "PRIME_OPTION_ENV",
     "PUBLIC_COMMITMENT",
     "PUBLIC_EXPONENT",
     "Party",
@@ -494,6 +615,8 @@ __all__ = [
     "PlaintextTally",
     "PlaintextTallyContest",
     "PlaintextTallySelection",
+    "PrecomputedExponentiation",
+    "PrecomputedSelection",
     "PrimeOption",
     "PrivateGuardianRecord",
     "Proof",
@@ -502,22 +625,33 @@ __all__ = [
     "PublicKeySet",
     "PublishedCiphertextTally",
     "RECOVERY_PUBLIC_KEY",
+    "RESIDUE_BATCH_EXPONENT_BITS",
     "RSAKeyPair",
     "ReadOnlyDataStore",
     "ReferendumContestDescription",
     "ReportingUnitType",
     "SECRET_COEFFICIENT",
+    "SELECTION_EXPONENTIATIONS",
     "SELECTION_ID",
     "SMALL_TEST_CONSTANTS",
     "STANDARD_CONSTANTS",
+    "STREAM_BATCH_SIZE",
     "Scheduler",
     "SchnorrProof",
     "SelectionDescription",
+    "SelectionNonces",
     "Singleton",
     "SubmittedBallot",
     "VERIFIER_ID",
+    "VerificationMode",
+    "VerificationPolicy",
     "VoteVariationType",
+    "WIRE_FORMAT_VERSION",
+    "WIRE_MAGIC",
+    "WireBuffer",
     "YES_VOTE",
+    "ZeroEncryption",
+    "ZeroEncryptionStore",
     "a_minus_b_q",
     "a_plus_bc_q",
     "accept_ballot",
@@ -525,14 +659,24 @@ __all__ = [
     "auxiliary",
     "ballot",
     "ballot_box",
+    "ballot_ciphertext_hash",
     "ballot_code",
     "ballot_compact",
     "ballot_is_valid_for_election",
     "ballot_is_valid_for_style",
     "ballot_validator",
+    "ballot_wire",
+    "chain_ballot_code",
     "chaum_pedersen",
+    "clear_hex_cache",
+    "clear_known_residues",
     "combine_election_public_keys",
     "compensate_decrypt",
+    "complete_ballot_proofs",
+    "complete_contest_proofs",
+    "complete_proofs",
+    "complete_selection_proof",
+    "complete_shard_proofs",
     "compress_plaintext_ballot",
     "compress_submitted_ballot",
     "compute_compensated_decryption_share",
@@ -551,6 +695,7 @@ __all__ = [
     "compute_polynomial_coordinate",
     "compute_recovery_public_key",
     "constants",
+    "constants_context",
     "contest_description_with_placeholders_from",
     "contest_from",
     "contest_is_valid_for_style",
@@ -558,6 +703,7 @@ __all__ = [
     "create_ciphertext_decryption_selection",
     "create_constants",
     "data_store",
+    "decode_ballot",
     "decrypt_ballot",
     "decrypt_ballot_with_nonce",
     "decrypt_ballot_with_secret",
@@ -573,6 +719,7 @@ __all__ = [
     "decryption",
     "decryption_mediator",
     "decryption_share",
+    "deferred_proofs",
     "discrete_log",
     "div_p",
     "div_q",
@@ -586,11 +733,13 @@ __all__ = [
     "elgamal_encrypt",
     "elgamal_keypair_from_secret",
     "elgamal_keypair_random",
+    "encode_ballot",
     "encrypt",
     "encrypt_ballot",
     "encrypt_ballot_contests",
     "encrypt_contest",
     "encrypt_selection",
+    "encrypt_service",
     "expand_compact_plaintext_ballot",
     "expand_compact_submitted_ballot",
     "flatmap_optional",
@@ -609,8 +758,11 @@ __all__ = [
     "get_ballots",
     "get_cofactor",
     "get_constants",
+    "get_constants_for_option",
     "get_file_handler",
+    "get_fixed_base_table",
     "get_generator",
+    "get_generator_table",
     "get_hash_for_device",
     "get_large_prime",
     "get_optional",
@@ -630,6 +782,8 @@ __all__ = [
     "int_to_hex",
     "int_to_p",
     "int_to_q",
+    "is_known_residue",
+    "is_valid_residues",
     "key_ceremony",
     "key_ceremony_mediator",
     "log_add_handler",
@@ -648,20 +802,31 @@ __all__ = [
     "make_ciphertext_election_context",
     "make_ciphertext_submitted_ballot",
     "make_constant_chaum_pedersen",
+    "make_constant_chaum_pedersen_precomputed",
     "make_disjunctive_chaum_pedersen",
     "make_disjunctive_chaum_pedersen_one",
     "make_disjunctive_chaum_pedersen_zero",
     "make_schnorr_proof",
     "manifest",
+    "master_nonce_for",
     "match_optional",
+    "merge_published_tallies",
+    "merge_tallies",
     "mult_inv_p",
     "mult_p",
     "mult_q",
+    "multi_pow_p",
     "negate_q",
+    "nonce_plan",
     "nonces",
     "partially_decrypt",
+    "plan_ballot_nonces",
+    "plan_contest_nonces",
+    "plan_selection_nonces",
     "pow_p",
     "pow_q",
+    "precompute",
+    "precompute_exponentiation",
     "proof",
     "publish_guardian_record",
     "rand_q",
@@ -669,6 +834,8 @@ __all__ = [
     "reconstruct_decryption_contest",
     "reconstruct_decryption_share",
     "reconstruct_decryption_share_for_ballot",
+    "register_fixed_base",
+    "reset_constants",
     "rsa",
     "rsa_decrypt",
     "rsa_encrypt",
@@ -678,18 +845,25 @@ __all__ = [
     "selection_from",
     "selection_is_valid_for_style",
     "sequence_order_sort",
+    "set_constants",
+    "set_generator_table_window_size",
     "singleton",
     "space_between_capitals",
     "tally",
     "tally_ballot",
+    "tally_ballot_shards",
     "tally_ballots",
+    "tally_shard",
     "to_iso_date_string",
     "to_ticks",
     "type",
     "utils",
+    "verification",
+    "verify_disjunctive_chaum_pedersen_batch",
     "verify_election_partial_key_backup",
     "verify_election_partial_key_challenge",
     "verify_polynomial_coordinate",
+    "zero_encryption",
 ]
 
 # </AUTOGEN_INIT>
@@ -1,7 +1,16 @@
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Iterable, Optional, Protocol, runtime_checkable, Sequence
+from typing import (
+    Any,
+    List,
+    Iterable,
+    Optional,
+    Protocol,
+    runtime_checkable,
+    Sequence,
+    Tuple,
+)
 
 from .ballot_code import get_ballot_code
 from .chaum_pedersen import (
@@ -9,6 +18,7 @@ from .chaum_pedersen import (
     DisjunctiveChaumPedersenProof,
     make_constant_chaum_pedersen,
     make_disjunctive_chaum_pedersen,
+    verify_disjunctive_chaum_pedersen_batch,
 )
 from .election_object_base import (
     ElectionObjectBase,
@@ -194,6 +204,25 @@ class CiphertextBallotSelection(
         :param elgamal_public_key: The election public key
         """
 
+        if not self.is_valid_crypto_hash(encryption_seed):
+            return False
+
+        if self.proof is None:
+            log_warning(f"no proof exists for: {self.object_id}")
+            return False
+
+        return self.proof.is_valid(
+            self.ciphertext, elgamal_public_key, crypto_extended_base_hash
+        )
+
+    def is_valid_crypto_hash(self, encryption_seed: ElementModQ) -> bool:
+        """
+        Given an encrypted BallotSelection, validates the `description_hash` and `crypto_hash`
+        against a specific seed without verifying the proof.
+
+        :param encryption_seed: the hash of the SelectionDescription, or
+                          whatever `ElementModQ` was used to populate the `description_hash` field.
+        """
         if encryption_seed != self.description_hash:
             log_warning(
                 (
@@ -213,13 +242,7 @@ class CiphertextBallotSelection(
             )
             return False
 
-        if self.proof is None:
-            log_warning(f"no proof exists for: {self.object_id}")
-            return False
-
-        return self.proof.is_valid(
-            self.ciphertext, elgamal_public_key, crypto_extended_base_hash
-        )
+        return True
 
     def crypto_hash_with(self, encryption_seed: ElementModQ) -> ElementModQ:
         """
@@ -257,12 +280,13 @@ def make_ciphertext_ballot_selection(
     crypto_hash: Optional[ElementModQ] = None,
     proof: Optional[DisjunctiveChaumPedersenProof] = None,
     extended_data: Optional[ElGamalCiphertext] = None,
+    defer_proof: bool = False,
 ) -> CiphertextBallotSelection:
     """
     Constructs a `CipherTextBallotSelection` object. Most of the parameters here match up to fields
     in the class, but this helper function will optionally compute a Chaum-Pedersen proof if the
-    given nonce isn't `None`. Likewise, if a crypto_hash is not provided, it will be derived from
-    the other fields.
+    given nonce isn't `None` and the proof is not deferred. Likewise, if a crypto_hash is not provided,
+    it will be derived from the other fields.
     """
 
     if crypto_hash is None:
@@ -270,7 +294,7 @@ def make_ciphertext_ballot_selection(
             object_id, description_hash, ciphertext
         )
 
-    if proof is None:
+    if proof is None and not defer_proof:
         proof = flatmap_optional(
             nonce,
             lambda n: make_disjunctive_chaum_pedersen(
@@ -523,7 +547,7 @@ class CiphertextBallotContest(OrderedObjectBase, CryptoHashCheckable):
             != computed_ciphertext_accumulation.data
         ):
             log_warning(
-               f"ciphertext does not equal elgamal accumulation for : {self.object_id}\n"
+                f"ciphertext does not equal elgamal accumulation for : {self.object_id}\n"
                 f"expected{self.ciphertext_accumulation} actual {computed_ciphertext_accumulation}"
             )
             return False
@@ -587,12 +611,13 @@ def make_ciphertext_ballot_contest(
     crypto_hash: Optional[ElementModQ] = None,
     proof: Optional[ConstantChaumPedersenProof] = None,
     nonce: Optional[ElementModQ] = None,
+    defer_proof: bool = False,
 ) -> CiphertextBallotContest:
     """
     Constructs a `CipherTextBallotContest` object. Most of the parameters here match up to fields
     in the class, but this helper function will optionally compute a Chaum-Pedersen proof if the
-    ballot selections include their encryption nonces. Likewise, if a crypto_hash is not provided,
-    it will be derived from the other fields.
+    ballot selections include their encryption nonces and the proof is not deferred. Likewise, if a
+    crypto_hash is not provided, it will be derived from the other fields.
     """
     if crypto_hash is None:
         crypto_hash = _ciphertext_ballot_context_crypto_hash(
@@ -601,7 +626,7 @@ def make_ciphertext_ballot_contest(
 
     aggregate = _ciphertext_ballot_contest_aggregate_nonce(object_id, ballot_selections)
     elgamal_accumulation = _ciphertext_ballot_elgamal_accumulate(ballot_selections)
-    if proof is None:
+    if proof is None and not defer_proof:
         proof = flatmap_optional(
             aggregate,
             lambda ag: make_constant_chaum_pedersen(
@@ -805,16 +830,20 @@ class CiphertextBallot(ElectionObjectBase, CryptoHashCheckable):
 
         # Check the proofs on the ballot
         valid_proofs: List[bool] = list()
+        selection_proofs: List[
+            Tuple[DisjunctiveChaumPedersenProof, ElGamalCiphertext]
+        ] = list()
 
         for contest in self.contests:
             for selection in contest.ballot_selections:
                 valid_proofs.append(
-                    selection.is_valid_encryption(
-                        selection.description_hash,
-                        elgamal_public_key,
-                        crypto_extended_base_hash,
-                    )
+                    selection.is_valid_crypto_hash(selection.description_hash)
                 )
+                if selection.proof is None:
+                    log_warning(f"no proof exists for: {selection.object_id}")
+                    valid_proofs.append(False)
+                else:
+                    selection_proofs.append((selection.proof, selection.ciphertext))
             valid_proofs.append(
                 contest.is_valid_encryption(
                     contest.description_hash,
@@ -822,6 +851,13 @@ class CiphertextBallot(ElectionObjectBase, CryptoHashCheckable):
                     crypto_extended_base_hash,
                 )
             )
+
+        # the selection proofs all share the election key, so they are verified together
+        valid_proofs.extend(
+            verify_disjunctive_chaum_pedersen_batch(
+                selection_proofs, elgamal_public_key, crypto_extended_base_hash
+            )
+        )
         return all(valid_proofs)
 
 
@@ -7,7 +7,7 @@ from .ballot import (
     SubmittedBallot,
     from_ciphertext_ballot,
 )
-from .ballot_validator import ballot_is_valid_for_election
+from .ballot_validator import BallotVerificationCache, ballot_is_valid_for_election
 from .data_store import DataStore
 from .election import CiphertextElectionContext
 from .logs import log_warning
@@ -22,6 +22,16 @@ class BallotBox:
     _internal_manifest: InternalManifest = field()
     _encryption: CiphertextElectionContext = field()
     _store: DataStore = field(default_factory=lambda: DataStore())
+    _verified: BallotVerificationCache = field(
+        default_factory=lambda: BallotVerificationCache()
+    )
+
+    def verified(self) -> BallotVerificationCache:
+        """
+        Get the cache of ballots verified on submission,
+        which lets a `CiphertextTally` skip verifying them again.
+        """
+        return self._verified
 
     def cast(self, ballot: CiphertextBallot) -> Optional[SubmittedBallot]:
         """Cast a specific encrypted `CiphertextBallot`."""
@@ -31,6 +41,7 @@ class BallotBox:
             self._internal_manifest,
             self._encryption,
             self._store,
+            self._verified,
         )
 
     def spoil(self, ballot: CiphertextBallot) -> Optional[SubmittedBallot]:
@@ -41,6 +52,7 @@ class BallotBox:
             self._internal_manifest,
             self._encryption,
             self._store,
+            self._verified,
         )
 
 
@@ -50,11 +62,13 @@ def accept_ballot(
     internal_manifest: InternalManifest,
     context: CiphertextElectionContext,
     store: DataStore,
+    verified: Optional[BallotVerificationCache] = None,
 ) -> Optional[SubmittedBallot]:
     """
     Submit a ballot within the context of a specified election and against an existing data store
     Verified that the ballot is valid for the election `internal_manifest` and `context` and
     that the ballot has not already been cast or spoiled.
+    :param verified: optionally record the verified ballot so it is not verified again when tallied
     :return: a `SubmittedBallot` or `None` if there was an error
     """
     if not ballot_is_valid_for_election(ballot, internal_manifest, context):
@@ -72,6 +86,8 @@ def accept_ballot(
     # TODO: ISSUE #56: check if the ballot includes the proofs, if it does not include the nonce
 
     ballot_box_ballot = from_ciphertext_ballot(ballot, state)
+    if verified is not None:
+        verified.add(ballot_box_ballot, context)
 
     store.set(ballot_box_ballot.object_id, ballot_box_ballot)
     return store.get(ballot_box_ballot.object_id)
@@ -1,22 +1,128 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
 from .ballot import CiphertextBallot, CiphertextBallotContest, CiphertextBallotSelection
 from .election import CiphertextElectionContext
+from .election_object_base import sequence_order_sort
+from .group import ElementModQ
+from .hash import hash_elems
 from .logs import log_warning
 from .manifest import (
     ContestDescriptionWithPlaceholders,
     InternalManifest,
     SelectionDescription,
 )
+from .type import BALLOT_ID
+
+
+@dataclass(frozen=True)
+class BallotVerificationRecord:
+    """
+    A record that a ballot's encryption and proofs were verified for an election
+    """
+
+    ballot_id: BALLOT_ID
+    """The `object_id` of the verified ballot"""
+
+    style_id: str
+    """The `object_id` of the `BallotStyle` the ballot was verified against"""
+
+    crypto_hash: ElementModQ
+    """The hash of the verified ballot's encrypted selections"""
+
+    crypto_extended_base_hash: ElementModQ
+    """The extended base hash of the election the ballot was verified for"""
+
+
+class BallotVerificationCache:
+    """
+    A cache of the ballots whose encryption and proofs have already been verified,
+    so that a ballot accepted by the ballot box does not have to be verified again by the tally.
+
+    Each record is bound to the ballot's crypto hash. A ballot only matches its record when the hash
+    recomputed from its selection ciphertexts is unchanged, so a ballot modified after it was
+    verified is verified again in full.
+    """
+
+    _records: Dict[BALLOT_ID, BallotVerificationRecord]
+
+    def __init__(self) -> None:
+        self._records = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(
+        self, ballot: CiphertextBallot, context: CiphertextElectionContext
+    ) -> BallotVerificationRecord:
+        """
+        Record a ballot that was verified with `ballot_is_valid_for_election`.
+
+        :param ballot: The verified ballot
+        :param context: The election context the ballot was verified for
+        :return: The record of the verification
+        """
+        record = BallotVerificationRecord(
+            ballot.object_id,
+            ballot.style_id,
+            ballot.crypto_hash,
+            context.crypto_extended_base_hash,
+        )
+        self._records[ballot.object_id] = record
+        return record
+
+    def get(self, ballot_id: BALLOT_ID) -> Optional[BallotVerificationRecord]:
+        """Get the verification record for a ballot, if there is one."""
+        return self._records.get(ballot_id)
+
+    def is_verified(
+        self, ballot: CiphertextBallot, context: CiphertextElectionContext
+    ) -> bool:
+        """
+        Determine if a ballot matches the record of an earlier verification for the election.
+        Only hashes are recomputed, none of the proofs are checked.
+        """
+        record = self._records.get(ballot.object_id)
+        return (
+            record is not None
+            and record.style_id == ballot.style_id
+            and record.crypto_hash == ballot.crypto_hash
+            and record.crypto_extended_base_hash == context.crypto_extended_base_hash
+            and ballot_ciphertext_hash(ballot) == record.crypto_hash
+        )
+
+
+def ballot_ciphertext_hash(ballot: CiphertextBallot) -> ElementModQ:
+    """
+    Recompute the crypto hash of a ballot from its selection ciphertexts,
+    rather than from the hashes stored on its contests and selections.
+    """
+    contest_hashes = []
+    for contest in sequence_order_sort(ballot.contests):
+        selection_hashes = [
+            selection.crypto_hash_with(selection.description_hash)
+            for selection in sequence_order_sort(contest.ballot_selections)
+        ]
+        contest_hashes.append(
+            hash_elems(contest.object_id, contest.description_hash, *selection_hashes)
+        )
+    return hash_elems(ballot.object_id, ballot.manifest_hash, *contest_hashes)
 
 
 def ballot_is_valid_for_election(
     ballot: CiphertextBallot,
     internal_manifest: InternalManifest,
     context: CiphertextElectionContext,
+    verified: Optional[BallotVerificationCache] = None,
 ) -> bool:
     """
     Determine if a ballot is valid for a given election
+    :param verified: Ballots already verified for the election, which are not verified again
     """
 
+    if verified is not None and verified.is_verified(ballot, context):
+        return True
+
     if not ballot_is_valid_for_style(ballot, internal_manifest):
         return False
 
@@ -34,19 +140,24 @@ def ballot_is_valid_for_election(
 
 
 def selection_is_valid_for_style(
-    selection: CiphertextBallotSelection, description: SelectionDescription
+    selection: CiphertextBallotSelection,
+    description: SelectionDescription,
+    description_hash: Optional[ElementModQ] = None,
 ) -> bool:
     """
     Determine if selection is valid for ballot style
     :param selection: Ballot selection
     :param description: Selection description
+    :param description_hash: Precomputed hash of the selection description
     :return: Is valid
     """
-    if selection.description_hash != description.crypto_hash():
+    if description_hash is None:
+        description_hash = description.crypto_hash()
+    if selection.description_hash != description_hash:
         log_warning(
             (
                 f"ballot is not valid for style: mismatched selection description hash {selection.description_hash} "
-                f"for selection {description.object_id} hash {description.crypto_hash()}"
+                f"for selection {description.object_id} hash {description_hash}"
             )
         )
         return False
@@ -55,20 +166,25 @@ def selection_is_valid_for_style(
 
 
 def contest_is_valid_for_style(
-    contest: CiphertextBallotContest, description: ContestDescriptionWithPlaceholders
+    contest: CiphertextBallotContest,
+    description: ContestDescriptionWithPlaceholders,
+    description_hash: Optional[ElementModQ] = None,
 ) -> bool:
     """
     Determine if contest is valid for ballot style
     :param contest: Contest
     :param description: Contest description
+    :param description_hash: Precomputed hash of the contest description
     :return: Is valid
     """
     # verify the hash matches
-    if contest.description_hash != description.crypto_hash():
+    if description_hash is None:
+        description_hash = description.crypto_hash()
+    if contest.description_hash != description_hash:
         log_warning(
             (
                 f"ballot is not valid for style: mismatched description hash {contest.description_hash} "
-                f"for contest {description.object_id} hash {description.crypto_hash()}"
+                f"for contest {description.object_id} hash {description_hash}"
             )
         )
         return False
@@ -96,12 +212,12 @@ def ballot_is_valid_for_style(
     """
     descriptions = internal_manifest.get_contests_for(ballot.style_id)
 
+    contests_by_id: Dict[str, CiphertextBallotContest] = {}
+    for contest in ballot.contests:
+        contests_by_id.setdefault(contest.object_id, contest)
+
     for description in descriptions:
-        use_contest = None
-        for contest in ballot.contests:
-            if description.object_id == contest.object_id:
-                use_contest = contest
-                break
+        use_contest = contests_by_id.get(description.object_id)
 
         # verify the contest exists on the ballot
         if use_contest is None:
@@ -110,16 +226,20 @@ def ballot_is_valid_for_style(
             )
             return False
 
-        if not contest_is_valid_for_style(use_contest, description):
+        if not contest_is_valid_for_style(
+            use_contest,
+            description,
+            internal_manifest.contest_hash_for(description.object_id),
+        ):
             return False
 
         # verify the selection metadata
+        selections_by_id: Dict[str, CiphertextBallotSelection] = {}
+        for selection in use_contest.ballot_selections:
+            selections_by_id.setdefault(selection.object_id, selection)
+
         for selection_description in description.ballot_selections:
-            use_selection = None
-            for selection in use_contest.ballot_selections:
-                if selection_description.object_id == selection.object_id:
-                    use_selection = selection
-                    break
+            use_selection = selections_by_id.get(selection_description.object_id)
 
             if use_selection is None:
                 log_warning(
@@ -127,7 +247,13 @@ def ballot_is_valid_for_style(
                 )
                 return False
 
-            if not selection_is_valid_for_style(use_selection, selection_description):
+            if not selection_is_valid_for_style(
+                use_selection,
+                selection_description,
+                internal_manifest.selection_hash_for(
+                    description.object_id, selection_description.object_id
+                ),
+            ):
                 return False
 
     return True
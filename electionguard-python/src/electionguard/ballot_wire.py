@@ -0,0 +1,349 @@
+from typing import Optional, Union
+
+from .ballot import (
+    BallotBoxState,
+    CiphertextBallot,
+    CiphertextBallotContest,
+    CiphertextBallotSelection,
+    SubmittedBallot,
+)
+from .chaum_pedersen import ConstantChaumPedersenProof, DisjunctiveChaumPedersenProof
+from .elgamal import ElGamalCiphertext
+from .group import ElementModP, ElementModQ
+
+WIRE_MAGIC = b"EGB"
+"""The bytes every encoded ballot starts with"""
+
+WIRE_FORMAT_VERSION = 1
+"""The version of the wire format written by `encode_ballot`"""
+
+ELEMENT_MOD_P_SIZE = 512
+"""The number of bytes of an `ElementModP`, big-endian and zero padded"""
+
+ELEMENT_MOD_Q_SIZE = 32
+"""The number of bytes of an `ElementModQ`, big-endian and zero padded"""
+
+_CIPHERTEXT_BALLOT = 0
+_SUBMITTED_BALLOT = 1
+
+_HAS_NONCE = 1
+_HAS_PROOF = 2
+_IS_PLACEHOLDER = 4
+_HAS_EXTENDED_DATA = 8
+
+WireBuffer = Union[bytes, bytearray, memoryview]
+
+
+def encode_ballot(ballot: CiphertextBallot) -> bytes:
+    """
+    Encode a `CiphertextBallot` or `SubmittedBallot` in the compact binary wire format.
+
+    Every `ElementModP` takes a fixed 512 bytes and every `ElementModQ` a fixed 32 bytes, so a ballot
+    is several times smaller than its JSON of hex strings and is decoded without parsing any text
+    but its object ids. Integers and the lengths of the object ids are varints. Nonces and proofs
+    are written only if the ballot has them.
+
+    :param ballot: the encrypted ballot
+    :return: the encoded ballot, starting with the magic bytes and the format version
+    """
+    writer = _Writer()
+    writer.raw(WIRE_MAGIC)
+    writer.byte(WIRE_FORMAT_VERSION)
+    is_submitted = isinstance(ballot, SubmittedBallot)
+    writer.byte(_SUBMITTED_BALLOT if is_submitted else _CIPHERTEXT_BALLOT)
+
+    writer.string(ballot.object_id)
+    writer.string(ballot.style_id)
+    writer.q(ballot.manifest_hash)
+    writer.q(ballot.code_seed)
+    writer.q(ballot.code)
+    writer.signed(ballot.timestamp)
+    writer.q(ballot.crypto_hash)
+    writer.optional_q(ballot.nonce)
+    if isinstance(ballot, SubmittedBallot):
+        writer.signed(ballot.state.value)
+
+    writer.unsigned(len(ballot.contests))
+    for contest in ballot.contests:
+        _encode_contest(writer, contest)
+    return bytes(writer.buffer)
+
+
+def decode_ballot(data: WireBuffer) -> CiphertextBallot:
+    """
+    Decode a ballot encoded by `encode_ballot`.
+
+    The elements are read straight from the buffer through a `memoryview`, without copying it,
+    so a ballot can be decoded from a slice of a larger receive buffer.
+
+    :param data: the encoded ballot
+    :return: a `SubmittedBallot` if a submitted ballot was encoded, otherwise a `CiphertextBallot`
+    :raises ValueError: if the data is not a ballot in a supported version of the format
+    """
+    reader = _Reader(memoryview(data))
+    try:
+        if reader.raw(len(WIRE_MAGIC)) != WIRE_MAGIC:
+            raise ValueError("not an encoded ballot")
+        version = reader.byte()
+        if version != WIRE_FORMAT_VERSION:
+            raise ValueError(f"unsupported ballot wire format version {version}")
+        kind = reader.byte()
+        if kind not in (_CIPHERTEXT_BALLOT, _SUBMITTED_BALLOT):
+            raise ValueError(f"unknown encoded ballot kind {kind}")
+
+        object_id = reader.string()
+        style_id = reader.string()
+        manifest_hash = reader.q()
+        code_seed = reader.q()
+        code = reader.q()
+        timestamp = reader.signed()
+        crypto_hash = reader.q()
+        nonce = reader.optional_q()
+        state = BallotBoxState(reader.signed()) if kind == _SUBMITTED_BALLOT else None
+        contests = [_decode_contest(reader) for _ in range(reader.unsigned())]
+        if reader.offset != len(reader.view):
+            raise ValueError("trailing bytes after the encoded ballot")
+    except (IndexError, OverflowError, UnicodeDecodeError) as error:
+        raise ValueError(f"malformed encoded ballot: {error!r}") from error
+
+    if state is not None:
+        return SubmittedBallot(
+            object_id,
+            style_id,
+            manifest_hash,
+            code_seed,
+            contests,
+            code,
+            timestamp,
+            crypto_hash,
+            nonce,
+            state,
+        )
+    return CiphertextBallot(
+        object_id,
+        style_id,
+        manifest_hash,
+        code_seed,
+        contests,
+        code,
+        timestamp,
+        crypto_hash,
+        nonce,
+    )
+
+
+def _encode_contest(writer: "_Writer", contest: CiphertextBallotContest) -> None:
+    writer.string(contest.object_id)
+    writer.signed(contest.sequence_order)
+    writer.q(contest.description_hash)
+    writer.ciphertext(contest.ciphertext_accumulation)
+    writer.q(contest.crypto_hash)
+    writer.byte(
+        (_HAS_NONCE if contest.nonce is not None else 0)
+        | (_HAS_PROOF if contest.proof is not None else 0)
+    )
+    if contest.nonce is not None:
+        writer.q(contest.nonce)
+    if contest.proof is not None:
+        writer.p(contest.proof.pad)
+        writer.p(contest.proof.data)
+        writer.q(contest.proof.challenge)
+        writer.q(contest.proof.response)
+        writer.signed(contest.proof.constant)
+
+    writer.unsigned(len(contest.ballot_selections))
+    for selection in contest.ballot_selections:
+        _encode_selection(writer, selection)
+
+
+def _decode_contest(reader: "_Reader") -> CiphertextBallotContest:
+    object_id = reader.string()
+    sequence_order = reader.signed()
+    description_hash = reader.q()
+    ciphertext_accumulation = reader.ciphertext()
+    crypto_hash = reader.q()
+    flags = reader.byte()
+    nonce = reader.q() if flags & _HAS_NONCE else None
+    proof = (
+        ConstantChaumPedersenProof(
+            reader.p(), reader.p(), reader.q(), reader.q(), reader.signed()
+        )
+        if flags & _HAS_PROOF
+        else None
+    )
+    selections = [_decode_selection(reader) for _ in range(reader.unsigned())]
+    return CiphertextBallotContest(
+        object_id,
+        sequence_order,
+        description_hash,
+        selections,
+        ciphertext_accumulation,
+        crypto_hash,
+        nonce,
+        proof,
+    )
+
+
+def _encode_selection(writer: "_Writer", selection: CiphertextBallotSelection) -> None:
+    writer.string(selection.object_id)
+    writer.signed(selection.sequence_order)
+    writer.q(selection.description_hash)
+    writer.ciphertext(selection.ciphertext)
+    writer.q(selection.crypto_hash)
+    writer.byte(
+        (_IS_PLACEHOLDER if selection.is_placeholder_selection else 0)
+        | (_HAS_NONCE if selection.nonce is not None else 0)
+        | (_HAS_PROOF if selection.proof is not None else 0)
+        | (_HAS_EXTENDED_DATA if selection.extended_data is not None else 0)
+    )
+    if selection.nonce is not None:
+        writer.q(selection.nonce)
+    if selection.proof is not None:
+        writer.p(selection.proof.proof_zero_pad)
+        writer.p(selection.proof.proof_zero_data)
+        writer.p(selection.proof.proof_one_pad)
+        writer.p(selection.proof.proof_one_data)
+        writer.q(selection.proof.proof_zero_challenge)
+        writer.q(selection.proof.proof_one_challenge)
+        writer.q(selection.proof.challenge)
+        writer.q(selection.proof.proof_zero_response)
+        writer.q(selection.proof.proof_one_response)
+    if selection.extended_data is not None:
+        writer.ciphertext(selection.extended_data)
+
+
+def _decode_selection(reader: "_Reader") -> CiphertextBallotSelection:
+    object_id = reader.string()
+    sequence_order = reader.signed()
+    description_hash = reader.q()
+    ciphertext = reader.ciphertext()
+    crypto_hash = reader.q()
+    flags = reader.byte()
+    nonce = reader.q() if flags & _HAS_NONCE else None
+    proof = (
+        DisjunctiveChaumPedersenProof(
+            reader.p(),
+            reader.p(),
+            reader.p(),
+            reader.p(),
+            reader.q(),
+            reader.q(),
+            reader.q(),
+            reader.q(),
+            reader.q(),
+        )
+        if flags & _HAS_PROOF
+        else None
+    )
+    extended_data = reader.ciphertext() if flags & _HAS_EXTENDED_DATA else None
+    return CiphertextBallotSelection(
+        object_id,
+        sequence_order,
+        description_hash,
+        ciphertext,
+        crypto_hash,
+        bool(flags & _IS_PLACEHOLDER),
+        nonce,
+        proof,
+        extended_data,
+    )
+
+
+class _Writer:
+    """Appends the fields of a ballot to a buffer"""
+
+    buffer: bytearray
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def raw(self, data: bytes) -> None:
+        self.buffer += data
+
+    def byte(self, value: int) -> None:
+        self.buffer.append(value)
+
+    def unsigned(self, value: int) -> None:
+        if value < 0:
+            raise ValueError(f"cannot encode {value} as an unsigned varint")
+        while value >= 0x80:
+            self.buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+    def signed(self, value: int) -> None:
+        # zigzag, so small negative values stay short
+        self.unsigned(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def string(self, value: str) -> None:
+        encoded = value.encode("utf-8")
+        self.unsigned(len(encoded))
+        self.buffer += encoded
+
+    def p(self, element: ElementModP) -> None:
+        self.buffer += int(element).to_bytes(ELEMENT_MOD_P_SIZE, "big")
+
+    def q(self, element: ElementModQ) -> None:
+        self.buffer += int(element).to_bytes(ELEMENT_MOD_Q_SIZE, "big")
+
+    def optional_q(self, element: Optional[ElementModQ]) -> None:
+        self.byte(_HAS_NONCE if element is not None else 0)
+        if element is not None:
+            self.q(element)
+
+    def ciphertext(self, ciphertext: ElGamalCiphertext) -> None:
+        self.p(ciphertext.pad)
+        self.p(ciphertext.data)
+
+
+class _Reader:
+    """Reads the fields of a ballot from a view of its buffer"""
+
+    view: memoryview
+    offset: int
+
+    def __init__(self, view: memoryview) -> None:
+        self.view = view.cast("B") if view.format != "B" else view
+        self.offset = 0
+
+    def raw(self, size: int) -> memoryview:
+        end = self.offset + size
+        if end > len(self.view):
+            raise IndexError("encoded ballot is truncated")
+        field = self.view[self.offset : end]
+        self.offset = end
+        return field
+
+    def byte(self) -> int:
+        value = self.view[self.offset]
+        self.offset += 1
+        return value
+
+    def unsigned(self) -> int:
+        value = 0
+        shift = 0
+        while True:
+            byte = self.byte()
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def signed(self) -> int:
+        value = self.unsigned()
+        return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+    def string(self) -> str:
+        return str(self.raw(self.unsigned()), "utf-8")
+
+    def p(self) -> ElementModP:
+        return ElementModP(int.from_bytes(self.raw(ELEMENT_MOD_P_SIZE), "big"))
+
+    def q(self) -> ElementModQ:
+        return ElementModQ(int.from_bytes(self.raw(ELEMENT_MOD_Q_SIZE), "big"))
+
+    def optional_q(self) -> Optional[ElementModQ]:
+        return self.q() if self.byte() & _HAS_NONCE else None
+
+    def ciphertext(self) -> ElGamalCiphertext:
+        return ElGamalCiphertext(self.p(), self.p())
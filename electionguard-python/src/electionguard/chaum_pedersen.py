@@ -1,18 +1,23 @@
 # pylint: disable=too-many-instance-attributes
 from dataclasses import dataclass
+from secrets import randbits
+from typing import Final, List, Sequence, Tuple
 
+from .constants import get_generator, get_small_prime
 from .elgamal import ElGamalCiphertext
 from .group import (
     ElementModQ,
     ElementModP,
     g_pow_p,
     mult_p,
+    multi_pow_p,
     pow_p,
     a_minus_b_q,
     a_plus_bc_q,
     add_q,
     negate_q,
     int_to_q,
+    is_valid_residues,
     ZERO_MOD_Q,
 )
 from .hash import hash_elems
@@ -85,12 +90,12 @@ class DisjunctiveChaumPedersenProof(Proof):
         in_bounds_v0 = v0.is_in_bounds()
         in_bounds_v1 = v1.is_in_bounds()
         consistent_c = add_q(c0, c1) == c == hash_elems(q, alpha, beta, a0, b0, a1, b1)
-        consistent_gv0 = g_pow_p(v0) == mult_p(a0, pow_p(alpha, c0))
-        consistent_gv1 = g_pow_p(v1) == mult_p(a1, pow_p(alpha, c1))
-        consistent_kv0 = pow_p(k, v0) == mult_p(b0, pow_p(beta, c0))
-        consistent_gc1kv1 = mult_p(g_pow_p(c1), pow_p(k, v1)) == mult_p(
-            b1, pow_p(beta, c1)
-        )
+        consistent_gv0 = g_pow_p(v0) == multi_pow_p([(a0, 1), (alpha, c0)])
+        consistent_gv1 = g_pow_p(v1) == multi_pow_p([(a1, 1), (alpha, c1)])
+        consistent_kv0 = pow_p(k, v0) == multi_pow_p([(b0, 1), (beta, c0)])
+        consistent_gc1kv1 = multi_pow_p(
+            [(get_generator(), c1), (k, v1)]
+        ) == multi_pow_p([(b1, 1), (beta, c1)])
 
         success = (
             in_bounds_alpha
@@ -138,6 +143,128 @@ class DisjunctiveChaumPedersenProof(Proof):
         return success
 
 
+BATCH_VERIFICATION_EXPONENT_BITS: Final[int] = 128
+"""Size of the random exponents used to combine proofs in a batch, i.e. the batch soundness"""
+
+DEFAULT_BATCH_SIZE: Final[int] = 64
+"""Number of proofs combined into a single batch verification equation"""
+
+
+def verify_disjunctive_chaum_pedersen_batch(
+    proofs: Sequence[Tuple[DisjunctiveChaumPedersenProof, ElGamalCiphertext]],
+    k: ElementModP,
+    q: ElementModQ,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> List[bool]:
+    """
+    Validates many "disjunctive" Chaum-Pedersen (zero or one) proofs for the same election together.
+
+    The four verification equations of every proof in a batch are raised to independent random
+    exponents and multiplied into a single equation, which is then checked with one multi-exponentiation.
+    If a batch fails, its proofs are checked one at a time to find the invalid ones.
+
+    :param proofs: The proofs paired with the ciphertext messages they prove
+    :param k: The public key of the election
+    :param q: The extended base hash of the election
+    :param batch_size: The number of proofs combined in each batch
+    :return: The validity of each proof, in the order given
+    """
+    results: List[bool] = []
+    for start in range(0, len(proofs), batch_size):
+        batch = proofs[start : start + batch_size]
+        if _is_valid_disjunctive_chaum_pedersen_batch(batch, k, q):
+            results.extend(True for _ in batch)
+        else:
+            results.extend(proof.is_valid(message, k, q) for (proof, message) in batch)
+    return results
+
+
+def _is_valid_disjunctive_chaum_pedersen_batch(
+    batch: Sequence[Tuple[DisjunctiveChaumPedersenProof, ElGamalCiphertext]],
+    k: ElementModP,
+    q: ElementModQ,
+) -> bool:
+    """
+    Check the combination of the equations 𝑔^𝑣0 = 𝑎0𝐴^𝑐0, 𝑔^𝑣1 = 𝑎1𝐴^𝑐1, 𝐾^𝑣0 = 𝑏0𝐵^𝑐0
+    and 𝑔^𝑐1𝐾^𝑣1 = 𝑏1𝐵^𝑐1 across the batch. Every element must be a valid residue for
+    the combined exponents to be reduced mod q.
+    """
+    small_prime = get_small_prime()
+    g_exponent = 0
+    k_exponent = 0
+    terms: List[Tuple[ElementModP, int]] = []
+    for (proof, message) in batch:
+        if not _is_well_formed_disjunctive_chaum_pedersen(proof, message, q):
+            return False
+    if not is_valid_residues(
+        element
+        for (proof, message) in batch
+        for element in (
+            message.pad,
+            message.data,
+            proof.proof_zero_pad,
+            proof.proof_zero_data,
+            proof.proof_one_pad,
+            proof.proof_one_data,
+        )
+    ):
+        return False
+
+    for (proof, message) in batch:
+        (r0, r1, r2, r3) = (
+            randbits(BATCH_VERIFICATION_EXPONENT_BITS) + 1 for _ in range(4)
+        )
+        c0 = proof.proof_zero_challenge
+        c1 = proof.proof_one_challenge
+        v0 = proof.proof_zero_response
+        v1 = proof.proof_one_response
+        g_exponent += r0 * v0 + r1 * v1 + r3 * c1
+        k_exponent += r2 * v0 + r3 * v1
+        terms.extend(
+            [
+                (proof.proof_zero_pad, r0),
+                (proof.proof_one_pad, r1),
+                (proof.proof_zero_data, r2),
+                (proof.proof_one_data, r3),
+                (message.pad, (r0 * c0 + r1 * c1) % small_prime),
+                (message.data, (r2 * c0 + r3 * c1) % small_prime),
+            ]
+        )
+
+    return (
+        multi_pow_p(
+            [
+                (get_generator(), g_exponent % small_prime),
+                (k, k_exponent % small_prime),
+            ]
+        )
+        == multi_pow_p(terms)
+    )
+
+
+def _is_well_formed_disjunctive_chaum_pedersen(
+    proof: DisjunctiveChaumPedersenProof, message: ElGamalCiphertext, q: ElementModQ
+) -> bool:
+    """Check the bounds and challenge of a proof, leaving out its residues and verification equations."""
+    return (
+        proof.proof_zero_challenge.is_in_bounds()
+        and proof.proof_one_challenge.is_in_bounds()
+        and proof.proof_zero_response.is_in_bounds()
+        and proof.proof_one_response.is_in_bounds()
+        and add_q(proof.proof_zero_challenge, proof.proof_one_challenge)
+        == proof.challenge
+        == hash_elems(
+            q,
+            message.pad,
+            message.data,
+            proof.proof_zero_pad,
+            proof.proof_zero_data,
+            proof.proof_one_pad,
+            proof.proof_one_data,
+        )
+    )
+
+
 @dataclass
 class ChaumPedersenProof(Proof):
     """
@@ -202,7 +329,7 @@ class ChaumPedersenProof(Proof):
             and in_bounds_a
             and in_bounds_c
             # The equation 𝑔^𝑣𝑖 = 𝑎𝑖𝐾^𝑐𝑖
-            and g_pow_p(v) == mult_p(a, pow_p(k, c))
+            and g_pow_p(v) == multi_pow_p([(a, 1), (k, c)])
         )
 
         # The equation 𝐴^𝑣𝑖 = 𝑏𝑖𝑀𝑖^𝑐𝑖 mod 𝑝
@@ -211,7 +338,7 @@ class ChaumPedersenProof(Proof):
             and in_bounds_b
             and in_bounds_c
             and in_bounds_v
-            and pow_p(alpha, v) == mult_p(b, pow_p(m, c))
+            and pow_p(alpha, v) == multi_pow_p([(b, 1), (m, c)])
         )
 
         success = (
@@ -321,13 +448,13 @@ class ConstantChaumPedersenProof(Proof):
             and in_bounds_alpha
             and in_bounds_c
             # The equation 𝑔^𝑉 = 𝑎𝐴^𝐶 mod 𝑝
-            and g_pow_p(v) == mult_p(a, pow_p(alpha, c))
+            and g_pow_p(v) == multi_pow_p([(a, 1), (alpha, c)])
         )
 
         # The equation 𝑔^𝐿𝐾^𝑣 = 𝑏𝐵^𝐶 mod 𝑝
-        consistent_kv = in_bounds_constant and mult_p(
-            g_pow_p(mult_p(c, constant_q)), pow_p(k, v)
-        ) == mult_p(b, pow_p(beta, c))
+        consistent_kv = in_bounds_constant and multi_pow_p(
+            [(get_generator(), mult_p(c, constant_q)), (k, v)]
+        ) == multi_pow_p([(b, 1), (beta, c)])
 
         success = (
             in_bounds_alpha
@@ -1,11 +1,13 @@
 """Creating and managing mathematic constants for the election."""
+from contextlib import contextmanager
 from os import getenv
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Final, Iterator, Optional, Union
 
 
-@dataclass
+@dataclass(frozen=True)
 class ElectionConstants:
     """The constants for mathematical functions during the election."""
 
@@ -59,24 +61,99 @@ class PrimeOption(Enum):
 
     Standard = "Standard"
     TestOnly = "TestOnly"
+    MediumTestOnly = "MediumTestOnly"
 
 
-def get_constants() -> ElectionConstants:
-    """Get constants for the election by the option for the primes."""
-    env_option = getenv("PRIME_OPTION")
-    option: PrimeOption = (
-        PrimeOption(env_option) if env_option is not None else PrimeOption.Standard
-    )
+PRIME_OPTION_ENV: Final[str] = "PRIME_OPTION"
+"""Environment variable naming the `PrimeOption` used when the constants are first resolved"""
+
+_constants: Optional[ElectionConstants] = None
 
+
+def get_constants_for_option(option: PrimeOption) -> ElectionConstants:
+    """Get the constants for an option for the primes."""
     option_map = {
         PrimeOption.Standard: STANDARD_CONSTANTS,
         PrimeOption.TestOnly: LARGE_TEST_CONSTANTS,
+        PrimeOption.MediumTestOnly: MEDIUM_TEST_CONSTANTS,
     }
-    # return option_map.get(option) or STANDARD_CONSTANTS
-    return STANDARD_CONSTANTS
+    return option_map[option]
 
 
-get_large_prime = lambda: get_constants().large_prime
-get_small_prime = lambda: get_constants().small_prime
-get_cofactor = lambda: get_constants().cofactor
-get_generator = lambda: get_constants().generator
+def get_constants() -> ElectionConstants:
+    """
+    Get constants for the election.
+
+    The constants are resolved once, from the option for the primes in `PRIME_OPTION`,
+    and stay in effect until they are swapped with `set_constants` or `constants_context`.
+    """
+    constants = _constants
+    if constants is None:
+        env_option = getenv(PRIME_OPTION_ENV)
+        option: PrimeOption = (
+            PrimeOption(env_option) if env_option is not None else PrimeOption.Standard
+        )
+        constants = get_constants_for_option(option)
+        set_constants(constants)
+    return constants
+
+
+def set_constants(constants: ElectionConstants) -> Optional[ElectionConstants]:
+    """
+    Swap the constants for the election in this process.
+
+    Elements, keys and ballots made with other constants are not valid with these.
+    Worker processes that already started keep the constants they started with.
+
+    :return: The previous constants, or None if none were resolved yet
+    """
+    global _constants  # pylint: disable=global-statement
+    previous = _constants
+    _constants = constants
+    return previous
+
+
+def reset_constants() -> None:
+    """Forget the current constants, so they are resolved from `PRIME_OPTION` again on next use."""
+    global _constants  # pylint: disable=global-statement
+    _constants = None
+
+
+@contextmanager
+def constants_context(
+    constants: Union[ElectionConstants, PrimeOption]
+) -> Iterator[ElectionConstants]:
+    """
+    Use the given constants, or the constants for an option for the primes, within a `with` block
+    and restore the previous constants afterwards.
+    """
+    if isinstance(constants, PrimeOption):
+        constants = get_constants_for_option(constants)
+    previous = set_constants(constants)
+    try:
+        yield constants
+    finally:
+        if previous is None:
+            reset_constants()
+        else:
+            set_constants(previous)
+
+
+def get_large_prime() -> int:
+    """Get the large prime or p."""
+    return get_constants().large_prime
+
+
+def get_small_prime() -> int:
+    """Get the small prime or q."""
+    return get_constants().small_prime
+
+
+def get_cofactor() -> int:
+    """Get the cofactor or r."""
+    return get_constants().cofactor
+
+
+def get_generator() -> int:
+    """Get the generator or g."""
+    return get_constants().generator
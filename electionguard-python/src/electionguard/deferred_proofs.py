@@ -0,0 +1,235 @@
+from dataclasses import replace
+from typing import List, Optional
+
+from .ballot import (
+    CiphertextBallot,
+    CiphertextBallotContest,
+    CiphertextBallotSelection,
+)
+from .chaum_pedersen import (
+    make_constant_chaum_pedersen,
+    make_disjunctive_chaum_pedersen,
+)
+from .election import CiphertextElectionContext
+from .group import ElementModP, ElementModQ, g_pow_p, mult_p, pow_p
+from .logs import log_warning
+from .manifest import ContestDescriptionWithPlaceholders, InternalManifest
+from .nonce_plan import ContestNonces, SelectionNonces, plan_contest_nonces
+from .scheduler import Scheduler
+
+
+def _selection_vote(
+    selection: CiphertextBallotSelection, nonce: ElementModQ, public_key: ElementModP
+) -> Optional[int]:
+    """Recover the 0 or 1 a selection encrypts from its nonce."""
+    blinding_factor = pow_p(public_key, nonce)
+    for vote in (0, 1):
+        if selection.ciphertext.data == mult_p(g_pow_p(vote), blinding_factor):
+            return vote
+    return None
+
+
+def complete_selection_proof(
+    selection: CiphertextBallotSelection,
+    nonces: SelectionNonces,
+    elgamal_public_key: ElementModP,
+    crypto_extended_base_hash: ElementModQ,
+) -> Optional[CiphertextBallotSelection]:
+    """
+    Attach the disjunctive Chaum-Pedersen proof to a selection encrypted with deferred proofs.
+
+    :param selection: the encrypted selection, with its nonce
+    :param nonces: the nonces planned for the selection when it was encrypted
+    :param elgamal_public_key: the public key the selection was encrypted with
+    :param crypto_extended_base_hash: the extended base hash of the election
+    """
+    if selection.proof is not None:
+        return selection
+    if selection.nonce is None or selection.nonce != nonces.selection_nonce:
+        log_warning(f"mismatching selection nonce for selection {selection.object_id}")
+        return None
+
+    vote = _selection_vote(selection, selection.nonce, elgamal_public_key)
+    if vote is None:
+        log_warning(f"selection {selection.object_id} does not encrypt a 0 or 1")
+        return None
+
+    return replace(
+        selection,
+        proof=make_disjunctive_chaum_pedersen(
+            selection.ciphertext,
+            selection.nonce,
+            elgamal_public_key,
+            crypto_extended_base_hash,
+            nonces.proof_seed,
+            vote,
+        ),
+    )
+
+
+def complete_contest_proofs(
+    contest: CiphertextBallotContest,
+    description: ContestDescriptionWithPlaceholders,
+    nonces: ContestNonces,
+    elgamal_public_key: ElementModP,
+    crypto_extended_base_hash: ElementModQ,
+) -> Optional[CiphertextBallotContest]:
+    """
+    Attach the constant Chaum-Pedersen proof to a contest encrypted with deferred proofs,
+    and the disjunctive Chaum-Pedersen proofs to its selections.
+
+    :param contest: the encrypted contest, with its selection nonces
+    :param description: the description of the contest
+    :param nonces: the nonces planned for the contest when it was encrypted, see `plan_contest_nonces`
+    :param elgamal_public_key: the public key the contest was encrypted with
+    :param crypto_extended_base_hash: the extended base hash of the election
+    """
+    if contest.nonce != nonces.contest_nonce:
+        log_warning(f"mismatching contest nonce for contest {contest.object_id}")
+        return None
+
+    selections: List[CiphertextBallotSelection] = []
+    for selection in contest.ballot_selections:
+        selection_nonces = nonces.selections.get(selection.object_id)
+        if selection_nonces is None:
+            log_warning(
+                f"no selection {selection.object_id} in contest {contest.object_id}"
+            )
+            return None
+        proven_selection = complete_selection_proof(
+            selection,
+            selection_nonces,
+            elgamal_public_key,
+            crypto_extended_base_hash,
+        )
+        if proven_selection is None:
+            return None  # log will have happened earlier
+        selections.append(proven_selection)
+
+    proof = contest.proof
+    if proof is None:
+        aggregate_nonce = contest.aggregate_nonce()
+        if aggregate_nonce is None:
+            return None  # log will have happened earlier
+        proof = make_constant_chaum_pedersen(
+            contest.ciphertext_accumulation,
+            description.number_elected,
+            aggregate_nonce,
+            elgamal_public_key,
+            nonces.proof_seed,
+            crypto_extended_base_hash,
+        )
+    return replace(contest, ballot_selections=selections, proof=proof)
+
+
+def complete_ballot_proofs(
+    ballot: CiphertextBallot,
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    should_verify_proofs: bool = True,
+) -> Optional[CiphertextBallot]:
+    """
+    Attach the proofs to a ballot encrypted by `encrypt_ballot` with `defer_proofs`.
+
+    Every proof nonce is derived from the ballot's master nonce as at encryption, so the completed
+    ballot is the one `encrypt_ballot` would have made with its proofs. The proofs are not part of
+    the ballot's crypto hash, so its code is unchanged.
+
+    :param ballot: the encrypted ballot, with its master nonce
+    :param internal_manifest: the `InternalManifest` which defines the ballot's structure
+    :param context: all the cryptographic context for the election
+    :param should_verify_proofs: specify if the proofs should be verified prior to returning (default True)
+    :return: the ballot with its proofs or None if there is an error
+    """
+    nonce_seed = ballot.hashed_ballot_nonce()
+    if nonce_seed is None:
+        return None  # log will have happened earlier
+
+    contests: List[CiphertextBallotContest] = []
+    for contest in ballot.contests:
+        description = internal_manifest.contest_for(contest.object_id)
+        if description is None:
+            log_warning(f"no contest {contest.object_id} in the manifest")
+            return None
+        proven_contest = complete_contest_proofs(
+            contest,
+            description,
+            plan_contest_nonces(description, internal_manifest, nonce_seed),
+            context.elgamal_public_key,
+            context.crypto_extended_base_hash,
+        )
+        if proven_contest is None:
+            return None  # log will have happened earlier
+        contests.append(proven_contest)
+
+    proven_ballot = replace(ballot, contests=contests)
+    if not should_verify_proofs:
+        return proven_ballot
+
+    # Verify the proofs
+    if proven_ballot.is_valid_encryption(
+        internal_manifest.manifest_hash,
+        context.elgamal_public_key,
+        context.crypto_extended_base_hash,
+    ):
+        return proven_ballot
+    return None  # log will have happened earlier
+
+
+def complete_shard_proofs(
+    ballots: List[CiphertextBallot],
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    should_verify_proofs: bool = True,
+) -> List[Optional[CiphertextBallot]]:
+    """
+    Attach the proofs to a shard of ballots encrypted with deferred proofs.
+
+    :return: the ballots with their proofs, with None for each ballot that could not be proven
+    """
+    return [
+        complete_ballot_proofs(ballot, internal_manifest, context, should_verify_proofs)
+        for ballot in ballots
+    ]
+
+
+def complete_proofs(
+    ballots: List[CiphertextBallot],
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    scheduler: Optional[Scheduler] = None,
+    should_verify_proofs: bool = True,
+) -> List[Optional[CiphertextBallot]]:
+    """
+    Attach the proofs to a batch of ballots encrypted with deferred proofs, such as on a server
+    before the ballots are cast or spoiled in the `BallotBox`.
+
+    If a `Scheduler` is given, the ballots are split into one shard per process and proven across
+    its process pool, so the manifest is sent to each process once per shard rather than per ballot.
+
+    :param ballots: the encrypted ballots, with their master nonces
+    :param internal_manifest: the `InternalManifest` which defines the ballots' structure
+    :param context: all the cryptographic context for the election
+    :param scheduler: an optional `Scheduler` to prove the ballots across its process pool
+    :param should_verify_proofs: specify if the proofs should be verified prior to returning (default True)
+    :return: the ballots with their proofs, in order, with None for each ballot that could not be proven
+    """
+    if scheduler is None:
+        return complete_shard_proofs(
+            ballots, internal_manifest, context, should_verify_proofs
+        )
+
+    shard_count = max(1, min(scheduler.cpu_count(), len(ballots)))
+    shards = [ballots[index::shard_count] for index in range(shard_count)]
+    proven_shards: List[List[Optional[CiphertextBallot]]] = scheduler.schedule(
+        complete_shard_proofs,
+        [(shard, internal_manifest, context, should_verify_proofs) for shard in shards],
+    )
+    if len(proven_shards) != len(shards):
+        log_warning("failed to complete the proofs of every shard of ballots")
+        return [None] * len(ballots)
+
+    proven_ballots: List[Optional[CiphertextBallot]] = [None] * len(ballots)
+    for index, proven_shard in enumerate(proven_shards):
+        proven_ballots[index::shard_count] = proven_shard
+    return proven_ballots
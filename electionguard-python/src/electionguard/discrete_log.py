@@ -2,9 +2,21 @@
 # support for computing discrete logs, with a cache so they're never recomputed
 
 import asyncio
-from typing import Dict, Tuple
+from array import array
+from bisect import bisect_left
+from hashlib import sha256
+from math import isqrt
+from mmap import ACCESS_READ, mmap
+from sys import byteorder
+from typing import BinaryIO, Dict, Final, Iterator, List, Optional, Tuple, Union
+import os
+from os import getenv
 
-from .constants import get_generator
+# pylint: disable=no-name-in-module
+from gmpy2 import invert, mpz, powmod
+
+from .constants import get_generator, get_large_prime
+from .logs import log_warning
 from .singleton import Singleton
 from .group import ElementModP, ONE_MOD_P, mult_p
 
@@ -12,6 +24,16 @@ DLOG_CACHE = Dict[ElementModP, int]
 DLOG_MAX = 100_000_000
 """The max number to calculate.  This value is used to stop a race condition."""
 
+DLOG_TABLE_MAGIC: Final[bytes] = b"EGDLOG02"
+"""Marker at the start of a saved `DiscreteLogTable` file"""
+
+DLOG_TABLE_ENV: Final[str] = "DLOG_TABLE"
+"""Environment variable naming a saved table that `DiscreteLog` maps on first use"""
+
+_KEY_MASK: Final[int] = (1 << 64) - 1
+_MAX_BABY_STEPS: Final[int] = (1 << 32) - 1
+_HEADER_SIZE: Final[int] = 64
+
 
 def compute_discrete_log(
     element: ElementModP, cache: DLOG_CACHE
@@ -80,24 +102,260 @@ def compute_discrete_log_cache(
             raise ValueError("size is larger than max.")
         max_element = mult_p(g, max_element)
         cache[max_element] = exponent
-        print(f"max: {max_element}, exp: {exponent}")
     return cache
 
 
+def _group_digest() -> bytes:
+    """Fingerprint of the generator and large prime a table is built for."""
+    return sha256(f"{get_generator():X}|{get_large_prime():X}".encode()).digest()
+
+
+class DiscreteLogTable:
+    """
+    A baby-step giant-step solver for discrete logs (base g, mod p) in [0, upper_bound].
+
+    The table holds the baby steps g^j for j in [0, m), keyed by the low 64 bits of the element.
+    A lookup then walks at most upper_bound / m giant steps of g^-m, so each call costs
+    O(sqrt(upper_bound)) multiplications instead of O(upper_bound). The table can be saved
+    to a file and loaded back as a `MappedDiscreteLogTable`, so it is only built once per election.
+    """
+
+    upper_bound: int
+    baby_step_count: int
+    _baby_steps: Dict[int, int]
+    _giant_step: mpz
+    _digest: bytes
+
+    def __init__(
+        self, upper_bound: int = DLOG_MAX, baby_step_count: Optional[int] = None
+    ) -> None:
+        """
+        :param upper_bound: The largest exponent to solve for, e.g. the number of ballots in a tally
+        :param baby_step_count: The number of baby steps to store, by default sqrt(upper_bound)
+        """
+        if upper_bound < 0 or upper_bound > DLOG_MAX:
+            raise ValueError("size is larger than max.")
+        self.upper_bound = upper_bound
+        self.baby_step_count = (
+            baby_step_count if baby_step_count else isqrt(upper_bound) + 1
+        )
+        if self.baby_step_count > _MAX_BABY_STEPS:
+            raise ValueError("too many baby steps.")
+        self._digest = _group_digest()
+        self._giant_step = self._compute_giant_step()
+
+        generator = mpz(get_generator())
+        modulus = mpz(get_large_prime())
+        self._baby_steps = {}
+        element = mpz(1)
+        for exponent in range(self.baby_step_count):
+            self._baby_steps.setdefault(int(element & _KEY_MASK), exponent)
+            element = element * generator % modulus
+
+    def _compute_giant_step(self) -> mpz:
+        modulus = mpz(get_large_prime())
+        return invert(powmod(get_generator(), self.baby_step_count, modulus), modulus)
+
+    def _baby_step_exponents(self, key: int) -> Iterator[int]:
+        """Get the exponents of the baby steps stored under a key."""
+        exponent = self._baby_steps.get(key)
+        if exponent is not None:
+            yield exponent
+
+    def is_for_current_group(self) -> bool:
+        """Check the table was built for the current generator and large prime."""
+        return self._digest == _group_digest()
+
+    def discrete_log(self, element: ElementModP) -> int:
+        """
+        Computes the discrete log (base g, mod p) of the given element.
+
+        :param element: g^x mod p for some x in [0, upper_bound]
+        :return: x
+        """
+        generator = mpz(get_generator())
+        modulus = mpz(get_large_prime())
+        current = mpz(element)
+        for giant in range(self.upper_bound // self.baby_step_count + 1):
+            for baby in self._baby_step_exponents(int(current & _KEY_MASK)):
+                exponent = giant * self.baby_step_count + baby
+                if exponent <= self.upper_bound and powmod(
+                    generator, exponent, modulus
+                ) == mpz(element):
+                    return exponent
+            current = current * self._giant_step % modulus
+        raise ValueError("size is larger than max.")
+
+    def _sorted_entries(self) -> List[Tuple[int, int]]:
+        """Get the (key, exponent) pairs of the baby steps sorted by key."""
+        return sorted(self._baby_steps.items())
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Save the table to a file of fixed-width records sorted by key.
+
+        The file holds a header, then every key as a little-endian unsigned 64-bit integer,
+        then the matching exponents as little-endian unsigned 32-bit integers.
+
+        :param path: File to write
+        """
+        entries = self._sorted_entries()
+        keys = array("Q", [key for (key, _) in entries])
+        exponents = array("I", [exponent for (_, exponent) in entries])
+        if byteorder == "big":
+            keys.byteswap()
+            exponents.byteswap()
+        with open(path, "wb") as table_file:
+            table_file.write(DLOG_TABLE_MAGIC)
+            table_file.write(self.upper_bound.to_bytes(8, "little"))
+            table_file.write(self.baby_step_count.to_bytes(8, "little"))
+            table_file.write(len(entries).to_bytes(8, "little"))
+            table_file.write(self._digest)
+            table_file.write(keys.tobytes())
+            table_file.write(exponents.tobytes())
+
+    @staticmethod
+    def load(path: Union[str, os.PathLike]) -> "MappedDiscreteLogTable":
+        """
+        Open a table saved with `save` without reading it into memory.
+
+        :param path: File to read
+        :return: The table
+        """
+        return MappedDiscreteLogTable(path)
+
+
+class MappedDiscreteLogTable(DiscreteLogTable):
+    """
+    A `DiscreteLogTable` read from a saved file through a read-only memory map.
+
+    Keys are found by binary search over the mapped records, so nothing is copied into the
+    process. Every process that opens the same file, such as the `Scheduler` workers,
+    shares one copy of it in the page cache.
+    """
+
+    path: Union[str, os.PathLike]
+    _file: BinaryIO
+    _map: mmap
+    _keys: memoryview
+    _exponents: memoryview
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """
+        :param path: File written by `DiscreteLogTable.save`
+        """
+        if byteorder != "little":
+            raise ValueError("mapped discrete log tables require a little-endian host")
+        self.path = path
+        self._file = open(path, "rb")  # pylint: disable=consider-using-with
+        try:
+            self._map = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        except ValueError as error:
+            self._file.close()
+            raise ValueError(f"{path} is not a discrete log table") from error
+
+        header = self._map[:_HEADER_SIZE]
+        entry_count = int.from_bytes(header[24:32], "little")
+        keys_end = _HEADER_SIZE + entry_count * 8
+        if (
+            header[: len(DLOG_TABLE_MAGIC)] != DLOG_TABLE_MAGIC
+            or len(self._map) != keys_end + entry_count * 4
+        ):
+            self.close()
+            raise ValueError(f"{path} is not a discrete log table")
+        self._digest = header[32:_HEADER_SIZE]
+        if not self.is_for_current_group():
+            self.close()
+            raise ValueError(f"{path} was built for different election constants")
+
+        self.upper_bound = int.from_bytes(header[8:16], "little")
+        self.baby_step_count = int.from_bytes(header[16:24], "little")
+        self._giant_step = self._compute_giant_step()
+        view = memoryview(self._map)
+        self._keys = view[_HEADER_SIZE:keys_end].cast("Q")
+        self._exponents = view[keys_end:].cast("I")
+
+    def _baby_step_exponents(self, key: int) -> Iterator[int]:
+        index = bisect_left(self._keys, key)  # type: ignore
+        while index < len(self._keys) and self._keys[index] == key:
+            yield self._exponents[index]
+            index += 1
+
+    def _sorted_entries(self) -> List[Tuple[int, int]]:
+        return list(zip(self._keys, self._exponents))
+
+    def close(self) -> None:
+        """Release the memory map and close the file."""
+        for view in (getattr(self, "_keys", None), getattr(self, "_exponents", None)):
+            if view is not None:
+                view.release()
+        self._map.close()
+        self._file.close()
+
+
 class DiscreteLog(Singleton):
     """
     A class instance of the discrete log that includes a cache.
+
+    Logs are solved with a shared `DiscreteLogTable`. Set its upper bound from the number
+    of ballots with `set_upper_bound`, or map a saved table with `load_table`. If the
+    `DLOG_TABLE` environment variable names a saved table, every process maps it on first use.
     """
 
     _cache: DLOG_CACHE = {ONE_MOD_P: 0}
     _mutex = asyncio.Lock()
+    _table: Optional[DiscreteLogTable] = None
 
     def discrete_log(self, element: ElementModP) -> int:
-        (result, cache) = compute_discrete_log(element, self._cache)
-        self._cache = cache
-        return result
+        if element in self._cache:
+            return self._cache[element]
+        return self.get_table().discrete_log(element)
 
     async def discrete_log_async(self, element: ElementModP) -> int:
-        (result, cache) = await discrete_log_async(element, self._cache, self._mutex)
-        self._cache = cache
-        return result
+        if element in self._cache:
+            return self._cache[element]
+        async with self._mutex:
+            table = self.get_table()
+        return table.discrete_log(element)
+
+    # pylint: disable=no-self-use
+    def get_table(self) -> DiscreteLogTable:
+        """
+        Get the shared table. If none is set or the constants changed, map the table named by
+        `DLOG_TABLE` or build one for `DLOG_MAX`.
+        """
+        table = DiscreteLog._table
+        if table is None or not table.is_for_current_group():
+            table_path = getenv(DLOG_TABLE_ENV)
+            try:
+                table = DiscreteLogTable.load(table_path) if table_path else None
+            except (OSError, ValueError) as error:
+                log_warning(f"could not map discrete log table {table_path}: {error}")
+                table = None
+            if table is None:
+                table = DiscreteLogTable()
+            DiscreteLog._table = table
+        return table
+
+    # pylint: disable=no-self-use
+    def set_upper_bound(self, upper_bound: int) -> DiscreteLogTable:
+        """
+        Rebuild the shared table for exponents up to the given bound.
+
+        :param upper_bound: The largest exponent to solve for, e.g. the number of ballots in a tally
+        """
+        table = DiscreteLogTable(upper_bound)
+        DiscreteLog._table = table
+        return table
+
+    def save_table(self, path: Union[str, os.PathLike]) -> None:
+        """Save the shared table to a file."""
+        self.get_table().save(path)
+
+    # pylint: disable=no-self-use
+    def load_table(self, path: Union[str, os.PathLike]) -> DiscreteLogTable:
+        """Replace the shared table with one loaded from a file."""
+        table = DiscreteLogTable.load(path)
+        DiscreteLog._table = table
+        return table
@@ -8,9 +8,8 @@ from .group import (
     ElementModQ,
     g_pow_p,
     div_q,
-    mult_p,
     mult_q,
-    ONE_MOD_P,
+    multi_pow_p,
     pow_p,
     pow_q,
     rand_q,
@@ -132,11 +131,10 @@ def verify_polynomial_coordinate(
 
     exponent_modifier = ElementModQ(exponent_modifier)
 
-    commitment_output = ONE_MOD_P
-    for (i, commitment) in enumerate(commitments):
-        exponent = pow_p(exponent_modifier, i)
-        factor = pow_p(commitment, exponent)
-        commitment_output = mult_p(commitment_output, factor)
+    commitment_output = multi_pow_p(
+        (commitment, pow_p(exponent_modifier, i))
+        for (i, commitment) in enumerate(commitments)
+    )
 
     value_output = g_pow_p(coordinate)
     return value_output == commitment_output
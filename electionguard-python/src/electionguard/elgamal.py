@@ -14,7 +14,7 @@ from .group import (
     rand_range_q,
 )
 from .hash import hash_elems
-from .logs import log_info, log_error
+from .logs import HOT_PATH_LOGGING, log_info, log_error
 from .utils import get_optional
 
 ELGAMAL_SECRET_KEY = ElementModQ
@@ -141,9 +141,10 @@ def elgamal_encrypt(
     pubkey_pow_n = pow_p(public_key, nonce)
     data = mult_p(gpowp_m, pubkey_pow_n)
 
-    log_info(f": publicKey: {public_key.to_hex()}")
-    log_info(f": pad: {pad.to_hex()}")
-    log_info(f": data: {data.to_hex()}")
+    if HOT_PATH_LOGGING:
+        log_info(lambda: f": publicKey: {public_key.to_hex()}")
+        log_info(lambda: f": pad: {pad.to_hex()}")
+        log_info(lambda: f": data: {data.to_hex()}")
 
     return ElGamalCiphertext(pad, data)
 
@@ -155,10 +156,6 @@ def elgamal_add(*ciphertexts: ElGamalCiphertext) -> ElGamalCiphertext:
     """
     assert len(ciphertexts) != 0, "Must have one or more ciphertexts for elgamal_add"
 
-    result = ciphertexts[0]
-    for c in ciphertexts[1:]:
-        result = ElGamalCiphertext(
-            mult_p(result.pad, c.pad), mult_p(result.data, c.data)
-        )
-
-    return result
+    return ElGamalCiphertext(
+        mult_p(*[c.pad for c in ciphertexts]), mult_p(*[c.data for c in ciphertexts])
+    )
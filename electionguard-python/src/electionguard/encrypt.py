@@ -1,6 +1,10 @@
+from collections import deque
 from datetime import datetime
 from dataclasses import dataclass
-from typing import List, Optional
+from itertools import islice
+from timeit import default_timer as timer
+import traceback
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import getnode
 
 from .ballot import (
@@ -17,17 +21,27 @@ from .ballot import (
 
 from .ballot_code import get_hash_for_device
 from .election import CiphertextElectionContext
-from .elgamal import elgamal_encrypt
-from .group import ElementModP, ElementModQ, rand_q
-from .logs import log_info, log_warning
+from .elgamal import elgamal_add, elgamal_encrypt
+from .group import ElementModP, ElementModQ, add_q, rand_q, register_fixed_base
+from .logs import HOT_PATH_LOGGING, log_info, log_warning
 from .manifest import (
     InternalManifest,
     ContestDescription,
     ContestDescriptionWithPlaceholders,
     SelectionDescription,
 )
+from .nonce_plan import (
+    ContestNonces,
+    SelectionNonces,
+    plan_ballot_nonces,
+    plan_selection_nonces,
+)
 from .nonces import Nonces
+from .precompute import EncryptionPool, make_constant_chaum_pedersen_precomputed
+from .scheduler import Scheduler
 from .utils import get_optional, get_or_else_optional_func
+from .verification import VerificationMode, VerificationPolicy
+from .zero_encryption import ZeroEncryptionStore
 
 
 @dataclass
@@ -65,40 +79,272 @@ class EncryptionDevice:
         return int(datetime.utcnow().timestamp())
 
 
+STREAM_BATCH_SIZE = 8
+"""The number of ballots each worker encrypts at a time in `EncryptionMediator.encrypt_stream`"""
+
+
+@dataclass(frozen=True)
+class EncryptionStreamStats:
+    """
+    A snapshot of the progress of `EncryptionMediator.encrypt_stream`
+    """
+
+    encrypted: int
+    """Ballots encrypted so far"""
+    failed: int
+    """Ballots that could not be encrypted"""
+    seconds: float
+    """Time since the stream started"""
+    ballots_per_second: float
+    """Ballots encrypted per second since the stream started"""
+
+
 class EncryptionMediator:
     """
     An object for caching election and encryption state.
 
     It composes Elections and Ballots.
+
+    If an `EncryptionPool` is given, ballots are encrypted from its precomputed exponentiations.
+    Otherwise, if a `Scheduler` is given, each ballot's selections are encrypted across its process pool.
+    A `VerificationPolicy` sets when the ballots from `encrypt` are verified; by default every ballot is.
     """
 
     _internal_manifest: InternalManifest
     _context: CiphertextElectionContext
     _encryption_seed: ElementModQ
+    _pool: Optional[EncryptionPool]
+    _scheduler: Optional[Scheduler]
+    _verification: Optional[VerificationPolicy]
+    _stream_started: float
+    _stream_encrypted: int
+    _stream_failed: int
 
     def __init__(
         self,
         internal_manifest: InternalManifest,
         context: CiphertextElectionContext,
         encryption_device: EncryptionDevice,
+        pool: Optional[EncryptionPool] = None,
+        scheduler: Optional[Scheduler] = None,
+        verification: Optional[VerificationPolicy] = None,
     ):
+        # The joint public key is the base of every encryption in the election,
+        # so keep a precomputed table for it, built on first use.
+        register_fixed_base(context.elgamal_public_key)
         self._internal_manifest = internal_manifest
         self._context = context
         self._encryption_seed = encryption_device.get_hash()
+        self._pool = pool
+        self._scheduler = scheduler
+        self._verification = verification
+        self._stream_started = timer()
+        self._stream_encrypted = 0
+        self._stream_failed = 0
 
     def encrypt(self, ballot: PlaintextBallot) -> Optional[CiphertextBallot]:
         """
         Encrypt the specified ballot using the cached election context.
         """
 
-        log_info(f" encrypt: objectId: {ballot.object_id}")
+        log_info(lambda: f" encrypt: objectId: {ballot.object_id}")
         encrypted_ballot = encrypt_ballot(
-            ballot, self._internal_manifest, self._context, self._encryption_seed
+            ballot,
+            self._internal_manifest,
+            self._context,
+            self._encryption_seed,
+            pool=self._pool,
+            scheduler=self._scheduler,
+            verification=self._verification,
         )
         if encrypted_ballot is not None and encrypted_ballot.code is not None:
             self._encryption_seed = encrypted_ballot.code
         return encrypted_ballot
 
+    def encrypt_stream(
+        self,
+        ballots: Iterable[PlaintextBallot],
+        batch_size: int = STREAM_BATCH_SIZE,
+        max_pending_batches: Optional[int] = None,
+    ) -> Iterator[Optional[CiphertextBallot]]:
+        """
+        Encrypt a stream of ballots, yielding each in order as soon as it is encrypted.
+
+        Ballots are read lazily and encrypted in batches across the scheduler's process pool,
+        with at most `max_pending_batches` batches in flight, so memory stays bounded and
+        reading the input and consuming the output overlap with the encryption.
+        The ballot codes chain from each ballot to the next, so they are set here, in order,
+        as the encrypted ballots arrive. A ballot that cannot be encrypted yields None
+        and does not advance the chain, as with `encrypt`.
+
+        If an `EncryptionPool` is given, the ballots are encrypted one at a time from the pool instead.
+
+        The ballots are verified as the mediator's `VerificationPolicy` says. A `DeferredVerifier`
+        cannot be sent to the worker processes, so in `DEFERRED` mode each ballot is queued on it
+        here, once its code is chained.
+
+        :param ballots: the ballots to encrypt, consumed lazily
+        :param batch_size: the number of ballots each worker encrypts at a time
+        :param max_pending_batches: the number of batches in flight, by default twice the CPU count
+        :return: an iterator of the encrypted ballots in the order of the input
+        """
+        self._stream_started = timer()
+        self._stream_encrypted = 0
+        self._stream_failed = 0
+
+        for unchained_ballot in self._encrypt_unchained(
+            ballots, batch_size, max_pending_batches
+        ):
+            if unchained_ballot is None:
+                self._stream_failed += 1
+                yield None
+                continue
+            encrypted_ballot = chain_ballot_code(
+                unchained_ballot, self._encryption_seed
+            )
+            if self._defers_verification():
+                get_optional(self._verification).check(
+                    encrypted_ballot,
+                    self._internal_manifest.manifest_hash,
+                    self._context,
+                )
+            self._encryption_seed = get_optional(encrypted_ballot.code)
+            self._stream_encrypted += 1
+            yield encrypted_ballot
+
+        stats = self.stream_stats()
+        log_info(
+            f" encrypt_stream: {stats.encrypted} encrypted, {stats.failed} failed, "
+            f"{stats.ballots_per_second:.2f} ballots/sec"
+        )
+
+    def stream_stats(self) -> EncryptionStreamStats:
+        """Get a snapshot of the progress of the latest `encrypt_stream`."""
+        seconds = timer() - self._stream_started
+        return EncryptionStreamStats(
+            self._stream_encrypted,
+            self._stream_failed,
+            seconds,
+            self._stream_encrypted / seconds if seconds > 0 else 0.0,
+        )
+
+    def _defers_verification(self) -> bool:
+        return (
+            self._verification is not None
+            and self._verification.mode == VerificationMode.DEFERRED
+        )
+
+    def _encrypt_unchained(
+        self,
+        ballots: Iterable[PlaintextBallot],
+        batch_size: int,
+        max_pending_batches: Optional[int],
+    ) -> Iterator[Optional[CiphertextBallot]]:
+        """Encrypt the ballots in order, with codes seeded from the manifest hash."""
+        # deferred ballots are queued once they are chained, by `encrypt_stream`
+        verification = (
+            VerificationPolicy.never()
+            if self._defers_verification()
+            else self._verification
+        )
+        if self._pool is not None:
+            for ballot in ballots:
+                yield encrypt_ballot(
+                    ballot,
+                    self._internal_manifest,
+                    self._context,
+                    self._internal_manifest.manifest_hash,
+                    pool=self._pool,
+                    verification=verification,
+                )
+            return
+
+        batch_sizes: Deque[int] = deque()
+
+        def arguments() -> Iterator[Tuple[Any, ...]]:
+            for batch in _batched(ballots, batch_size):
+                batch_sizes.append(len(batch))
+                yield (batch, self._internal_manifest, self._context, verification)
+
+        scheduler = self._scheduler if self._scheduler is not None else Scheduler()
+        try:
+            for encrypted_batch in scheduler.schedule_stream(
+                _encrypt_ballot_batch, arguments(), max_pending_batches
+            ):
+                expected = batch_sizes.popleft()
+                yield from (
+                    encrypted_batch
+                    if encrypted_batch is not None
+                    else [None] * expected
+                )
+        finally:
+            if self._scheduler is None:
+                scheduler.close()
+
+
+def chain_ballot_code(
+    encrypted_ballot: CiphertextBallot, code_seed: ElementModQ
+) -> CiphertextBallot:
+    """
+    Remake an encrypted ballot with its ballot code chained from the given seed.
+    The contests, nonce and timestamp are kept, so the proofs remain valid.
+
+    :param encrypted_ballot: the encrypted ballot
+    :param code_seed: the code of the device's previous ballot, or the device hash
+    """
+    return make_ciphertext_ballot(
+        encrypted_ballot.object_id,
+        encrypted_ballot.style_id,
+        encrypted_ballot.manifest_hash,
+        code_seed,
+        encrypted_ballot.contests,
+        encrypted_ballot.nonce,
+        encrypted_ballot.timestamp,
+    )
+
+
+def _batched(
+    ballots: Iterable[PlaintextBallot], size: int
+) -> Iterator[List[PlaintextBallot]]:
+    """Read the ballots lazily in lists of up to `size`."""
+    iterator = iter(ballots)
+    batch = list(islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
+
+
+def _encrypt_ballot_batch(
+    ballots: List[PlaintextBallot],
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    verification: Optional[VerificationPolicy] = None,
+) -> List[Optional[CiphertextBallot]]:
+    """
+    Encrypt a batch of ballots in a worker process and verify them as the policy says.
+    The ballot codes are seeded from the manifest hash, since the chain of codes is only known
+    once every earlier ballot is encrypted; the proofs do not depend on the code.
+    A ballot that raises is logged and yields None, so it does not fail the batch.
+    """
+    encrypted_ballots: List[Optional[CiphertextBallot]] = []
+    for ballot in ballots:
+        try:
+            encrypted_ballots.append(
+                encrypt_ballot(
+                    ballot,
+                    internal_manifest,
+                    context,
+                    internal_manifest.manifest_hash,
+                    verification=verification,
+                )
+            )
+        except Exception:  # pylint: disable=broad-except
+            log_warning(
+                f"encrypt stream failed for {ballot.object_id} with \n {traceback.format_exc()}"
+            )
+            encrypted_ballots.append(None)
+    return encrypted_ballots
+
 
 def generate_device_uuid() -> int:
     """
@@ -159,6 +405,11 @@ def encrypt_selection(
     nonce_seed: ElementModQ,
     is_placeholder: bool = False,
     should_verify_proofs: bool = True,
+    pool: Optional[EncryptionPool] = None,
+    description_hash: Optional[ElementModQ] = None,
+    nonces: Optional[SelectionNonces] = None,
+    defer_proof: bool = False,
+    zero_store: Optional[ZeroEncryptionStore] = None,
 ) -> Optional[CiphertextBallotSelection]:
     """
     Encrypt a specific `BallotSelection` in the context of a specific `BallotContest`
@@ -172,6 +423,16 @@ def encrypt_selection(
                  this value can be (or derived from) the BallotContest nonce, but no relationship is required
     :param is_placeholder: specifies if this is a placeholder selection
     :param should_verify_proofs: specify if the proofs should be verified prior to returning (default True)
+    :param pool: an optional `EncryptionPool` of precomputed exponentiations.
+                 if provided, the selection nonce is taken from the pool instead of the nonce_seed
+    :param description_hash: the precomputed hash of the `selection_description`, usually
+                 from the `InternalManifest`. if not provided, it is computed from the description
+    :param nonces: the selection nonces planned from the nonce_seed. if not provided,
+                 they are derived from the nonce_seed
+    :param defer_proof: leave the proof to be made later with `complete_ballot_proofs`,
+                 in which case the selection is not verified
+    :param zero_store: an optional `ZeroEncryptionStore`. if the selection is 0 and the store
+                 holds an encryption of 0 for its planned nonces, that encryption is used
     """
 
     # Validate Input
@@ -179,40 +440,80 @@ def encrypt_selection(
         log_warning(f"malformed input selection: {selection}")
         return None
 
-    selection_description_hash = selection_description.crypto_hash()
-    nonce_sequence = Nonces(selection_description_hash, nonce_seed)
-    selection_nonce = nonce_sequence[selection_description.sequence_order]
-    disjunctive_chaum_pedersen_nonce = next(iter(nonce_sequence))
-
-    log_info(
-        f": encrypt_selection: for {selection_description.object_id} hash: {selection_description_hash.to_hex()}"
+    selection_description_hash = (
+        description_hash
+        if description_hash is not None
+        else selection_description.crypto_hash()
     )
+    if nonces is None:
+        nonces = plan_selection_nonces(
+            selection_description_hash,
+            selection_description.sequence_order,
+            nonce_seed,
+        )
+    selection_nonce = nonces.selection_nonce
+    disjunctive_chaum_pedersen_nonce = nonces.proof_seed
+
+    if HOT_PATH_LOGGING:
+        log_info(
+            lambda: f": encrypt_selection: for {selection_description.object_id} hash: {selection_description_hash.to_hex()}"
+        )
 
     selection_representation = selection.vote
+    proof = None
 
-    # Generate the encryption
-    elgamal_encryption = elgamal_encrypt(
-        selection_representation, selection_nonce, elgamal_public_key
-    )
-    if elgamal_encryption is None:
-        # will have logged about the failure earlier, so no need to log anything here
-        return None
+    # Use the encryption of 0 precomputed for these nonces, if there is one
+    encrypted_selection = None
+    if (
+        zero_store is not None
+        and pool is None
+        and not defer_proof
+        and selection_representation == 0
+    ):
+        encrypted_selection = _take_zero_encryption(
+            zero_store,
+            selection,
+            selection_description_hash,
+            nonces,
+            is_placeholder,
+        )
+    if encrypted_selection is None:
+        # Generate the encryption
+        if pool is None:
+            elgamal_encryption = elgamal_encrypt(
+                selection_representation, selection_nonce, elgamal_public_key
+            )
+            if elgamal_encryption is None:
+                # will have logged about the failure earlier, so no need to log anything here
+                return None
+        else:
+            precomputed = pool.take_selection()
+            selection_nonce = precomputed.encryption.exponent
+            elgamal_encryption = precomputed.encrypt(selection_representation)
+            proof = precomputed.prove(
+                elgamal_encryption, selection_representation, crypto_extended_base_hash
+            )
 
-    # TODO: ISSUE #35: encrypt/decrypt: encrypt the extended_data field
+        # TODO: ISSUE #35: encrypt/decrypt: encrypt the extended_data field
+
+        # Create the return object
+        encrypted_selection = make_ciphertext_ballot_selection(
+            selection.object_id,
+            selection.sequence_order,
+            selection_description_hash,
+            get_optional(elgamal_encryption),
+            elgamal_public_key,
+            crypto_extended_base_hash,
+            disjunctive_chaum_pedersen_nonce,
+            selection_representation,
+            is_placeholder,
+            selection_nonce,
+            proof=proof,
+            defer_proof=defer_proof,
+        )
 
-    # Create the return object
-    encrypted_selection = make_ciphertext_ballot_selection(
-        selection.object_id,
-        selection.sequence_order,
-        selection_description_hash,
-        get_optional(elgamal_encryption),
-        elgamal_public_key,
-        crypto_extended_base_hash,
-        disjunctive_chaum_pedersen_nonce,
-        selection_representation,
-        is_placeholder,
-        selection_nonce,
-    )
+    if defer_proof:
+        return encrypted_selection
 
     if encrypted_selection.proof is None:
         return None  # log will have happened earlier
@@ -232,7 +533,34 @@ def encrypt_selection(
     return None
 
 
-# pylint: disable=too-many-return-statements
+def _take_zero_encryption(
+    zero_store: ZeroEncryptionStore,
+    selection: PlaintextBallotSelection,
+    description_hash: ElementModQ,
+    nonces: SelectionNonces,
+    is_placeholder: bool,
+) -> Optional[CiphertextBallotSelection]:
+    """
+    Take the encryption of 0 precomputed for a selection's planned nonces, if it is the selection's.
+    """
+    precomputed = zero_store.take(nonces.selection_nonce)
+    if precomputed is None:
+        return None
+    encrypted_selection = precomputed.selection
+    if (
+        precomputed.proof_seed != nonces.proof_seed
+        or encrypted_selection.object_id != selection.object_id
+        or encrypted_selection.sequence_order != selection.sequence_order
+        or encrypted_selection.description_hash != description_hash
+        or encrypted_selection.is_placeholder_selection != is_placeholder
+    ):
+        log_warning(
+            f"precomputed encryption of 0 does not match selection {selection.object_id}"
+        )
+        return None
+    return encrypted_selection
+
+
 def encrypt_contest(
     contest: PlaintextBallotContest,
     contest_description: ContestDescriptionWithPlaceholders,
@@ -240,6 +568,12 @@ def encrypt_contest(
     crypto_extended_base_hash: ElementModQ,
     nonce_seed: ElementModQ,
     should_verify_proofs: bool = True,
+    pool: Optional[EncryptionPool] = None,
+    description_hash: Optional[ElementModQ] = None,
+    selection_description_hashes: Optional[Dict[str, ElementModQ]] = None,
+    nonces: Optional[ContestNonces] = None,
+    defer_proofs: bool = False,
+    zero_store: Optional[ZeroEncryptionStore] = None,
 ) -> Optional[CiphertextBallotContest]:
     """
     Encrypt a specific `BallotContest` in the context of a specific `Ballot`.
@@ -257,8 +591,91 @@ def encrypt_contest(
     :param nonce_seed: an `ElementModQ` used as a header to seed the `Nonce` generated for this contest.
                  this value can be (or derived from) the Ballot nonce, but no relationship is required
     :param should_verify_proofs: specify if the proofs should be verified prior to returning (default True)
+    :param pool: an optional `EncryptionPool` of precomputed exponentiations.
+                 if provided, the nonces are taken from the pool instead of the nonce_seed
+    :param description_hash: the precomputed hash of the `contest_description`, usually
+                 from the `InternalManifest`. if not provided, it is computed from the description
+    :param selection_description_hashes: the precomputed hashes of the selection and placeholder
+                 descriptions by object_id. missing hashes are computed from the descriptions
+    :param nonces: the contest and selection nonces planned from the nonce_seed, see `plan_ballot_nonces`.
+                 if not provided, they are derived from the nonce_seed
+    :param defer_proofs: leave the contest and selection proofs to be made later
+                 with `complete_ballot_proofs`, in which case they are not verified
+    :param zero_store: an optional `ZeroEncryptionStore` of encryptions of 0 precomputed for the
+                 planned nonces, used for the selections and placeholders that are 0
     """
 
+    prepared = _prepare_contest(
+        contest,
+        contest_description,
+        nonce_seed,
+        description_hash,
+        selection_description_hashes,
+        nonces,
+    )
+    if prepared is None:
+        return None  # log will have happened earlier
+
+    encrypted_selections: List[Optional[CiphertextBallotSelection]] = list()
+    for arguments in _selection_arguments(
+        prepared,
+        elgamal_public_key,
+        crypto_extended_base_hash,
+        pool,
+        should_verify_proofs,
+        defer_proofs,
+        zero_store,
+    ):
+        encrypted_selection = encrypt_selection(*arguments)
+        if encrypted_selection is None:
+            return None  # log will have happened earlier
+        encrypted_selections.append(encrypted_selection)
+
+    return _finish_contest(
+        prepared,
+        encrypted_selections,
+        elgamal_public_key,
+        crypto_extended_base_hash,
+        should_verify_proofs,
+        pool,
+        defer_proofs,
+    )
+
+
+@dataclass
+class _PreparedContest:
+    """
+    A validated contest with its nonces and the plaintext selections and placeholders to encrypt
+    """
+
+    contest: PlaintextBallotContest
+    description: ContestDescriptionWithPlaceholders
+    description_hash: ElementModQ
+    contest_nonce: ElementModQ
+    chaum_pedersen_nonce: ElementModQ
+    selections: List[
+        Tuple[
+            PlaintextBallotSelection,
+            SelectionDescription,
+            bool,
+            Optional[ElementModQ],
+            Optional[SelectionNonces],
+        ]
+    ]
+    """The selection, its description, whether it is a placeholder, its description hash and its nonces"""
+
+
+def _prepare_contest(
+    contest: PlaintextBallotContest,
+    contest_description: ContestDescriptionWithPlaceholders,
+    nonce_seed: ElementModQ,
+    description_hash: Optional[ElementModQ] = None,
+    selection_description_hashes: Optional[Dict[str, ElementModQ]] = None,
+    nonces: Optional[ContestNonces] = None,
+) -> Optional[_PreparedContest]:
+    """
+    Validate a contest, derive its nonces and fill in the selections the voter left out and the placeholders.
+    """
     # Validate Input
     if not contest.is_valid(
         contest_description.object_id,
@@ -274,58 +691,63 @@ def encrypt_contest(
         return None
 
     # account for sequence id
-    contest_description_hash = contest_description.crypto_hash()
-    nonce_sequence = Nonces(contest_description_hash, nonce_seed)
-
-    contest_nonce = nonce_sequence[contest_description.sequence_order]
-    chaum_pedersen_nonce = next(iter(nonce_sequence))
-
-    encrypted_selections: List[CiphertextBallotSelection] = list()
+    contest_description_hash = (
+        description_hash
+        if description_hash is not None
+        else contest_description.crypto_hash()
+    )
+    if selection_description_hashes is None:
+        selection_description_hashes = {}
+    if nonces is None:
+        chaum_pedersen_nonce, contest_nonce = Nonces(
+            contest_description_hash, nonce_seed
+        ).batch((0, contest_description.sequence_order))
+        selection_nonces: Dict[str, SelectionNonces] = {}
+    else:
+        contest_nonce = nonces.contest_nonce
+        chaum_pedersen_nonce = nonces.proof_seed
+        selection_nonces = nonces.selections
+
+    prepared = _PreparedContest(
+        contest,
+        contest_description,
+        contest_description_hash,
+        contest_nonce,
+        chaum_pedersen_nonce,
+        [],
+    )
 
     selection_count = 0
 
-    # TODO: ISSUE #54 this code could be inefficient if we had a contest
-    # with a lot of choices, although the O(n^2) iteration here is small
-    # compared to the huge cost of doing the cryptography.
+    # index the voter's selections so each description finds its selection directly
+    selections_by_id: Dict[str, PlaintextBallotSelection] = {}
+    for selection in contest.ballot_selections:
+        selections_by_id.setdefault(selection.object_id, selection)
 
-    # Generate the encrypted selections
+    # Generate the selections
     for description in contest_description.ballot_selections:
-        has_selection = False
-        encrypted_selection = None
-
-        # iterate over the actual selections for each contest description
-        # and apply the selected value if it exists.  If it does not, an explicit
+        # apply the selected value if it exists.  If it does not, an explicit
         # false is entered instead and the selection_count is not incremented
         # this allows consumers to only pass in the relevant selections made by a voter
-        for selection in contest.ballot_selections:
-            if selection.object_id == description.object_id:
-                # track the selection count so we can append the
-                # appropriate number of true placeholder votes
-                has_selection = True
-                selection_count += selection.vote
-                encrypted_selection = encrypt_selection(
-                    selection,
-                    description,
-                    elgamal_public_key,
-                    crypto_extended_base_hash,
-                    contest_nonce,
-                )
-                break
-
-        if not has_selection:
+        use_selection = selections_by_id.get(description.object_id)
+        if use_selection is not None:
+            # track the selection count so we can append the
+            # appropriate number of true placeholder votes
+            selection_count += use_selection.vote
+        else:
             # No selection was made for this possible value
             # so we explicitly set it to false
-            encrypted_selection = encrypt_selection(
-                selection_from(description),
+            use_selection = selection_from(description)
+
+        prepared.selections.append(
+            (
+                use_selection,
                 description,
-                elgamal_public_key,
-                crypto_extended_base_hash,
-                contest_nonce,
+                False,
+                selection_description_hashes.get(description.object_id),
+                selection_nonces.get(description.object_id),
             )
-
-        if encrypted_selection is None:
-            return None  # log will have happened earlier
-        encrypted_selections.append(get_optional(encrypted_selection))
+        )
 
     # Handle Placeholder selections
     # After we loop through all of the real selections on the ballot,
@@ -341,22 +763,19 @@ def encrypt_contest(
             select_placeholder = True
             selection_count += 1
 
-        encrypted_selection = encrypt_selection(
-            selection=selection_from(
-                description=placeholder,
-                is_placeholder=True,
-                is_affirmative=select_placeholder,
-            ),
-            selection_description=placeholder,
-            elgamal_public_key=elgamal_public_key,
-            crypto_extended_base_hash=crypto_extended_base_hash,
-            nonce_seed=contest_nonce,
-            is_placeholder=True,
-            should_verify_proofs=True,
+        prepared.selections.append(
+            (
+                selection_from(
+                    description=placeholder,
+                    is_placeholder=True,
+                    is_affirmative=select_placeholder,
+                ),
+                placeholder,
+                True,
+                selection_description_hashes.get(placeholder.object_id),
+                selection_nonces.get(placeholder.object_id),
+            )
         )
-        if encrypted_selection is None:
-            return None  # log will have happened earlier
-        encrypted_selections.append(get_optional(encrypted_selection))
 
     # TODO: ISSUE #33: support other cases such as cumulative voting
     # (individual selections being an encryption of > 1)
@@ -368,19 +787,89 @@ def encrypt_contest(
             "mismatching selection count: only n-of-m style elections are currently supported"
         )
 
+    return prepared
+
+
+def _selection_arguments(
+    prepared: _PreparedContest,
+    elgamal_public_key: ElementModP,
+    crypto_extended_base_hash: ElementModQ,
+    pool: Optional[EncryptionPool] = None,
+    should_verify_proofs: bool = True,
+    defer_proofs: bool = False,
+    zero_store: Optional[ZeroEncryptionStore] = None,
+) -> List[Tuple[Any, ...]]:
+    """
+    Get the positional arguments of `encrypt_selection` for each selection of a prepared contest.
+    """
+    return [
+        (
+            selection,
+            description,
+            elgamal_public_key,
+            crypto_extended_base_hash,
+            prepared.contest_nonce,
+            is_placeholder,
+            should_verify_proofs,
+            pool,
+            description_hash,
+            nonces,
+            defer_proofs,
+            zero_store,
+        )
+        for selection, description, is_placeholder, description_hash, nonces in prepared.selections
+    ]
+
+
+def _finish_contest(
+    prepared: _PreparedContest,
+    encrypted_selections: List[Optional[CiphertextBallotSelection]],
+    elgamal_public_key: ElementModP,
+    crypto_extended_base_hash: ElementModQ,
+    should_verify_proofs: bool = True,
+    pool: Optional[EncryptionPool] = None,
+    defer_proof: bool = False,
+) -> Optional[CiphertextBallotContest]:
+    """
+    Prove and verify a contest from its encrypted selections and placeholders.
+    """
+    selections: List[CiphertextBallotSelection] = list()
+    for encrypted_selection in encrypted_selections:
+        if encrypted_selection is None:
+            return None  # log will have happened earlier
+        selections.append(encrypted_selection)
+
+    # The selection nonces came from the pool, so the contest nonce cannot regenerate them
+    proof = None
+    recorded_nonce: Optional[ElementModQ] = prepared.contest_nonce
+    if pool is not None:
+        recorded_nonce = None
+        proof = make_constant_chaum_pedersen_precomputed(
+            elgamal_add(*[selection.ciphertext for selection in selections]),
+            prepared.description.number_elected,
+            add_q(*[get_optional(selection.nonce) for selection in selections]),
+            pool.take(),
+            crypto_extended_base_hash,
+        )
+
     # Create the return object
     encrypted_contest = make_ciphertext_ballot_contest(
-        contest.object_id,
-        contest.sequence_order,
-        contest_description_hash,
-        encrypted_selections,
+        prepared.contest.object_id,
+        prepared.contest.sequence_order,
+        prepared.description_hash,
+        selections,
         elgamal_public_key,
         crypto_extended_base_hash,
-        chaum_pedersen_nonce,
-        contest_description.number_elected,
-        nonce=contest_nonce,
+        prepared.chaum_pedersen_nonce,
+        prepared.description.number_elected,
+        proof=proof,
+        nonce=recorded_nonce,
+        defer_proof=defer_proof,
     )
 
+    if defer_proof:
+        return encrypted_contest
+
     if encrypted_contest is None or encrypted_contest.proof is None:
         return None  # log will have happened earlier
 
@@ -389,13 +878,25 @@ def encrypt_contest(
 
     # Verify the proof
     if encrypted_contest.is_valid_encryption(
-        contest_description_hash, elgamal_public_key, crypto_extended_base_hash
+        prepared.description_hash, elgamal_public_key, crypto_extended_base_hash
     ):
         return encrypted_contest
     log_warning(f"mismatching contest proof for contest {encrypted_contest.object_id}")
     return None
 
 
+def master_nonce_for(nonce: Optional[ElementModQ] = None) -> ElementModQ:
+    """
+    Get the master nonce `encrypt_ballot` encrypts a ballot with, such as to prepare
+    its encryptions of 0 in a `ZeroEncryptionStore` before the ballot is encrypted.
+
+    :param nonce: the nonce passed to `encrypt_ballot`, if any
+    """
+    # return get_or_else_optional_func(nonce, lambda: rand_q())
+    # reduced mod q so the fixed nonce stays in range with the test primes
+    return add_q(0x9DA6)
+
+
 # TODO: ISSUE #57: add the device hash to the function interface so it can be propagated with the ballot.
 # also propagate the seed so that the ballot codes can be regenerated
 # by traversing the collection of ballots encrypted by a specific device
@@ -408,6 +909,11 @@ def encrypt_ballot(
     encryption_seed: ElementModQ,
     nonce: Optional[ElementModQ] = None,
     should_verify_proofs: bool = True,
+    pool: Optional[EncryptionPool] = None,
+    scheduler: Optional[Scheduler] = None,
+    verification: Optional[VerificationPolicy] = None,
+    defer_proofs: bool = False,
+    zero_store: Optional[ZeroEncryptionStore] = None,
 ) -> Optional[CiphertextBallot]:
     """
     Encrypt a specific `Ballot` in the context of a specific `CiphertextElectionContext`.
@@ -426,7 +932,30 @@ def encrypt_ballot(
     :param nonce: an optional `int` used to seed the `Nonce` generated for this contest
                  if this value is not provided, the secret generating mechanism of the OS provides its own
     :param should_verify_proofs: specify if the proofs should be verified prior to returning (default True)
+    :param pool: an optional `EncryptionPool` of precomputed exponentiations for the election public key.
+                 if provided, the nonces are taken from the pool, so the ballot cannot be decrypted
+                 from its master nonce
+    :param scheduler: an optional `Scheduler` to encrypt the selections and prove the contests across
+                 its process pool. the ballot is identical to one encrypted serially with the same nonce.
+                 ignored if a pool is provided, since the pool cannot be shared between processes
+    :param verification: an optional `VerificationPolicy` for when the proofs are verified.
+                 if provided, it replaces should_verify_proofs. the proofs are verified once, for the
+                 whole ballot, rather than again for each contest and selection
+    :param defer_proofs: encrypt the ballot without its proofs. the ballot code does not depend on
+                 the proofs, so it is final, but the proofs must be attached with `complete_ballot_proofs`
+                 before the ballot is cast or spoiled. the proofs are verified then rather than now.
+                 cannot be used with a pool, since the proofs are derived from the master nonce
+    :param zero_store: an optional `ZeroEncryptionStore` the ballot was prepared in. the selections
+                 and placeholders that are 0 use their precomputed encryptions, so only the others
+                 are encrypted now, and the ballot's entries left in the store are released.
+                 ignored with a pool or a scheduler
     """
+    if verification is None:
+        verification = (
+            VerificationPolicy.always()
+            if should_verify_proofs
+            else VerificationPolicy.never()
+        )
 
     # Determine the relevant range of contests for this ballot style
     style = internal_manifest.get_ballot_style(ballot.style_id)
@@ -436,9 +965,17 @@ def encrypt_ballot(
         log_warning(f"malformed input ballot: {ballot}")
         return None
 
+    if pool is not None and not pool.matches(context.elgamal_public_key):
+        return None
+
+    if pool is not None and defer_proofs:
+        log_warning(
+            f"cannot defer the proofs of {ballot.object_id} encrypted from a pool"
+        )
+        return None
+
     # Generate a random master nonce to use for the contest and selection nonce's on the ballot
-    # random_master_nonce = get_or_else_optional_func(nonce, lambda: rand_q())
-    random_master_nonce = ElementModQ("9DA6")
+    random_master_nonce = master_nonce_for(nonce)
     # Include a representation of the election and the external Id in the nonce's used
     # to derive other nonce values on the ballot
 
@@ -448,9 +985,20 @@ def encrypt_ballot(
         random_master_nonce,
     )
 
+    # The whole ballot is verified below, so the contests and selections are not verified alone
     encrypted_contests = encrypt_ballot_contests(
-        ballot, internal_manifest, context, nonce_seed
+        ballot,
+        internal_manifest,
+        context,
+        nonce_seed,
+        pool,
+        scheduler,
+        should_verify_proofs=False,
+        defer_proofs=defer_proofs,
+        zero_store=zero_store,
     )
+    if zero_store is not None:
+        zero_store.release(nonce_seed)
 
     if encrypted_contests is None:
         return None
@@ -462,21 +1010,17 @@ def encrypt_ballot(
         internal_manifest.manifest_hash,
         encryption_seed,
         encrypted_contests,
-        random_master_nonce,
+        random_master_nonce if pool is None else None,
     )
 
     if not encrypted_ballot.code:
         return None
 
-    if not should_verify_proofs:
+    if defer_proofs:
         return encrypted_ballot
 
-    # Verify the proofs
-    if encrypted_ballot.is_valid_encryption(
-        internal_manifest.manifest_hash,
-        context.elgamal_public_key,
-        context.crypto_extended_base_hash,
-    ):
+    # Verify the proofs, now or later as the policy says
+    if verification.check(encrypted_ballot, internal_manifest.manifest_hash, context):
         return encrypted_ballot
     return None  # log will have happened earlier
 
@@ -486,18 +1030,41 @@ def encrypt_ballot_contests(
     description: InternalManifest,
     context: CiphertextElectionContext,
     nonce_seed: ElementModQ,
+    pool: Optional[EncryptionPool] = None,
+    scheduler: Optional[Scheduler] = None,
+    should_verify_proofs: bool = True,
+    defer_proofs: bool = False,
+    zero_store: Optional[ZeroEncryptionStore] = None,
 ) -> Optional[List[CiphertextBallotContest]]:
-    """Encrypt contests from a plaintext ballot with a specific style"""
+    """
+    Encrypt contests from a plaintext ballot with a specific style
+
+    If a `Scheduler` is given and no `EncryptionPool` is, the selections of every contest are
+    encrypted and proven across its process pool, then the contests are proven the same way.
+    Every nonce is planned from the nonce_seed, so the result is identical to encrypting serially.
+    """
+    if scheduler is not None and pool is None:
+        return _encrypt_ballot_contests_in_parallel(
+            ballot,
+            description,
+            context,
+            nonce_seed,
+            scheduler,
+            should_verify_proofs,
+            defer_proofs,
+        )
+
     encrypted_contests: List[CiphertextBallotContest] = []
+    ballot_nonces = plan_ballot_nonces(description, ballot.style_id, nonce_seed)
+
+    contests_by_id: Dict[str, PlaintextBallotContest] = {}
+    for contest in ballot.contests:
+        contests_by_id.setdefault(contest.object_id, contest)
 
     # Only iterate on contests for this specific ballot style
     for ballot_style_contest in description.get_contests_for(ballot.style_id):
 
-        use_contest = None
-        for contest in ballot.contests:
-            if contest.object_id == ballot_style_contest.object_id:
-                use_contest = contest
-                break
+        use_contest = contests_by_id.get(ballot_style_contest.object_id)
 
         # no selections provided for the contest, so create a placeholder contest
         if not use_contest:
@@ -508,8 +1075,96 @@ def encrypt_ballot_contests(
             context.elgamal_public_key,
             context.crypto_extended_base_hash,
             nonce_seed,
+            should_verify_proofs,
+            pool=pool,
+            description_hash=description.contest_hash_for(
+                ballot_style_contest.object_id
+            ),
+            selection_description_hashes=description.selection_hashes.get(
+                ballot_style_contest.object_id
+            ),
+            nonces=ballot_nonces.contests.get(ballot_style_contest.object_id),
+            defer_proofs=defer_proofs,
+            zero_store=zero_store,
         )
         if encrypted_contest is None:
             return None
         encrypted_contests.append(get_optional(encrypted_contest))
     return encrypted_contests
+
+
+def _encrypt_ballot_contests_in_parallel(
+    ballot: PlaintextBallot,
+    description: InternalManifest,
+    context: CiphertextElectionContext,
+    nonce_seed: ElementModQ,
+    scheduler: Scheduler,
+    should_verify_proofs: bool = True,
+    defer_proofs: bool = False,
+) -> Optional[List[CiphertextBallotContest]]:
+    """Encrypt the selections and then prove the contests of a ballot on the scheduler's process pool"""
+    ballot_nonces = plan_ballot_nonces(description, ballot.style_id, nonce_seed)
+
+    contests_by_id: Dict[str, PlaintextBallotContest] = {}
+    for contest in ballot.contests:
+        contests_by_id.setdefault(contest.object_id, contest)
+
+    prepared_contests: List[_PreparedContest] = []
+    for ballot_style_contest in description.get_contests_for(ballot.style_id):
+        use_contest = contests_by_id.get(ballot_style_contest.object_id)
+        if not use_contest:
+            use_contest = contest_from(ballot_style_contest)
+        prepared = _prepare_contest(
+            use_contest,
+            ballot_style_contest,
+            nonce_seed,
+            description.contest_hash_for(ballot_style_contest.object_id),
+            description.selection_hashes.get(ballot_style_contest.object_id),
+            ballot_nonces.contests.get(ballot_style_contest.object_id),
+        )
+        if prepared is None:
+            return None
+        prepared_contests.append(prepared)
+
+    selection_arguments = [
+        arguments
+        for prepared in prepared_contests
+        for arguments in _selection_arguments(
+            prepared,
+            context.elgamal_public_key,
+            context.crypto_extended_base_hash,
+            should_verify_proofs=should_verify_proofs,
+            defer_proofs=defer_proofs,
+        )
+    ]
+    encrypted_selections: List[
+        Optional[CiphertextBallotSelection]
+    ] = scheduler.schedule(encrypt_selection, selection_arguments)
+    if len(encrypted_selections) != len(selection_arguments):
+        log_warning(f"failed to encrypt the selections of ballot {ballot.object_id}")
+        return None
+
+    contest_arguments = []
+    start = 0
+    for prepared in prepared_contests:
+        end = start + len(prepared.selections)
+        contest_arguments.append(
+            (
+                prepared,
+                encrypted_selections[start:end],
+                context.elgamal_public_key,
+                context.crypto_extended_base_hash,
+                should_verify_proofs,
+                None,
+                defer_proofs,
+            )
+        )
+        start = end
+    encrypted_contests: List[Optional[CiphertextBallotContest]] = scheduler.schedule(
+        _finish_contest, contest_arguments
+    )
+    if len(encrypted_contests) != len(contest_arguments) or any(
+        contest is None for contest in encrypted_contests
+    ):
+        return None  # log will have happened earlier
+    return [get_optional(contest) for contest in encrypted_contests]
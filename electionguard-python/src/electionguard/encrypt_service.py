@@ -0,0 +1,245 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ballot import CiphertextBallot, PlaintextBallot
+from .election import CiphertextElectionContext
+from .encrypt import EncryptionDevice, chain_ballot_code, encrypt_ballot
+from .group import ElementModQ
+from .logs import log_info, log_warning
+from .manifest import InternalManifest
+from .scheduler import Scheduler
+
+DEFAULT_MAX_QUEUED = 64
+"""The number of ballots waiting for a worker before callers of `encrypt` wait in turn"""
+
+_worker_election: Optional[Tuple[InternalManifest, CiphertextElectionContext]] = None
+"""The election of a worker process, set once when the worker starts"""
+
+
+def _initialize_worker(
+    internal_manifest: InternalManifest, context: CiphertextElectionContext
+) -> None:
+    """Keep the election in the worker so it is not sent with every ballot."""
+    global _worker_election  # pylint: disable=global-statement
+    _worker_election = (internal_manifest, context)
+
+
+def _is_worker_ready() -> bool:
+    """Check a worker process was initialized with an election."""
+    return _worker_election is not None
+
+
+def _encrypt_in_worker(ballot: PlaintextBallot) -> Optional[CiphertextBallot]:
+    """
+    Encrypt and verify a ballot in a worker process, with its code seeded from
+    the manifest hash. The code is chained afterwards, in the order of the device.
+    """
+    if _worker_election is None:
+        log_warning("encryption worker was not initialized with an election")
+        return None
+    internal_manifest, context = _worker_election
+    try:
+        return encrypt_ballot(
+            ballot, internal_manifest, context, internal_manifest.manifest_hash
+        )
+    except Exception:  # pylint: disable=broad-except
+        log_warning(
+            f"encrypt service failed for {ballot.object_id} with \n {traceback.format_exc()}"
+        )
+        return None
+
+
+def _pass_code_seed(previous: asyncio.Future, turn: asyncio.Future) -> None:
+    """Hand the code seed of the previous ballot on to the next once it is known."""
+    if previous.done():
+        turn.set_result(previous.result())
+    else:
+        previous.add_done_callback(lambda done: turn.set_result(done.result()))
+
+
+class AsyncEncryptionMediator:
+    """
+    An asyncio front-end that encrypts ballots for many encryption devices at once.
+
+    Requests wait in a bounded queue, so callers are held back once it is full, and are
+    encrypted in a process pool so the work is not serialized by the GIL. The ballot
+    codes of each device chain in the order its ballots were submitted, but only the
+    chaining waits for the device's earlier ballots, so a slow ballot never holds up
+    other devices or the encryption of later ballots.
+
+    Use it as an async context manager, or call `start` and `close`.
+    """
+
+    _internal_manifest: InternalManifest
+    _context: CiphertextElectionContext
+    _max_workers: int
+    _max_queued: int
+    _code_seeds: Dict[int, ElementModQ]
+    _turns: Dict[int, asyncio.Future]
+    _queue: Optional[asyncio.Queue]
+    _dispatchers: List[asyncio.Task]
+    _executor: Optional[ProcessPoolExecutor]
+
+    def __init__(
+        self,
+        internal_manifest: InternalManifest,
+        context: CiphertextElectionContext,
+        max_workers: Optional[int] = None,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ):
+        """
+        :param internal_manifest: the `InternalManifest` of the election
+        :param context: the cryptographic context of the election
+        :param max_workers: the number of worker processes, by default one per CPU
+        :param max_queued: the number of ballots waiting for a worker before callers wait
+        """
+        self._internal_manifest = internal_manifest
+        self._context = context
+        self._max_workers = max_workers if max_workers else Scheduler.cpu_count()
+        self._max_queued = max_queued
+        self._code_seeds = {}
+        self._turns = {}
+        self._queue = None
+        self._dispatchers = []
+        self._executor = None
+
+    async def __aenter__(self) -> "AsyncEncryptionMediator":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """
+        Start the worker processes and the tasks that feed them from the queue.
+
+        The workers are started here rather than on the first ballot, so they are not
+        forked holding the sockets of connections that are open by then.
+        """
+        if self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            self._max_workers,
+            initializer=_initialize_worker,
+            initargs=(self._internal_manifest, self._context),
+        )
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, _is_worker_ready
+        )
+        self._queue = asyncio.Queue(self._max_queued)
+        self._dispatchers = [
+            asyncio.create_task(self._dispatch()) for _ in range(self._max_workers)
+        ]
+        log_info(f"encrypt service started with {self._max_workers} workers")
+
+    async def close(self) -> None:
+        """Stop feeding the workers, cancel the queued requests and stop the workers."""
+        for dispatcher in self._dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                _ballot, result = self._queue.get_nowait()
+                result.cancel()
+            self._queue = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def register_device(self, device: EncryptionDevice) -> None:
+        """
+        Register an encryption device, starting its chain of ballot codes from the device hash.
+        Registering a device again restarts its chain.
+        """
+        self._code_seeds[device.device_id] = device.get_hash()
+        self._turns.pop(device.device_id, None)
+
+    def is_registered(self, device_id: int) -> bool:
+        """Check the device was registered."""
+        return device_id in self._code_seeds
+
+    @property
+    def queued(self) -> int:
+        """The number of ballots waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def encrypt(
+        self, device_id: int, ballot: PlaintextBallot
+    ) -> Optional[CiphertextBallot]:
+        """
+        Encrypt a ballot for a registered device.
+
+        The ballot code chains from the device's ballot submitted just before this one,
+        whichever finishes encrypting first. A ballot that cannot be encrypted returns None
+        and does not advance the chain.
+
+        :param device_id: the id of a registered `EncryptionDevice`
+        :param ballot: the ballot to encrypt
+        :return: the encrypted ballot or None if there is an error
+        """
+        if not self.is_registered(device_id):
+            log_warning(f"encrypt service has no device {device_id}")
+            return None
+
+        # Take this ballot's turn in the device chain before awaiting anything
+        loop = asyncio.get_running_loop()
+        previous = self._turns.get(device_id)
+        turn = loop.create_future()
+        self._turns[device_id] = turn
+
+        try:
+            unchained_ballot = await self._submit(ballot)
+            code_seed = (
+                await asyncio.shield(previous)
+                if previous is not None
+                else self._code_seeds[device_id]
+            )
+        except BaseException:
+            if previous is not None:
+                _pass_code_seed(previous, turn)
+            else:
+                turn.set_result(self._code_seeds[device_id])
+            raise
+
+        if unchained_ballot is None:
+            turn.set_result(code_seed)
+            return None
+
+        encrypted_ballot = chain_ballot_code(unchained_ballot, code_seed)
+        turn.set_result(encrypted_ballot.code)
+        return encrypted_ballot
+
+    async def _submit(self, ballot: PlaintextBallot) -> Optional[CiphertextBallot]:
+        """Queue a ballot for the workers, waiting while the queue is full."""
+        if self._queue is None:
+            raise RuntimeError("encrypt service is not started")
+        result = asyncio.get_running_loop().create_future()
+        await self._queue.put((ballot, result))
+        return await result
+
+    async def _dispatch(self) -> None:
+        """Feed queued ballots to a worker process one at a time."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while queue is not None:
+            ballot, result = await queue.get()
+            try:
+                if result.cancelled():
+                    continue
+                encrypted_ballot = await loop.run_in_executor(
+                    self._executor, _encrypt_in_worker, ballot
+                )
+                if not result.cancelled():
+                    result.set_result(encrypted_ballot)
+            except asyncio.CancelledError:
+                result.cancel()
+                raise
+            except Exception as error:  # pylint: disable=broad-except
+                if not result.cancelled():
+                    result.set_exception(error)
+            finally:
+                queue.task_done()
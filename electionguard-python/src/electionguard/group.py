@@ -6,19 +6,35 @@ made about timing or other side-channels.
 """
 
 from abc import ABC
-from typing import Any, Final, Optional, Union
+from typing import Any, Dict, Final, Iterable, List, Optional, Tuple, Union
 from base64 import b16decode
-from secrets import randbelow
-from sys import maxsize
+from secrets import randbelow, randbits
+from sys import getsizeof, maxsize
+from threading import Lock
 
 # pylint: disable=no-name-in-module
-from gmpy2 import mpz, powmod, invert
+from gmpy2 import mpz, powmod, invert, is_prime, jacobi
 
-from .constants import get_large_prime, get_small_prime, get_generator
+from .constants import (
+    ElectionConstants,
+    get_cofactor,
+    get_constants,
+    get_large_prime,
+    get_small_prime,
+    get_generator,
+)
 
 
 class BaseElement(ABC, int):
-    """An element limited by mod T within [0, T) where T is determined by an upper_bound function."""
+    """
+    An element limited by mod T within [0, T) where T is determined by an upper_bound function.
+
+    Elements hold no per-instance attributes, so each one is just the integer value.
+    Results of the arithmetic functions in this module are reduced by construction and skip
+    the bounds check that the public constructor performs.
+    """
+
+    __slots__ = ()
 
     def __new__(cls, elem: Union[int, str], check_within_bounds: bool = True):  # type: ignore
         """Instantiate ElementModT where elem is an int or its hex representation or mpz."""
@@ -81,7 +97,9 @@ class BaseElement(ABC, int):
 
 
 class ElementModQ(BaseElement):
-    """An element of the larger `mod p` space, i.e., in [0, P), where P is a 4096-bit prime."""
+    """An element of the smaller `mod q` space, i.e., in [0, Q), where Q is a 256-bit prime."""
+
+    __slots__ = ()
 
     @classmethod
     def get_upper_bound(cls) -> int:
@@ -92,6 +110,8 @@ class ElementModQ(BaseElement):
 class ElementModP(BaseElement):
     """An element of the larger `mod p` space, i.e., in [0, P), where P is a 4096-bit prime."""
 
+    __slots__ = ()
+
     @classmethod
     def get_upper_bound(cls) -> int:
         """Get the upper bound for the element."""
@@ -99,9 +119,28 @@ class ElementModP(BaseElement):
 
     def is_valid_residue(self) -> bool:
         """Validate that this element is in Z^r_p."""
-        residue = pow_p(self, get_small_prime()) == ONE_MOD_P
+        if not self.is_in_bounds():
+            return False
+        if is_known_residue(self):
+            return True
+
+        residue = pow_p(self, _get_small_prime_mpz()) == ONE_MOD_P
+        if residue:
+            _remember_residue(_get_mpz(self))
+        return residue
+
+    def to_hex(self) -> str:
+        """
+        Convert from the element to the hex representation of bytes.
 
-        return self.is_in_bounds() and residue
+        The same public values are hashed many times while encrypting and verifying a ballot,
+        so recent encodings are remembered rather than formatted again.
+        """
+        hex = _hex_cache.get(self)
+        if hex is None:
+            hex = int_to_hex(self.__int__())
+            _remember_hex(self, hex)
+        return hex
 
 
 # Common constants
@@ -124,6 +163,30 @@ def _get_mpz(input: Union[BaseElement, int]) -> mpz:
     return mpz(input)
 
 
+_moduli_constants: Optional[ElectionConstants] = None
+_moduli: Tuple[mpz, mpz] = (mpz(0), mpz(0))
+
+
+def _get_moduli() -> Tuple[mpz, mpz]:
+    """Get the large and small primes as mpz, only converting them again when the constants change."""
+    global _moduli_constants, _moduli  # pylint: disable=global-statement
+    constants = get_constants()
+    if constants is not _moduli_constants:
+        _moduli = (mpz(constants.large_prime), mpz(constants.small_prime))
+        _moduli_constants = constants
+    return _moduli
+
+
+def _get_large_prime_mpz() -> mpz:
+    """Get the large prime p as mpz."""
+    return _get_moduli()[0]
+
+
+def _get_small_prime_mpz() -> mpz:
+    """Get the small prime q as mpz."""
+    return _get_moduli()[1]
+
+
 def hex_to_int(input: str) -> int:
     """Given a hex string representing bytes, returns an int."""
     return int(input, 16)
@@ -137,6 +200,28 @@ def int_to_hex(input: int) -> str:
     return hex
 
 
+MAX_CACHED_HEX: Final[int] = 1024
+"""Maximum number of `ElementModP` hex encodings remembered by `ElementModP.to_hex`."""
+
+_hex_cache: Dict[int, str] = {}
+_hex_cache_lock = Lock()
+"""Guards the hex cache, which is shared with the verifier and pool refill threads."""
+
+
+def _remember_hex(e: int, hex: str) -> None:
+    """Remember the hex encoding of an element, dropping the oldest entry when full."""
+    with _hex_cache_lock:
+        if len(_hex_cache) >= MAX_CACHED_HEX:
+            _hex_cache.pop(next(iter(_hex_cache), None), None)
+        _hex_cache[e] = hex
+
+
+def clear_hex_cache() -> None:
+    """Forget every remembered `ElementModP` hex encoding."""
+    with _hex_cache_lock:
+        _hex_cache.clear()
+
+
 def hex_to_q(input: str) -> Optional[ElementModQ]:
     """
     Given a hex string representing bytes, returns an ElementModQ.
@@ -187,38 +272,39 @@ def int_to_p(input: int) -> Optional[ElementModP]:
 
 def add_q(*elems: ElementModQorInt) -> ElementModQ:
     """Add together one or more elements in Q, returns the sum mod Q."""
+    modulus = _get_small_prime_mpz()
     sum = _get_mpz(0)
     for e in elems:
-        e = _get_mpz(e)
-        sum = (sum + e) % get_small_prime()
-    return ElementModQ(sum)
+        sum += _get_mpz(e)
+    return ElementModQ(sum % modulus, False)
 
 
 def a_minus_b_q(a: ElementModQorInt, b: ElementModQorInt) -> ElementModQ:
     """Compute (a-b) mod q."""
     a = _get_mpz(a)
     b = _get_mpz(b)
-    return ElementModQ((a - b) % get_small_prime())
+    return ElementModQ((a - b) % _get_small_prime_mpz(), False)
 
 
 def div_p(a: ElementModPOrQorInt, b: ElementModPOrQorInt) -> ElementModP:
     """Compute a/b mod p."""
     b = _get_mpz(b)
-    inverse = invert(b, _get_mpz(get_large_prime()))
+    inverse = invert(b, _get_large_prime_mpz())
     return mult_p(a, inverse)
 
 
 def div_q(a: ElementModPOrQorInt, b: ElementModPOrQorInt) -> ElementModQ:
     """Compute a/b mod q."""
     b = _get_mpz(b)
-    inverse = invert(b, _get_mpz(get_small_prime()))
+    inverse = invert(b, _get_small_prime_mpz())
     return mult_q(a, inverse)
 
 
 def negate_q(a: ElementModQorInt) -> ElementModQ:
     """Compute (Q - a) mod q."""
     a = _get_mpz(a)
-    return ElementModQ(get_small_prime() - a)
+    modulus = _get_small_prime_mpz()
+    return ElementModQ((modulus - a) % modulus, False)
 
 
 def a_plus_bc_q(
@@ -228,7 +314,7 @@ def a_plus_bc_q(
     a = _get_mpz(a)
     b = _get_mpz(b)
     c = _get_mpz(c)
-    return ElementModQ((a + b * c) % get_small_prime())
+    return ElementModQ((a + b * c) % _get_small_prime_mpz(), False)
 
 
 def mult_inv_p(e: ElementModPOrQorInt) -> ElementModP:
@@ -239,19 +325,24 @@ def mult_inv_p(e: ElementModPOrQorInt) -> ElementModP:
     """
     e = _get_mpz(e)
     assert e != 0, "No multiplicative inverse for zero"
-    return ElementModP(powmod(e, -1, get_large_prime()))
+    return ElementModP(powmod(e, -1, _get_large_prime_mpz()), False)
 
 
 def pow_p(b: ElementModPOrQorInt, e: ElementModPOrQorInt) -> ElementModP:
     """
     Compute b^e mod p.
 
+    Bases registered with `register_fixed_base` are exponentiated with their precomputed table.
+
     :param b: An element in [0,P).
     :param e: An element in [0,P).
     """
+    table = get_fixed_base_table(b)
+    if table is not None:
+        return table.pow(e)
     b = _get_mpz(b)
     e = _get_mpz(e)
-    return ElementModP(powmod(b, e, get_large_prime()))
+    return ElementModP(powmod(b, e, _get_large_prime_mpz()), False)
 
 
 def pow_q(b: ElementModQorInt, e: ElementModQorInt) -> ElementModQ:
@@ -263,7 +354,7 @@ def pow_q(b: ElementModQorInt, e: ElementModQorInt) -> ElementModQ:
     """
     b = _get_mpz(b)
     e = _get_mpz(e)
-    return ElementModQ(powmod(b, e, get_small_prime()))
+    return ElementModQ(powmod(b, e, _get_small_prime_mpz()), False)
 
 
 def mult_p(*elems: ElementModPOrQorInt) -> ElementModP:
@@ -272,11 +363,11 @@ def mult_p(*elems: ElementModPOrQorInt) -> ElementModP:
 
     :param elems: Zero or more elements in [0,P).
     """
+    modulus = _get_large_prime_mpz()
     product = _get_mpz(1)
     for x in elems:
-        x = _get_mpz(x)
-        product = (product * x) % get_large_prime()
-    return ElementModP(product)
+        product = product * _get_mpz(x) % modulus
+    return ElementModP(product, False)
 
 
 def mult_q(*elems: ElementModPOrQorInt) -> ElementModQ:
@@ -285,11 +376,184 @@ def mult_q(*elems: ElementModPOrQorInt) -> ElementModQ:
 
     :param elems: Zero or more elements in [0,Q).
     """
+    modulus = _get_small_prime_mpz()
     product = _get_mpz(1)
     for x in elems:
-        x = _get_mpz(x)
-        product = (product * x) % get_small_prime()
-    return ElementModQ(product)
+        product = product * _get_mpz(x) % modulus
+    return ElementModQ(product, False)
+
+
+DEFAULT_WINDOW_SIZE: Final[int] = 8
+"""Default number of exponent bits consumed per lookup in a `FixedBaseTable`."""
+
+
+class FixedBaseTable:
+    """
+    A precomputed table of powers of a fixed base mod p.
+
+    Exponents are split into windows of `window_size` bits. For window `i`, the table holds
+    `base^(d * 2^(window_size * i))` for every digit `d`, so an exponentiation costs at most one
+    modular multiplication per window instead of a full square-and-multiply `powmod`.
+
+    Exponents that are negative or wider than the small prime fall back to `powmod`.
+    """
+
+    def __init__(
+        self, base: ElementModPOrQorInt, window_size: int = DEFAULT_WINDOW_SIZE
+    ) -> None:
+        """
+        Build the table for the given base.
+
+        :param base: The fixed base, an element in [0,P).
+        :param window_size: Number of exponent bits per window. Larger windows trade memory for speed.
+        """
+        assert window_size > 0, "Window size must be positive"
+        self.base = _get_mpz(base)
+        self.modulus = _get_large_prime_mpz()
+        self.window_size = window_size
+        self.exponent_bits = _get_small_prime_mpz().bit_length()
+        self._table = self._build_table()
+
+    def _build_table(self) -> List[List[mpz]]:
+        window_count = -(-self.exponent_bits // self.window_size)
+        table: List[List[mpz]] = []
+        window_base = self.base % self.modulus
+        for _ in range(window_count):
+            row = [_get_mpz(1), window_base]
+            for _ in range(2, 1 << self.window_size):
+                row.append(row[-1] * window_base % self.modulus)
+            table.append(row)
+            window_base = row[-1] * window_base % self.modulus
+        return table
+
+    def pow(self, e: ElementModPOrQorInt) -> ElementModP:
+        """
+        Compute base^e mod p.
+
+        :param e: An element in [0,P).
+        """
+        exponent = _get_mpz(e)
+        if exponent < 0 or exponent.bit_length() > self.exponent_bits:
+            return ElementModP(powmod(self.base, exponent, self.modulus), False)
+
+        mask = (1 << self.window_size) - 1
+        result = _get_mpz(1)
+        for row in self._table:
+            if not exponent:
+                break
+            digit = exponent & mask
+            if digit:
+                result = result * row[digit] % self.modulus
+            exponent >>= self.window_size
+        return ElementModP(result, False)
+
+    def entry_count(self) -> int:
+        """Get the number of precomputed powers held in the table."""
+        return sum(len(row) for row in self._table)
+
+    def memory_size(self) -> int:
+        """Get the approximate memory used by the table in bytes."""
+        return getsizeof(self._table) + sum(
+            getsizeof(row) + sum(getsizeof(entry) for entry in row)
+            for row in self._table
+        )
+
+
+_generator_table: Optional[FixedBaseTable] = None
+_generator_window_size: int = DEFAULT_WINDOW_SIZE
+"""The window size the generator table is built with, see `set_generator_table_window_size`"""
+
+_fixed_base_lock = Lock()
+"""Guards the generator table and the registered fixed bases, which are shared across threads."""
+
+
+def get_generator_table() -> FixedBaseTable:
+    """
+    Get the process-wide fixed-base table for the generator g.
+
+    The table is built on first use and rebuilt, with the same window size, if the election
+    constants change.
+    """
+    global _generator_table  # pylint: disable=global-statement
+    table = _generator_table
+    if table is not None and _is_current_table(table, get_generator()):
+        return table
+    with _fixed_base_lock:
+        table = _generator_table
+        if table is None or not _is_current_table(table, get_generator()):
+            table = FixedBaseTable(get_generator(), _generator_window_size)
+            _generator_table = table
+        return table
+
+
+def _is_current_table(table: FixedBaseTable, base: int) -> bool:
+    return table.base == base and table.modulus == _get_large_prime_mpz()
+
+
+def set_generator_table_window_size(window_size: int) -> FixedBaseTable:
+    """
+    Rebuild the generator table with a new window size, which is kept when the table is
+    rebuilt for new election constants.
+
+    :param window_size: Number of exponent bits per window.
+    :return: The rebuilt table.
+    """
+    global _generator_table, _generator_window_size  # pylint: disable=global-statement
+    table = FixedBaseTable(get_generator(), window_size)
+    with _fixed_base_lock:
+        _generator_table = table
+        _generator_window_size = window_size
+    return table
+
+
+MAX_FIXED_BASE_TABLES: Final[int] = 4
+"""Maximum number of registered bases, besides the generator, that keep a `FixedBaseTable`."""
+
+_fixed_base_tables: Dict[mpz, Optional[FixedBaseTable]] = {}
+
+
+def register_fixed_base(base: ElementModPOrQorInt) -> None:
+    """
+    Register a base that will be exponentiated many times, such as the joint election public key,
+    so that `pow_p` uses a `FixedBaseTable` for it. The table is built lazily on first use.
+
+    When more than `MAX_FIXED_BASE_TABLES` bases are registered, the oldest registration is dropped.
+
+    :param base: An element in [0,P).
+    """
+    key = _get_mpz(base)
+    with _fixed_base_lock:
+        if key in _fixed_base_tables:
+            return
+        if len(_fixed_base_tables) >= MAX_FIXED_BASE_TABLES:
+            _fixed_base_tables.pop(next(iter(_fixed_base_tables), None), None)
+        _fixed_base_tables[key] = None
+
+
+def get_fixed_base_table(base: ElementModPOrQorInt) -> Optional[FixedBaseTable]:
+    """
+    Get the fixed-base table for the generator or a registered base, building it if needed.
+
+    :param base: An element in [0,P).
+    :return: The table or `None` if the base is not registered.
+    """
+    key = _get_mpz(base)
+    if key == get_generator():
+        return get_generator_table()
+    table = _fixed_base_tables.get(key)
+    if table is not None and _is_current_table(table, key):
+        return table
+    if key not in _fixed_base_tables:
+        return None
+    with _fixed_base_lock:
+        # another thread may have built the table or dropped the base meanwhile
+        if key not in _fixed_base_tables:
+            return None
+        table = _fixed_base_tables[key]
+        if table is None or not _is_current_table(table, key):
+            table = FixedBaseTable(key)
+            _fixed_base_tables[key] = table
+        return table
 
 
 def g_pow_p(e: ElementModPOrQorInt) -> ElementModP:
@@ -298,7 +562,184 @@ def g_pow_p(e: ElementModPOrQorInt) -> ElementModP:
 
     :param e: An element in [0,P).
     """
-    return pow_p(get_generator(), e)
+    return get_generator_table().pow(e)
+
+
+def multi_pow_p(
+    terms: Iterable[Tuple[ElementModPOrQorInt, ElementModPOrQorInt]]
+) -> ElementModP:
+    """
+    Compute the product of b_i^e_i mod p for all (b_i, e_i) terms.
+
+    Bases with a fixed-base table use it and exponents of one are plain multiplications.
+    The remaining terms are evaluated together with Straus (Shamir's trick) interleaving,
+    so they share a single chain of squarings instead of one per exponentiation.
+
+    :param terms: Zero or more (base, exponent) pairs of elements in [0,P).
+    """
+    modulus = _get_large_prime_mpz()
+    product = _get_mpz(1)
+    interleaved: List[Tuple[mpz, mpz]] = []
+    for (b, e) in terms:
+        base = _get_mpz(b)
+        exponent = _get_mpz(e)
+        table = get_fixed_base_table(base)
+        if table is not None:
+            product = product * _get_mpz(table.pow(exponent)) % modulus
+        elif exponent == 1:
+            product = product * base % modulus
+        elif exponent < 0:
+            product = product * powmod(base, exponent, modulus) % modulus
+        else:
+            interleaved.append((base, exponent))
+
+    if len(interleaved) == 1:
+        (base, exponent) = interleaved[0]
+        product = product * powmod(base, exponent, modulus) % modulus
+    elif interleaved:
+        product = product * _straus_pow(interleaved, modulus) % modulus
+    return ElementModP(product, False)
+
+
+def _straus_pow(terms: List[Tuple[mpz, mpz]], modulus: mpz) -> mpz:
+    """Compute the product of b_i^e_i mod the modulus for non-negative exponents."""
+    bits = max(exponent.bit_length() for (_, exponent) in terms)
+    window_size = 4 if bits > 32 else 1
+    mask = (1 << window_size) - 1
+
+    tables: List[List[mpz]] = []
+    for (base, _) in terms:
+        row = [_get_mpz(1), base % modulus]
+        for _ in range(2, 1 << window_size):
+            row.append(row[-1] * row[1] % modulus)
+        tables.append(row)
+
+    result = _get_mpz(1)
+    for window in reversed(range(-(-bits // window_size))):
+        if result != 1:
+            for _ in range(window_size):
+                result = result * result % modulus
+        shift = window * window_size
+        for (row, (_, exponent)) in zip(tables, terms):
+            digit = (exponent >> shift) & mask
+            if digit:
+                result = result * row[digit] % modulus
+    return result
+
+
+MAX_KNOWN_RESIDUES: Final[int] = 256
+"""Maximum number of elements remembered as proven members of Z^r_p."""
+
+RESIDUE_BATCH_EXPONENT_BITS: Final[int] = 128
+"""Bit length of the random exponents used by `is_valid_residues`."""
+
+_known_residues: Dict[mpz, None] = {}
+_known_residues_modulus: Optional[mpz] = None
+_known_residues_lock = Lock()
+"""Guards the residue memo, which is shared with the verifier and pool refill threads."""
+_residue_batch_group: Optional[Tuple[mpz, mpz, mpz]] = None
+_residue_batch_sound = False
+
+
+def is_known_residue(e: ElementModPOrQorInt) -> bool:
+    """
+    Check whether an element was already proven to be in Z^r_p.
+
+    :param e: An element in [0,P).
+    """
+    if _known_residues_modulus != _get_large_prime_mpz():
+        return False
+    return _get_mpz(e) in _known_residues
+
+
+def _remember_residue(e: mpz) -> None:
+    """Remember an element proven to be in Z^r_p, dropping the oldest entry when full."""
+    global _known_residues_modulus  # pylint: disable=global-statement
+    modulus = _get_large_prime_mpz()
+    with _known_residues_lock:
+        if _known_residues_modulus != modulus:
+            _known_residues.clear()
+            _known_residues_modulus = modulus
+        if e in _known_residues:
+            return
+        if len(_known_residues) >= MAX_KNOWN_RESIDUES:
+            _known_residues.pop(next(iter(_known_residues), None), None)
+        _known_residues[e] = None
+
+
+def clear_known_residues() -> None:
+    """Forget every element remembered as a member of Z^r_p."""
+    with _known_residues_lock:
+        _known_residues.clear()
+
+
+def _can_batch_residues() -> bool:
+    """
+    Check whether the randomized product test in `is_valid_residues` is sound for this group.
+
+    The test requires p - 1 = 2 * q * r' where r' is 1 or a prime wider than the random
+    exponents. The Jacobi symbol then rejects anything with an order-2 component and the
+    random exponents catch an order-r' component except with negligible probability.
+    """
+    global _residue_batch_group, _residue_batch_sound  # pylint: disable=global-statement
+    group = (
+        _get_mpz(get_large_prime()),
+        _get_mpz(get_small_prime()),
+        _get_mpz(get_cofactor()),
+    )
+    if group != _residue_batch_group:
+        (_, small_prime, cofactor) = group
+        odd_cofactor = cofactor // 2
+        _residue_batch_sound = (
+            cofactor % 2 == 0
+            and cofactor % small_prime != 0
+            and (
+                odd_cofactor == 1
+                or (
+                    odd_cofactor.bit_length() > RESIDUE_BATCH_EXPONENT_BITS + 1
+                    and is_prime(odd_cofactor)
+                )
+            )
+        )
+        _residue_batch_group = group
+    return _residue_batch_sound
+
+
+def is_valid_residues(elems: Iterable[ElementModPOrQorInt]) -> bool:
+    """
+    Validate that every element is in Z^r_p.
+
+    Elements already proven to be residues are skipped. The rest are checked together by raising
+    their product, each term taken to a random exponent, to the power of q. A single
+    exponentiation then covers the whole batch instead of one per element. If the group does not
+    allow that shortcut, each element is checked on its own.
+
+    :param elems: Zero or more elements in [0,P).
+    :return: True if all elements are valid residues, False if any is not.
+    """
+    modulus = _get_large_prime_mpz()
+    unknown: List[mpz] = []
+    for elem in elems:
+        e = _get_mpz(elem)
+        if not 0 <= e < modulus:
+            return False
+        if not is_known_residue(e) and e not in unknown:
+            unknown.append(e)
+
+    if len(unknown) <= 1 or not _can_batch_residues():
+        return all(ElementModP(e, False).is_valid_residue() for e in unknown)
+
+    if any(jacobi(e, modulus) != 1 for e in unknown):
+        return False
+    combined = multi_pow_p(
+        (e, randbits(RESIDUE_BATCH_EXPONENT_BITS) + 1) for e in unknown
+    )
+    if pow_p(combined, _get_small_prime_mpz()) != ONE_MOD_P:
+        return False
+
+    for e in unknown:
+        _remember_residue(e)
+    return True
 
 
 def rand_q() -> ElementModQ:
@@ -307,7 +748,7 @@ def rand_q() -> ElementModQ:
 
     :return: Random value between 0 and Q
     """
-    return ElementModQ(randbelow(get_small_prime()))
+    return ElementModQ(randbelow(_get_small_prime_mpz()), False)
 
 
 def rand_range_q(start: ElementModQorInt) -> ElementModQ:
@@ -318,7 +759,8 @@ def rand_range_q(start: ElementModQorInt) -> ElementModQ:
     :return: Random value between start and Q
     """
     start = _get_mpz(start)
+    modulus = _get_small_prime_mpz()
     random = 0
     while random < start:
-        random = randbelow(get_small_prime())
-    return ElementModQ(random)
+        random = randbelow(modulus)
+    return ElementModQ(random, False)
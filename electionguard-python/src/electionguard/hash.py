@@ -3,6 +3,7 @@ from abc import abstractmethod
 from collections.abc import Sequence
 from hashlib import sha256
 from typing import (
+    Any,
     Iterable,
     List,
     Union,
@@ -70,25 +71,98 @@ def hash_elems(*a: CRYPTO_HASHABLE_ALL) -> ElementModQ:
     :return: A cryptographic hash of these elements, concatenated.
     """
     h = sha256()
-    h.update("|".encode("utf-8"))
-    hashme_lst = []
+    h.update(b"|")
+    _update_elems(h, a)
+    return _digest_to_q(h)
+
+
+class HashPrefix:
+    """
+    The SHA256 state after hashing a common prefix of elements, so hashes that
+    start with the same elements only hash the rest of them.
+
+    `HashPrefix(a, b).hash_elems(c, d)` is equal to `hash_elems(a, b, c, d)`.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, *a: CRYPTO_HASHABLE_ALL) -> None:
+        """
+        :param a: Zero or more elements of any of the types accepted by `hash_elems`.
+        """
+        self._state = sha256()
+        self._state.update(b"|")
+        _update_elems(self._state, a)
+
+    def extend(self, *a: CRYPTO_HASHABLE_ALL) -> "HashPrefix":
+        """
+        Get a new prefix with more elements appended, leaving this one unchanged.
+
+        :param a: Zero or more elements of any of the types accepted by `hash_elems`.
+        """
+        prefix = HashPrefix.__new__(HashPrefix)
+        prefix._state = self._state.copy()
+        _update_elems(prefix._state, a)
+        return prefix
+
+    def hash_elems(self, *a: CRYPTO_HASHABLE_ALL) -> ElementModQ:
+        """
+        Calculate the hash of the prefix followed by more elements.
+
+        :param a: Zero or more elements of any of the types accepted by `hash_elems`.
+        :return: A cryptographic hash of the prefix and these elements, concatenated.
+        """
+        h = self._state.copy()
+        _update_elems(h, a)
+        return _digest_to_q(h)
+
+    def hash_each(
+        self, elements: Iterable[CRYPTO_HASHABLE_T], *suffix: CRYPTO_HASHABLE_ALL
+    ) -> List[ElementModQ]:
+        """
+        Calculate one hash per element of the prefix, the element and a common suffix.
+        The suffix is encoded once for the whole batch.
+
+        `HashPrefix(a).hash_each([b, c], d)` is equal to `[hash_elems(a, b, d), hash_elems(a, c, d)]`.
+
+        :param elements: The elements that differ between the hashes.
+        :param suffix: Zero or more elements hashed after each element.
+        """
+        encoded_suffix = _encode_elems(suffix)
+        hashes: List[ElementModQ] = []
+        for element in elements:
+            h = self._state.copy()
+            h.update(_encode_elems((element,)))
+            h.update(encoded_suffix)
+            hashes.append(_digest_to_q(h))
+        return hashes
+
+
+def _update_elems(h: Any, a: Iterable[CRYPTO_HASHABLE_ALL]) -> None:
+    """Feed each element to the SHA256 state, followed by a separator."""
+    h.update(_encode_elems(a))
+
+
+def _encode_elems(a: Iterable[CRYPTO_HASHABLE_ALL]) -> bytes:
+    """Encode each element as it is hashed, followed by a separator."""
+    encoded = []
     for x in a:
         # We could just use str(x) for everything, but then we'd have a resulting string
         # that's a bit Python-specific, and we'd rather make it easier for other languages
         # to exactly match this hash function.
         if isinstance(x, (ElementModP, ElementModQ)):
             hash_me = x.to_hex()
-        elif isinstance(x, CryptoHashable):
-            hash_me = x.crypto_hash().to_hex()
-            # print("in cryptohashable", x,  x.crypto_hash().to_hex(), hash_me)
         elif isinstance(x, str):
             # strings are iterable, so it's important to handle them before list-like types
             hash_me = x
         elif isinstance(x, int):
             hash_me = str(x)
+        elif isinstance(x, CryptoHashable):
+            # checking a runtime protocol is slow, so the common atomic types are handled first
+            hash_me = x.crypto_hash().to_hex()
         elif not x:
             # This case captures empty lists and None, nicely guaranteeing that we don't
-            # need in cryptohashableto do a recursive call if the list is empty. So we need a string to
+            # need to do a recursive call if the list is empty. So we need a string to
             # feed in for both of these cases. "None" would be a Python-specific thing,
             # so we'll go with the more JSON-ish "null".
             hash_me = "null"
@@ -97,8 +171,13 @@ def hash_elems(*a: CRYPTO_HASHABLE_ALL) -> ElementModQ:
             hash_me = hash_elems(*x).to_hex()
         else:
             hash_me = str(x)
-        h.update((hash_me + "|").encode("utf-8"))
-        hashme_lst.append(hash_me)
+        encoded.append(hash_me)
+        encoded.append("|")
+    return "".join(encoded).encode("utf-8")
+
+
+def _digest_to_q(h: Any) -> ElementModQ:
+    """Reduce the SHA256 digest into an element mod q."""
     return ElementModQ(
         int.from_bytes(h.digest(), byteorder="big") % (get_small_prime() - 1)
     )
@@ -1,14 +1,32 @@
-import inspect
 import logging
 import os.path
 import sys
-from typing import Any, List, Tuple
+from os import getenv
+from typing import Any, Callable, Final, List, Tuple, Union
 from logging.handlers import RotatingFileHandler
 
 from .singleton import Singleton
 
 FORMAT = "[%(process)d:%(asctime)s]:%(levelname)s:%(message)s"
 
+HOT_PATH_LOGGING_ENV: Final[str] = "HOT_PATH_LOGGING"
+"""Environment variable that turns on logging in hot paths such as encrypting each selection"""
+
+
+def hot_path_logging_from_env() -> bool:
+    """Read whether hot paths log from the `HOT_PATH_LOGGING` environment variable."""
+    return getenv(HOT_PATH_LOGGING_ENV, "").lower() in ("1", "true")
+
+
+HOT_PATH_LOGGING: Final[bool] = hot_path_logging_from_env()
+"""
+Whether hot paths log at all. Read once at import, so when it is off the guarded log calls
+cost a single check and do not depend on the logging configuration.
+"""
+
+LogMessage = Union[str, Callable[[], str]]
+"""A log message, or a function that builds it only when the message will be logged"""
+
 
 class ElectionGuardLog(Singleton):
     """
@@ -25,25 +43,41 @@ class ElectionGuardLog(Singleton):
 
     @staticmethod
     def __get_call_info() -> Tuple[str, str, int]:
-        stack = inspect.stack()
-
-        # stack[0]: __get_call_info
-        # stack[1]: __formatted_message
-        # stack[2]: (log method, e.g. "warn")
-        # stack[3]: Singleton
-        # stack[4]: caller <-- we want this
-
-        filename = stack[4][1]
-        line = stack[4][2]
-        funcname = stack[4][3]
-
-        return filename, funcname, line
+        # frame 0: __get_call_info
+        # frame 1: __formatted_message
+        # frame 2: __log
+        # frame 3: (log method, e.g. "warn")
+        # frame 4: (log function, e.g. "log_warning")
+        # frame 5: caller <-- we want this
+        depth = 5
+        while True:
+            try:
+                frame = sys._getframe(depth)  # pylint: disable=protected-access
+                break
+            except ValueError:
+                depth -= 1
+
+        return frame.f_code.co_filename, frame.f_code.co_name, frame.f_lineno
 
     def __formatted_message(self, message: str) -> str:
         filename, funcname, line = self.__get_call_info()
         message = f"{os.path.basename(filename)}.{funcname}:#L{line}: {message}"
         return message
 
+    def __log(self, level: int, message: LogMessage, *args: Any, **kwargs: Any) -> None:
+        # check the level before building the message or looking up the caller
+        if not self.__logger.isEnabledFor(level):
+            return
+        if callable(message):
+            message = message()
+        self.__logger.log(level, self.__formatted_message(message), *args, **kwargs)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Determine if messages of the level will be logged
+        """
+        return self.__logger.isEnabledFor(level)
+
     def add_handler(self, handler: logging.Handler) -> None:
         """
         Adds a logger handler
@@ -62,35 +96,35 @@ class ElectionGuardLog(Singleton):
         """
         return self.__logger.handlers
 
-    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def debug(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
         """
         Logs a debug message
         """
-        self.__logger.debug(self.__formatted_message(message), *args, **kwargs)
+        self.__log(logging.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def info(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
         """
         Logs a info message
         """
-        self.__logger.info(self.__formatted_message(message), *args, **kwargs)
+        self.__log(logging.INFO, message, *args, **kwargs)
 
-    def warn(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def warn(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
         """
         Logs a warning message
         """
-        self.__logger.warning(self.__formatted_message(message), *args, **kwargs)
+        self.__log(logging.WARNING, message, *args, **kwargs)
 
-    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def error(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
         """
         Logs a error message
         """
-        self.__logger.error(self.__formatted_message(message), *args, **kwargs)
+        self.__log(logging.ERROR, message, *args, **kwargs)
 
-    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def critical(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
         """
         Logs a critical message
         """
-        self.__logger.critical(self.__formatted_message(message), *args, **kwargs)
+        self.__log(logging.CRITICAL, message, *args, **kwargs)
 
 
 def get_stream_handler() -> logging.StreamHandler:
@@ -144,35 +178,42 @@ def log_handlers() -> List[logging.Handler]:
     return LOG.handlers()
 
 
-def log_debug(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_is_enabled(level: int) -> bool:
+    """
+    Determine if messages of the level will be logged
+    """
+    return LOG.is_enabled_for(level)
+
+
+def log_debug(msg: LogMessage, *args: Any, **kwargs: Any) -> None:
     """
     Logs a debug message to the console and the file log.
     """
     LOG.debug(msg, *args, **kwargs)
 
 
-def log_info(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_info(msg: LogMessage, *args: Any, **kwargs: Any) -> None:
     """
     Logs an information message to the console and the file log.
     """
     LOG.info(msg, *args, **kwargs)
 
 
-def log_warning(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_warning(msg: LogMessage, *args: Any, **kwargs: Any) -> None:
     """
     Logs a warning message to the console and the file log.
     """
     LOG.warn(msg, *args, **kwargs)
 
 
-def log_error(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_error(msg: LogMessage, *args: Any, **kwargs: Any) -> None:
     """
     Logs an error message to the console and the file log.
     """
     LOG.error(msg, *args, **kwargs)
 
 
-def log_critical(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_critical(msg: LogMessage, *args: Any, **kwargs: Any) -> None:
     """
     Logs a critical message to the console and the file log.
     """
@@ -1,13 +1,13 @@
 from dataclasses import dataclass, field, InitVar
 from datetime import datetime
 from enum import Enum, unique
-from typing import cast, List, Optional, Set, Any
+from typing import cast, Dict, List, Optional, Set, Any
 
 from .ballot import _list_eq
 from .election_object_base import ElectionObjectBase, OrderedObjectBase
 from .group import ElementModQ
 from .hash import CryptoHashable, hash_elems
-from .logs import log_warning, log_debug
+from .logs import HOT_PATH_LOGGING, log_warning, log_debug
 from .utils import get_optional, to_iso_date_string
 
 
@@ -103,7 +103,8 @@ class AnnotatedString(CryptoHashable):
         A hash representation of the object
         """
         hash = hash_elems(self.annotation, self.value)
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
 
@@ -135,7 +136,8 @@ class Language(CryptoHashable):
 
         hash = hash_elems(self.value, self.language)
 
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
 
@@ -162,7 +164,8 @@ class InternationalizedText(CryptoHashable):
         A hash representation of the object
         """
         hash = hash_elems(self.text)
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
 
@@ -198,7 +201,8 @@ class ContactInformation(CryptoHashable):
         A hash representation of the object
         """
         hash = hash_elems(self.name, self.address_line, self.email, self.phone)
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
 
@@ -221,7 +225,8 @@ class GeopoliticalUnit(ElectionObjectBase, CryptoHashable):
         hash = hash_elems(
             self.object_id, self.name, str(self.type.name), self.contact_information
         )
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
 
@@ -242,7 +247,8 @@ class BallotStyle(ElectionObjectBase, CryptoHashable):
         hash = hash_elems(
             self.object_id, self.geopolitical_unit_ids, self.party_ids, self.image_uri
         )
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
 
@@ -275,7 +281,8 @@ class Party(ElectionObjectBase, CryptoHashable):
             self.color,
             self.logo_uri,
         )
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
 
@@ -307,7 +314,8 @@ class Candidate(ElectionObjectBase, CryptoHashable):
         A hash representation of the object
         """
         hash = hash_elems(self.object_id, self.name, self.party_id, self.image_uri)
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
 
@@ -333,7 +341,8 @@ class SelectionDescription(OrderedObjectBase, CryptoHashable):
         A hash representation of the object
         """
         hash = hash_elems(self.object_id, self.sequence_order, self.candidate_id)
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
 
@@ -410,7 +419,8 @@ class ContestDescription(OrderedObjectBase, CryptoHashable):
             self.votes_allowed,
             self.ballot_selections,
         )
-        log_debug(f"{self.__class__} : crypto_hash: {hash.to_hex()}")
+        if HOT_PATH_LOGGING:
+            log_debug(lambda: f"{self.__class__} : crypto_hash: {hash.to_hex()}")
         return hash
 
     def is_valid(self) -> bool:
@@ -514,6 +524,17 @@ class ContestDescriptionWithPlaceholders(ContestDescription):
         default_factory=lambda: []
     )
 
+    _selections_by_id: Dict[str, SelectionDescription] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
+    def __post_init__(self) -> None:
+        # index the selections once, keeping the first selection with a given id
+        selections_by_id: Dict[str, SelectionDescription] = {}
+        for selection in self.ballot_selections + self.placeholder_selections:
+            selections_by_id.setdefault(selection.object_id, selection)
+        self._selections_by_id = selections_by_id
+
     def is_valid(self) -> bool:
         """
         Checks is contest description is valid
@@ -538,20 +559,7 @@ class ContestDescriptionWithPlaceholders(ContestDescription):
         :param selection_id: Id of Selection
         :return: description
         """
-        matching_selections = list(
-            filter(lambda i: i.object_id == selection_id, self.ballot_selections)
-        )
-
-        if any(matching_selections):
-            return matching_selections[0]
-
-        matching_placeholders = list(
-            filter(lambda i: i.object_id == selection_id, self.placeholder_selections)
-        )
-
-        if any(matching_placeholders):
-            return matching_placeholders[0]
-        return None
+        return self._selections_by_id.get(selection_id)
 
 
 # pylint: disable=too-many-instance-attributes,super-init-not-called
@@ -819,6 +827,28 @@ class InternalManifest:
 
     manifest_hash: ElementModQ = field(init=False)
 
+    contest_hashes: Dict[str, ElementModQ] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+    """The description hash of each contest, by contest object_id"""
+
+    selection_hashes: Dict[str, Dict[str, ElementModQ]] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+    """The description hash of each selection and placeholder, by contest and selection object_id"""
+
+    _ballot_styles_by_id: Dict[str, BallotStyle] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
+    _contests_by_id: Dict[str, ContestDescriptionWithPlaceholders] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
+    _contests_by_style: Dict[str, List[ContestDescriptionWithPlaceholders]] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
     def __post_init__(self, manifest: Manifest) -> None:
         object.__setattr__(self, "manifest_hash", manifest.crypto_hash())
         object.__setattr__(self, "geopolitical_units", manifest.geopolitical_units)
@@ -826,6 +856,44 @@ class InternalManifest:
         object.__setattr__(
             self, "contests", self._generate_contests_with_placeholders(manifest)
         )
+        self._generate_indexes()
+        self._generate_description_hashes()
+
+    def contest_hash_for(self, contest_id: str) -> Optional[ElementModQ]:
+        """
+        Get the precomputed description hash of a contest
+        :param contest_id: Contest id
+        :return: Contest description hash or none
+        """
+        return self.contest_hashes.get(contest_id)
+
+    def selection_hash_for(
+        self, contest_id: str, selection_id: str
+    ) -> Optional[ElementModQ]:
+        """
+        Get the precomputed description hash of a selection or placeholder selection
+        :param contest_id: Contest id
+        :param selection_id: Selection id
+        :return: Selection description hash or none
+        """
+        return self.selection_hashes.get(contest_id, {}).get(selection_id)
+
+    def _generate_description_hashes(self) -> None:
+        """
+        Hash every contest and selection description once, so encrypting, validating
+        and tallying ballots look the hashes up instead of recomputing them
+        """
+        contest_hashes: Dict[str, ElementModQ] = {}
+        selection_hashes: Dict[str, Dict[str, ElementModQ]] = {}
+        for contest in self.contests:
+            contest_hashes[contest.object_id] = contest.crypto_hash()
+            selection_hashes[contest.object_id] = {
+                selection.object_id: selection.crypto_hash()
+                for selection in contest.ballot_selections
+                + contest.placeholder_selections
+            }
+        object.__setattr__(self, "contest_hashes", contest_hashes)
+        object.__setattr__(self, "selection_hashes", selection_hashes)
 
     def contest_for(
         self, contest_id: str
@@ -835,22 +903,13 @@ class InternalManifest:
         :param contest_id: Contest id
         :return: Contest description or none
         """
-        matching_contests = list(
-            filter(lambda i: i.object_id == contest_id, self.contests)
-        )
-
-        if any(matching_contests):
-            return matching_contests[0]
-        return None
+        return self._contests_by_id.get(contest_id)
 
     def get_ballot_style(self, ballot_style_id: str) -> BallotStyle:
         """
         Get a ballot style for a specified ballot_style_id
         """
-        style = list(
-            filter(lambda i: i.object_id == ballot_style_id, self.ballot_styles)
-        )[0]
-        return style
+        return self._ballot_styles_by_id[ballot_style_id]
 
     def get_contests_for(
         self, ballot_style_id: str
@@ -858,17 +917,35 @@ class InternalManifest:
         """
         Get contests for a ballot style
         :param ballot_style_id: ballot style id
-        :return: contest descriptions
-        """
-        style = self.get_ballot_style(ballot_style_id)
-        if style.geopolitical_unit_ids is None:
-            return list()
-        # pylint: disable=unnecessary-comprehension
-        gp_unit_ids = [gp_unit_id for gp_unit_id in style.geopolitical_unit_ids]
-        contests = list(
-            filter(lambda i: i.electoral_district_id in gp_unit_ids, self.contests)
-        )
-        return contests
+        :return: contest descriptions, shared between calls so they must not be modified
+        """
+        return self._contests_by_style[ballot_style_id]
+
+    def _generate_indexes(self) -> None:
+        """
+        Index the ballot styles and contests by object_id, and the contests
+        of each ballot style, so lookups while encrypting and validating ballots are constant time.
+        Like the linear searches they replace, the first style or contest with a given id wins.
+        """
+        ballot_styles_by_id: Dict[str, BallotStyle] = {}
+        for style in self.ballot_styles:
+            ballot_styles_by_id.setdefault(style.object_id, style)
+        object.__setattr__(self, "_ballot_styles_by_id", ballot_styles_by_id)
+
+        contests_by_id: Dict[str, ContestDescriptionWithPlaceholders] = {}
+        for contest in self.contests:
+            contests_by_id.setdefault(contest.object_id, contest)
+        object.__setattr__(self, "_contests_by_id", contests_by_id)
+
+        contests_by_style: Dict[str, List[ContestDescriptionWithPlaceholders]] = {}
+        for style in ballot_styles_by_id.values():
+            gp_unit_ids = set(style.geopolitical_unit_ids or [])
+            contests_by_style[style.object_id] = [
+                contest
+                for contest in self.contests
+                if contest.electoral_district_id in gp_unit_ids
+            ]
+        object.__setattr__(self, "_contests_by_style", contests_by_style)
 
     @staticmethod
     def _generate_contests_with_placeholders(
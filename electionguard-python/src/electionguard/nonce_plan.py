@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from typing import Dict
+
+from .group import ElementModQ
+from .manifest import ContestDescriptionWithPlaceholders, InternalManifest
+from .nonces import Nonces
+from .type import CONTEST_ID, SELECTION_ID
+from .utils import get_optional
+
+
+@dataclass(frozen=True)
+class SelectionNonces:
+    """
+    The nonces used to encrypt one selection, derived from its contest nonce
+    exactly as `encrypt_selection` derives them.
+    """
+
+    selection_nonce: ElementModQ
+    """The nonce used to encrypt the selection"""
+
+    proof_seed: ElementModQ
+    """The seed the disjunctive Chaum-Pedersen proof nonces are drawn from"""
+
+
+@dataclass(frozen=True)
+class ContestNonces:
+    """
+    The nonces used to encrypt one contest and its selections, derived from the ballot
+    nonce seed exactly as `encrypt_contest` derives them.
+    """
+
+    contest_nonce: ElementModQ
+    """The nonce the selection nonces of the contest are derived from"""
+
+    proof_seed: ElementModQ
+    """The seed the constant Chaum-Pedersen proof nonce is drawn from"""
+
+    selections: Dict[SELECTION_ID, SelectionNonces]
+    """The nonces of each selection and placeholder selection"""
+
+
+@dataclass(frozen=True)
+class BallotNonces:
+    """
+    Every nonce needed to encrypt a ballot of a ballot style.
+    """
+
+    nonce_seed: ElementModQ
+    """The ballot nonce seed every other nonce is derived from"""
+
+    contests: Dict[CONTEST_ID, ContestNonces]
+    """The nonces of each contest of the ballot style"""
+
+
+def plan_selection_nonces(
+    description_hash: ElementModQ, sequence_order: int, contest_nonce: ElementModQ
+) -> SelectionNonces:
+    """
+    Derive the nonces of a selection.
+
+    :param description_hash: the hash of the `SelectionDescription`
+    :param sequence_order: the sequence order of the `SelectionDescription`
+    :param contest_nonce: the nonce of the contest the selection belongs to
+    """
+    proof_seed, selection_nonce = Nonces(description_hash, contest_nonce).batch(
+        (0, sequence_order)
+    )
+    return SelectionNonces(selection_nonce, proof_seed)
+
+
+def plan_contest_nonces(
+    description: ContestDescriptionWithPlaceholders,
+    internal_manifest: InternalManifest,
+    nonce_seed: ElementModQ,
+) -> ContestNonces:
+    """
+    Derive the nonces of a contest and of its selections and placeholder selections.
+
+    :param description: the description of the contest
+    :param internal_manifest: the `InternalManifest` holding the description hashes
+    :param nonce_seed: the ballot nonce seed
+    """
+    proof_seed, contest_nonce = Nonces(
+        get_optional(internal_manifest.contest_hash_for(description.object_id)),
+        nonce_seed,
+    ).batch((0, description.sequence_order))
+
+    selections: Dict[SELECTION_ID, SelectionNonces] = {}
+    for selection in description.ballot_selections + description.placeholder_selections:
+        selections[selection.object_id] = plan_selection_nonces(
+            get_optional(
+                internal_manifest.selection_hash_for(
+                    description.object_id, selection.object_id
+                )
+            ),
+            selection.sequence_order,
+            contest_nonce,
+        )
+    return ContestNonces(contest_nonce, proof_seed, selections)
+
+
+def plan_ballot_nonces(
+    internal_manifest: InternalManifest, style_id: str, nonce_seed: ElementModQ
+) -> BallotNonces:
+    """
+    Derive every nonce needed to encrypt a ballot of a ballot style in one pass.
+
+    The nonces match the ones `encrypt_ballot` derives contest by contest and selection by
+    selection, so a ballot encrypted with the planned nonces is identical.
+
+    :param internal_manifest: the `InternalManifest` which defines the ballot's structure
+    :param style_id: the object_id of the ballot style
+    :param nonce_seed: the ballot nonce seed, see `CiphertextBallot.nonce_seed`
+    """
+    return BallotNonces(
+        nonce_seed,
+        {
+            contest.object_id: plan_contest_nonces(
+                contest, internal_manifest, nonce_seed
+            )
+            for contest in internal_manifest.get_contests_for(style_id)
+        },
+    )
@@ -1,8 +1,8 @@
 # pylint: disable=too-many-ancestors
-from typing import Union, Sequence, List, overload
+from typing import Iterable, Union, Sequence, List, overload
 
 from electionguard.group import ElementModQ, ElementModPOrQ
-from electionguard.hash import hash_elems
+from electionguard.hash import HashPrefix, hash_elems
 
 
 class Nonces(Sequence[ElementModQ]):
@@ -15,6 +15,7 @@ class Nonces(Sequence[ElementModQ]):
 
     The Nonces class is a Sequence. It can be iterated, or it can be treated as an array
     and indexed. Asking for a nonce is constant time, regardless of the index.
+    The hash state of the seed is kept, so each nonce only hashes its index and headers.
     """
 
     def __init__(self, seed: ElementModQ, *headers: Union[str, ElementModPOrQ]) -> None:
@@ -22,6 +23,7 @@ class Nonces(Sequence[ElementModQ]):
             self.__seed: ElementModQ = hash_elems(seed, *headers)
         else:
             self.__seed = seed
+        self.__prefix = HashPrefix(self.__seed)
 
     # https://github.com/python/mypy/issues/4108
     @overload
@@ -40,7 +42,7 @@ class Nonces(Sequence[ElementModQ]):
         if isinstance(index.stop, int):
             # Handling slices is a pain: https://stackoverflow.com/a/42731787
             indices = range(index.start or 0, index.stop, index.step or 1)
-            return [self[i] for i in indices]
+            return self.batch(indices)
         raise TypeError("Cannot take unbounded slice of Nonces")
 
     def __len__(self) -> int:
@@ -56,4 +58,17 @@ class Nonces(Sequence[ElementModQ]):
         """
         if item < 0:
             raise TypeError("Nonces do not support negative indices.")
-        return hash_elems(self.__seed, item, *headers)
+        return self.__prefix.hash_elems(item, *headers)
+
+    def batch(self, indices: Iterable[int], *headers: str) -> List[ElementModQ]:
+        """
+        Gets the items at several offsets in one call. The seed and headers are hashed
+        once for the whole batch, and each item equals `get_with_headers(index, *headers)`.
+
+        :param indices: Indices into the nonces.
+        :param headers:  Optional string headers.
+        """
+        indices = list(indices)
+        if any(index < 0 for index in indices):
+            raise TypeError("Nonces do not support negative indices.")
+        return self.__prefix.hash_each(indices, *headers)
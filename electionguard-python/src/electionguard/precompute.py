@@ -0,0 +1,331 @@
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition, Thread
+from timeit import default_timer as timer
+from typing import Deque, Final, List, Optional
+
+from .chaum_pedersen import ConstantChaumPedersenProof, DisjunctiveChaumPedersenProof
+from .elgamal import ElGamalCiphertext
+from .group import (
+    ElementModP,
+    ElementModQ,
+    ONE_MOD_Q,
+    a_minus_b_q,
+    a_plus_bc_q,
+    add_q,
+    g_pow_p,
+    mult_p,
+    negate_q,
+    pow_p,
+    rand_range_q,
+    register_fixed_base,
+)
+from .hash import hash_elems
+from .logs import log_warning
+
+DEFAULT_POOL_DEPTH: Final[int] = 1024
+"""Default number of precomputed exponentiations an `EncryptionPool` keeps ready"""
+
+SELECTION_EXPONENTIATIONS: Final[int] = 4
+"""Number of precomputed exponentiations consumed by one encrypted selection and its proof"""
+
+
+@dataclass(frozen=True)
+class PrecomputedExponentiation:
+    """
+    A random exponent together with its powers of the generator and of the election public key.
+    Each instance must be used at most once, since its exponent is a secret nonce.
+    """
+
+    exponent: ElementModQ
+    """x, a random value in [1,Q)"""
+    generator_pow: ElementModP
+    """g^x mod p"""
+    key_pow: ElementModP
+    """K^x mod p"""
+
+
+def precompute_exponentiation(public_key: ElementModP) -> PrecomputedExponentiation:
+    """
+    Pick a random exponent and compute its powers of the generator and of the public key.
+
+    :param public_key: The ElGamal public key for the election
+    """
+    exponent = rand_range_q(ONE_MOD_Q)
+    return PrecomputedExponentiation(
+        exponent, g_pow_p(exponent), pow_p(public_key, exponent)
+    )
+
+
+@dataclass(frozen=True)
+class PrecomputedSelection:
+    """
+    The exponentiations needed to encrypt one selection and produce its disjunctive
+    Chaum-Pedersen proof, so only multiplications and hashes are left at encryption time.
+    """
+
+    encryption: PrecomputedExponentiation
+    """The encryption nonce r with g^r and K^r"""
+    real_commitment: PrecomputedExponentiation
+    """The commitment u of the branch matching the plaintext with g^u and K^u"""
+    fake_commitment: PrecomputedExponentiation
+    """The response v of the simulated branch with g^v and K^v"""
+    fake_challenge: PrecomputedExponentiation
+    """The challenge w of the simulated branch with g^w"""
+
+    def encrypt(self, m: int) -> ElGamalCiphertext:
+        """
+        Encrypt a message of zero or one with the precomputed nonce.
+
+        :param m: Zero or one
+        """
+        data = self.encryption.key_pow
+        if m:
+            data = mult_p(g_pow_p(m), data)
+        return ElGamalCiphertext(self.encryption.generator_pow, data)
+
+    def prove(
+        self, message: ElGamalCiphertext, plaintext: int, q: ElementModQ
+    ) -> DisjunctiveChaumPedersenProof:
+        """
+        Produce a "disjunctive" proof that the message made by `encrypt` is an encrypted zero or one.
+
+        :param message: The ElGamal ciphertext returned by `encrypt`
+        :param plaintext: Zero or one
+        :param q: A value used when generating the challenge,
+                  usually the election extended base hash (𝑄')
+        """
+        assert (
+            0 <= plaintext <= 1
+        ), "PrecomputedSelection.prove only supports plaintexts of 0 or 1"
+        alpha = message.pad
+        beta = message.data
+        r = self.encryption.exponent
+        u = self.real_commitment
+        v = self.fake_commitment
+        w = self.fake_challenge
+
+        if plaintext == 0:
+            a0 = u.generator_pow
+            b0 = u.key_pow
+            a1 = v.generator_pow
+            b1 = mult_p(v.key_pow, w.generator_pow)
+            c = hash_elems(q, alpha, beta, a0, b0, a1, b1)
+            c0 = a_minus_b_q(c, w.exponent)
+            c1 = w.exponent
+            v0 = a_plus_bc_q(u.exponent, c0, r)
+            v1 = a_plus_bc_q(v.exponent, c1, r)
+        else:
+            a0 = v.generator_pow
+            b0 = mult_p(v.key_pow, w.generator_pow)
+            a1 = u.generator_pow
+            b1 = u.key_pow
+            c = hash_elems(q, alpha, beta, a0, b0, a1, b1)
+            c0 = negate_q(w.exponent)
+            c1 = add_q(c, w.exponent)
+            v0 = a_plus_bc_q(v.exponent, c0, r)
+            v1 = a_plus_bc_q(u.exponent, c1, r)
+
+        return DisjunctiveChaumPedersenProof(a0, b0, a1, b1, c0, c1, c, v0, v1)
+
+
+def make_constant_chaum_pedersen_precomputed(
+    message: ElGamalCiphertext,
+    constant: int,
+    r: ElementModQ,
+    commitment: PrecomputedExponentiation,
+    hash_header: ElementModQ,
+) -> ConstantChaumPedersenProof:
+    """
+    Produces a proof that a given encryption corresponds to a specific total value,
+    using a precomputed commitment instead of exponentiating at proof time.
+
+    :param message: An ElGamal ciphertext
+    :param constant: The plaintext constant value used to make the ElGamal ciphertext (L in the spec)
+    :param r: The aggregate nonce used creating the ElGamal ciphertext
+    :param commitment: The commitment u with g^u and K^u
+    :param hash_header: A value used when generating the challenge,
+                        usually the election extended base hash (𝑄')
+    """
+    a = commitment.generator_pow
+    b = commitment.key_pow
+    c = hash_elems(hash_header, message.pad, message.data, a, b)
+    v = a_plus_bc_q(commitment.exponent, c, r)
+
+    return ConstantChaumPedersenProof(a, b, c, v, constant)
+
+
+@dataclass(frozen=True)
+class EncryptionPoolStats:
+    """
+    A snapshot of the state of an `EncryptionPool`, used to size it for peak load
+    """
+
+    depth: int
+    """Precomputed exponentiations ready to use"""
+    target_depth: int
+    """Depth the pool refills to"""
+    produced: int
+    """Precomputed exponentiations made so far"""
+    consumed: int
+    """Exponentiations handed out, whether precomputed or computed on demand"""
+    misses: int
+    """Exponentiations computed on demand because the pool was empty"""
+    refill_rate: float
+    """Precomputed exponentiations made per second of refill work"""
+
+
+class EncryptionPool:
+    """
+    A pool of precomputed exponentiations for a single election public key.
+
+    Fill the pool while the encryption device is idle, either by calling `fill` or by running
+    a background refill thread with `start`. Encrypting with the pool then consumes entries
+    instead of exponentiating. If the pool runs dry, entries are computed on demand.
+
+    Every entry is handed out exactly once. Its exponent is a fresh random nonce rather than one
+    derived from the ballot's master nonce. A ballot encrypted from the pool therefore keeps its
+    nonces on its selections and cannot be decrypted from its master nonce.
+    """
+
+    public_key: ElementModP
+    target_depth: int
+
+    _entries: Deque[PrecomputedExponentiation]
+    _condition: Condition
+    _thread: Optional[Thread]
+    _running: bool
+    _produced: int
+    _consumed: int
+    _misses: int
+    _refill_seconds: float
+
+    def __init__(
+        self, public_key: ElementModP, target_depth: int = DEFAULT_POOL_DEPTH
+    ) -> None:
+        """
+        :param public_key: The ElGamal public key for the election
+        :param target_depth: Number of precomputed exponentiations to keep ready
+        """
+        register_fixed_base(public_key)
+        self.public_key = public_key
+        self.target_depth = target_depth
+        self._entries = deque()
+        self._condition = Condition()
+        self._thread = None
+        self._running = False
+        self._produced = 0
+        self._consumed = 0
+        self._misses = 0
+        self._refill_seconds = 0.0
+
+    def depth(self) -> int:
+        """Get the number of precomputed exponentiations ready to use."""
+        with self._condition:
+            return len(self._entries)
+
+    def fill(self, count: Optional[int] = None) -> int:
+        """
+        Precompute exponentiations until the pool reaches its target depth.
+
+        :param count: Precompute at most this many exponentiations
+        :return: The number of exponentiations added
+        """
+        added = 0
+        while count is None or added < count:
+            with self._condition:
+                if len(self._entries) >= self.target_depth:
+                    break
+            self._add_entry()
+            added += 1
+        return added
+
+    def _add_entry(self) -> None:
+        start = timer()
+        entry = precompute_exponentiation(self.public_key)
+        elapsed = timer() - start
+        with self._condition:
+            self._entries.append(entry)
+            self._produced += 1
+            self._refill_seconds += elapsed
+
+    def start(self) -> None:
+        """Start a background thread that refills the pool whenever it drops below its target depth."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = Thread(
+                target=self._refill, name="encryption-pool-refill", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refill thread, if it is running."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            thread.join()
+
+    def _refill(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and len(self._entries) >= self.target_depth:
+                    self._condition.wait()
+                if not self._running:
+                    return
+            self._add_entry()
+
+    def take(self) -> PrecomputedExponentiation:
+        """Remove one precomputed exponentiation from the pool, computing it if the pool is empty."""
+        with self._condition:
+            self._consumed += 1
+            if self._entries:
+                entry = self._entries.popleft()
+                self._condition.notify_all()
+                return entry
+            self._misses += 1
+            self._condition.notify_all()
+        return precompute_exponentiation(self.public_key)
+
+    def take_selection(self) -> PrecomputedSelection:
+        """Remove the precomputed exponentiations for one selection from the pool."""
+        entries: List[PrecomputedExponentiation] = [
+            self.take() for _ in range(SELECTION_EXPONENTIATIONS)
+        ]
+        return PrecomputedSelection(*entries)
+
+    def clear(self) -> None:
+        """Discard every precomputed exponentiation held by the pool."""
+        with self._condition:
+            self._entries.clear()
+            self._condition.notify_all()
+
+    def stats(self) -> EncryptionPoolStats:
+        """Get a snapshot of the pool depth and refill rate."""
+        with self._condition:
+            refill_rate = (
+                self._produced / self._refill_seconds if self._refill_seconds else 0.0
+            )
+            return EncryptionPoolStats(
+                len(self._entries),
+                self.target_depth,
+                self._produced,
+                self._consumed,
+                self._misses,
+                refill_rate,
+            )
+
+    def matches(self, public_key: ElementModP) -> bool:
+        """
+        Check the pool was made for the given public key.
+
+        :param public_key: The ElGamal public key for the election
+        """
+        if self.public_key != public_key:
+            log_warning("encryption pool does not match the election public key")
+            return False
+        return True
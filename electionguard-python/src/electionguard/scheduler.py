@@ -1,11 +1,12 @@
 # pylint: disable=consider-using-with
 from __future__ import annotations
 import traceback
-from typing import Any, Callable, Iterable, List, TypeVar
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, TypeVar
 from contextlib import AbstractContextManager
 from multiprocessing import Pool as ProcessPool
 from multiprocessing.dummy import Pool as ThreadPool
-from multiprocessing.pool import Pool
+from multiprocessing.pool import AsyncResult, Pool
 from psutil import cpu_count
 
 from .logs import log_warning
@@ -76,6 +77,40 @@ class Scheduler(Singleton, AbstractContextManager):
             return self.safe_starmap(self.__thread_pool, task, arguments)
         return self.safe_starmap(self.__process_pool, task, arguments)
 
+    def schedule_stream(
+        self,
+        task: Callable,
+        arguments: Iterable[Iterable[Any]],
+        max_pending: Optional[int] = None,
+    ) -> Iterator[Optional[_T]]:
+        """
+        Schedule tasks on the process pool as the arguments are consumed, yielding the
+        results in order. At most `max_pending` tasks are in flight, so only that many
+        arguments and results are held in memory at once.
+        :param task: the callable task to execute
+        :param arguments: an iterable of lists passed to the task, consumed lazily
+        :param max_pending: the number of tasks in flight, by default twice the CPU count
+        :return: an iterator of results, with None for each task that failed
+        """
+        if max_pending is None:
+            max_pending = 2 * self.cpu_count()
+        pending: Deque[AsyncResult] = deque()
+        for task_arguments in arguments:
+            pending.append(self.__process_pool.apply_async(task, task_arguments))
+            if len(pending) >= max_pending:
+                yield self.safe_get(task, pending.popleft())
+        while pending:
+            yield self.safe_get(task, pending.popleft())
+
+    @staticmethod
+    def safe_get(task: Callable, result: AsyncResult) -> Optional[_T]:
+        """Safe wrapper to wait for the result of a task"""
+        try:
+            return result.get()
+        except Exception:  # pylint: disable=broad-except
+            log_warning(f"safe_get({task}) failed with \n {traceback.format_exc()}")
+            return None
+
     @staticmethod
     def safe_starmap(
         pool: Pool, task: Callable, arguments: Iterable[Iterable[Any]]
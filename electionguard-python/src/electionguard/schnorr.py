@@ -5,8 +5,7 @@ from .group import (
     ElementModQ,
     ElementModP,
     g_pow_p,
-    mult_p,
-    pow_p,
+    multi_pow_p,
     a_plus_bc_q,
 )
 from .hash import hash_elems
@@ -48,7 +47,7 @@ class SchnorrProof(Proof):
         in_bounds_u = u.is_in_bounds()
 
         c = hash_elems(k, h)
-        valid_proof = g_pow_p(u) == mult_p(h, pow_p(k, c))
+        valid_proof = g_pow_p(u) == multi_pow_p([(h, 1), (k, c)])
 
         success = valid_public_key and in_bounds_h and in_bounds_u and valid_proof
         if not success:
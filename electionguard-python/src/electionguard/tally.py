@@ -1,6 +1,6 @@
 # pylint: disable=unnecessary-comprehension
 from dataclasses import dataclass, field
-from typing import Iterable, Optional, List, Dict, Set, Tuple, Any
+from typing import Iterable, Optional, List, Dict, Sequence, Set, Tuple, Any, Final
 from collections.abc import Container, Sized
 
 from .ballot import (
@@ -10,16 +10,20 @@ from .ballot import (
     CiphertextSelection,
 )
 from .data_store import DataStore
-from .ballot_validator import ballot_is_valid_for_election
+from .ballot_validator import BallotVerificationCache, ballot_is_valid_for_election
 from .decryption_share import CiphertextDecryptionSelection
 from .election import CiphertextElectionContext
 from .election_object_base import ElectionObjectBase, OrderedObjectBase
 from .elgamal import ElGamalCiphertext, elgamal_add
-from .group import ElementModQ, ONE_MOD_P, ElementModP
+from .group import ElementModQ, ONE_MOD_P, ElementModP, register_fixed_base
 from .logs import log_warning
 from .manifest import InternalManifest
 from .scheduler import Scheduler
 from .type import BALLOT_ID, CONTEST_ID, SELECTION_ID
+from .utils import get_optional
+
+ACCUMULATE_CHUNK_SIZE: Final[int] = 4096
+"""Number of ciphertexts of one selection reduced by a single accumulation task"""
 
 
 @dataclass
@@ -125,19 +129,17 @@ class CiphertextTallyContest(OrderedObjectBase):
             )
             return False
 
-        if scheduler is None:
-            scheduler = Scheduler()
-
         # iterate through the tally selections and add the new value to the total
-        results: List[
-            Tuple[SELECTION_ID, Optional[ElGamalCiphertext]]
-        ] = scheduler.schedule(
-            self._accumulate_selections,
-            [
-                (key, selection_tally, contest_selections)
-                for (key, selection_tally) in self.selections.items()
-            ],
-        )
+        arguments = [
+            (key, selection_tally, contest_selections)
+            for (key, selection_tally) in self.selections.items()
+        ]
+        results: List[Tuple[SELECTION_ID, Optional[ElGamalCiphertext]]]
+        if scheduler is None:
+            # a single ballot is too small to be worth sending to other processes
+            results = [self._accumulate_selections(*args) for args in arguments]
+        else:
+            results = scheduler.schedule(self._accumulate_selections, arguments)
 
         for (key, ciphertext) in results:
             if ciphertext is None:
@@ -205,6 +207,8 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
     """
 
     def __post_init__(self) -> None:
+        # Verifying the proofs of every appended ballot exponentiates the joint public key
+        register_fixed_base(self._encryption.elgamal_public_key)
         object.__setattr__(
             self, "contests", self._build_tally_collection(self._internal_manifest)
         )
@@ -225,10 +229,14 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
         return False
 
     def append(
-        self, ballot: SubmittedBallot, scheduler: Optional[Scheduler] = None
+        self,
+        ballot: SubmittedBallot,
+        scheduler: Optional[Scheduler] = None,
+        verified: Optional[BallotVerificationCache] = None,
     ) -> bool:
         """
         Append a ballot to the tally and recalculate the tally.
+        :param verified: ballots already verified by the ballot box, which are not verified again
         """
         if ballot.state == BallotBoxState.UNKNOWN:
             log_warning(f"append cannot add {ballot.object_id} with invalid state")
@@ -239,7 +247,7 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
             return False
 
         if not ballot_is_valid_for_election(
-            ballot, self._internal_manifest, self._encryption
+            ballot, self._internal_manifest, self._encryption, verified
         ):
             return False
 
@@ -256,45 +264,52 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
         self,
         ballots: Iterable[Tuple[Any, SubmittedBallot]],
         scheduler: Optional[Scheduler] = None,
+        verified: Optional[BallotVerificationCache] = None,
     ) -> bool:
         """
         Append a collection of Ballots to the tally and recalculate
+        :param verified: ballots already verified by the ballot box, which are not verified again
         """
+        cast_ballots: List[SubmittedBallot] = []
+        spoiled_ballots: List[SubmittedBallot] = []
         cast_ballot_selections: Dict[
             SELECTION_ID, Dict[BALLOT_ID, ElGamalCiphertext]
         ] = {}
         for ballot in ballots:
             # get the value of the dict
             ballot_value = ballot[1]
-            if not self.__contains__(ballot) and ballot_is_valid_for_election(
-                ballot_value, self._internal_manifest, self._encryption
+            if self.__contains__(ballot_value) or not ballot_is_valid_for_election(
+                ballot_value, self._internal_manifest, self._encryption, verified
             ):
-                if ballot_value.state == BallotBoxState.CAST:
+                continue
 
-                    # collect the selections so they can can be accumulated in parallel
-                    for contest in ballot_value.contests:
-                        for selection in contest.ballot_selections:
-                            if selection.object_id not in cast_ballot_selections:
-                                cast_ballot_selections[selection.object_id] = {}
+            if ballot_value.state == BallotBoxState.CAST:
+                cast_ballots.append(ballot_value)
 
-                            cast_ballot_selections[selection.object_id][
-                                ballot_value.object_id
-                            ] = selection.ciphertext
+                # collect the selections so they can can be accumulated in parallel
+                for contest in ballot_value.contests:
+                    for selection in contest.ballot_selections:
+                        if selection.object_id not in cast_ballot_selections:
+                            cast_ballot_selections[selection.object_id] = {}
 
-                # just append the spoiled ballots
-                elif ballot_value.state == BallotBoxState.SPOILED:
-                    self._add_spoiled(ballot_value)
-        # cache the cast ballot id's so they are not double counted
-        # if self._execute_accumulate(cast_ballot_selections, scheduler):
-        if self._execute_accumulate_without_scheduler(cast_ballot_selections):
-            for ballot in ballots:
-                # get the value of the dict
-                ballot_value = ballot[1]
-                if ballot_value.state == BallotBoxState.CAST:
-                    self.cast_ballot_ids.add(ballot_value.object_id)
-            return True
+                        cast_ballot_selections[selection.object_id][
+                            ballot_value.object_id
+                        ] = selection.ciphertext
 
-        return False
+            elif ballot_value.state == BallotBoxState.SPOILED:
+                spoiled_ballots.append(ballot_value)
+
+        # leave the tally untouched unless every cast ballot was accumulated
+        if not self._execute_accumulate(cast_ballot_selections, scheduler):
+            return False
+
+        # cache the cast ballot id's so they are not double counted
+        for ballot_value in cast_ballots:
+            self.cast_ballot_ids.add(ballot_value.object_id)
+        # just append the spoiled ballots
+        for ballot_value in spoiled_ballots:
+            self._add_spoiled(ballot_value)
+        return True
 
     def cast(self) -> int:
         """
@@ -308,17 +323,48 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
         """
         return len(self.spoiled_ballot_ids)
 
+    def merge(self, other: "CiphertextTally") -> bool:
+        """
+        Merge a partial tally of the same election into this tally.
+
+        The ciphertexts of each selection are multiplied together and the ballot id's are combined.
+        The tallies must not share any ballot id, otherwise that ballot would be counted twice.
+        """
+        if (
+            other._encryption.crypto_extended_base_hash
+            != self._encryption.crypto_extended_base_hash
+        ):
+            log_warning(
+                f"merge cannot combine {other.object_id} from a different election"
+            )
+            return False
+
+        overlap = (self.cast_ballot_ids | self.spoiled_ballot_ids) & (
+            other.cast_ballot_ids | other.spoiled_ballot_ids
+        )
+        if overlap:
+            log_warning(
+                f"merge cannot combine {other.object_id} that shares {len(overlap)} ballots"
+            )
+            return False
+
+        contests = _merge_contests([self.contests, other.contests])
+        if contests is None:
+            return False
+
+        self.contests = contests
+        self.cast_ballot_ids |= other.cast_ballot_ids
+        self.spoiled_ballot_ids |= other.spoiled_ballot_ids
+        return True
+
     def publish(self) -> PublishedCiphertextTally:
         return PublishedCiphertextTally(self.object_id, self.contests)
 
     @staticmethod
     def _accumulate(
-        id: str, ballot_selections: Dict[BALLOT_ID, ElGamalCiphertext]
+        id: str, ciphertexts: List[ElGamalCiphertext]
     ) -> Tuple[str, ElGamalCiphertext]:
-        return (
-            id,
-            elgamal_add(*[ciphertext for ciphertext in ballot_selections.values()]),
-        )
+        return (id, elgamal_add(*ciphertexts))
 
     def _add_cast(
         self, ballot: SubmittedBallot, scheduler: Optional[Scheduler] = None
@@ -370,13 +416,17 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
                 contest_selections[selection.object_id] = CiphertextTallySelection(
                     selection.object_id,
                     selection.sequence_order,
-                    selection.crypto_hash(),
+                    get_optional(
+                        internal_manifest.selection_hash_for(
+                            contest.object_id, selection.object_id
+                        )
+                    ),
                 )
 
             cast_collection[contest.object_id] = CiphertextTallyContest(
                 contest.object_id,
                 contest.sequence_order,
-                contest.crypto_hash(),
+                get_optional(internal_manifest.contest_hash_for(contest.object_id)),
                 contest_selections,
             )
 
@@ -388,61 +438,61 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
             str, Dict[BALLOT_ID, ElGamalCiphertext]
         ],
         scheduler: Optional[Scheduler] = None,
+        chunk_size: Optional[int] = None,
     ) -> bool:
-        result_set: List[Tuple[SELECTION_ID, ElGamalCiphertext]]
-        if not scheduler:
-            scheduler = Scheduler()
-        result_set = scheduler.schedule(
-            self._accumulate,
-            [
-                (selection_id, selections)
-                for (
-                    selection_id,
-                    selections,
-                ) in ciphertext_selections_by_selection_id.items()
-            ],
-        )
-
-        result_dict = {
-            selection_id: ciphertext for (selection_id, ciphertext) in result_set
-        }
-
-        for contest in self.contests.values():
-            for selection_id, selection in contest.selections.items():
-                if selection_id in result_dict:
-                    selection.elgamal_accumulate(result_dict[selection_id])
+        """
+        Accumulate the ciphertexts of each selection into the tally.
 
-        return True
+        Each selection's ciphertexts are split into chunks that are reduced independently,
+        in worker processes when there is more than a chunk of work in total, and the partial
+        products of each selection are then multiplied together.
+        :param chunk_size: ciphertexts per chunk, by default `ACCUMULATE_CHUNK_SIZE`
+        """
+        if chunk_size is None:
+            chunk_size = ACCUMULATE_CHUNK_SIZE
+        chunks: List[Tuple[SELECTION_ID, List[ElGamalCiphertext]]] = []
+        ciphertext_count = 0
+        for (selection_id, selections) in ciphertext_selections_by_selection_id.items():
+            ciphertexts = list(selections.values())
+            ciphertext_count += len(ciphertexts)
+            for start in range(0, len(ciphertexts), chunk_size):
+                chunks.append((selection_id, ciphertexts[start : start + chunk_size]))
 
-    def _execute_accumulate_without_scheduler(
-        self,
-        ciphertext_selections_by_selection_id: Dict[
-            str, Dict[BALLOT_ID, ElGamalCiphertext]
-        ]
-    ) -> bool:
-        result_set: List[Tuple[SELECTION_ID, ElGamalCiphertext]] = []
+        result_set: List[Tuple[SELECTION_ID, ElGamalCiphertext]]
+        if len(chunks) <= 1 or ciphertext_count <= chunk_size:
+            # too little work to be worth sending to other processes
+            result_set = [self._accumulate(*chunk) for chunk in chunks]
+        elif scheduler is not None:
+            result_set = scheduler.schedule(self._accumulate, chunks)
+        else:
+            scheduler = Scheduler()
+            result_set = scheduler.schedule(self._accumulate, chunks)
+            scheduler.close()
 
-        for (selection_id,selections) in ciphertext_selections_by_selection_id.items():
-            result_set.append(self._accumulate(
-                selection_id, selections))
+        if len(result_set) != len(chunks):
+            log_warning("accumulate failed to reduce every chunk of the tally")
+            return False
 
-        result_dict = {
-            selection_id: ciphertext for (selection_id, ciphertext) in result_set
-        }
+        partials: Dict[SELECTION_ID, List[ElGamalCiphertext]] = {}
+        for (selection_id, ciphertext) in result_set:
+            partials.setdefault(selection_id, []).append(ciphertext)
 
         for contest in self.contests.values():
             for selection_id, selection in contest.selections.items():
-                if selection_id in result_dict:
-                    selection.elgamal_accumulate(result_dict[selection_id])
+                if selection_id in partials:
+                    selection.elgamal_accumulate(elgamal_add(*partials[selection_id]))
 
         return True
 
 
 def tally_ballot(
-    ballot: SubmittedBallot, tally: CiphertextTally
+    ballot: SubmittedBallot,
+    tally: CiphertextTally,
+    verified: Optional[BallotVerificationCache] = None,
 ) -> Optional[CiphertextTally]:
     """
     Tally a ballot that is either Cast or Spoiled
+    :param verified: ballots already verified by the ballot box, which are not verified again
     :return: The mutated CiphertextTally or None if there is an error
     """
 
@@ -452,7 +502,7 @@ def tally_ballot(
         )
         return None
 
-    if tally.append(ballot):
+    if tally.append(ballot, verified=verified):
         return tally
 
     return None
@@ -462,15 +512,152 @@ def tally_ballots(
     store: DataStore,
     internal_manifest: InternalManifest,
     context: CiphertextElectionContext,
+    verified: Optional[BallotVerificationCache] = None,
 ) -> Optional[CiphertextTally]:
     """
     Tally all of the ballots in the ballot store.
+    :param verified: ballots already verified by the ballot box, which are not verified again
     :return: a CiphertextTally or None if there is an error
     """
     # TODO: ISSUE #14: unique Id for the tally
     tally: CiphertextTally = CiphertextTally(
         "election-results", internal_manifest, context
     )
-    if tally.batch_append(store):
+    if tally.batch_append(store, verified=verified):
         return tally
     return None
+
+
+def merge_tallies(tallies: Sequence[CiphertextTally]) -> Optional[CiphertextTally]:
+    """
+    Merge partial tallies of the same election, such as the tallies of each polling site.
+    The partial tallies are left unchanged.
+    :return: a CiphertextTally or None if the tallies cannot be merged
+    """
+    if len(tallies) == 0:
+        log_warning("merge tallies requires at least one tally")
+        return None
+
+    # pylint: disable=protected-access
+    first = tallies[0]
+    result = CiphertextTally(
+        first.object_id, first._internal_manifest, first._encryption
+    )
+    for tally in tallies:
+        if not result.merge(tally):
+            return None
+    return result
+
+
+def merge_published_tallies(
+    tallies: Sequence[PublishedCiphertextTally],
+) -> Optional[PublishedCiphertextTally]:
+    """
+    Merge published partial tallies of the same election.
+
+    A published tally does not record its ballot id's, so unlike `CiphertextTally.merge`
+    this cannot detect a ballot that was counted in more than one of the tallies.
+    :return: a PublishedCiphertextTally or None if the tallies cannot be merged
+    """
+    if len(tallies) == 0:
+        log_warning("merge published tallies requires at least one tally")
+        return None
+
+    contests = _merge_contests([tally.contests for tally in tallies])
+    if contests is None:
+        return None
+    return PublishedCiphertextTally(tallies[0].object_id, contests)
+
+
+def tally_ballot_shards(
+    shards: Iterable[Iterable[SubmittedBallot]],
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    scheduler: Optional[Scheduler] = None,
+    verified: Optional[BallotVerificationCache] = None,
+) -> Optional[CiphertextTally]:
+    """
+    Tally each shard of ballots in its own process and merge the partial tallies.
+    A ballot must not appear in more than one shard.
+    :param verified: ballots already verified by the ballot box, which are not verified again
+    :return: a CiphertextTally or None if there is an error
+    """
+    arguments = [
+        (internal_manifest, context, list(shard), verified) for shard in shards
+    ]
+    if len(arguments) == 0:
+        return CiphertextTally("election-results", internal_manifest, context)
+
+    partial_tallies: List[CiphertextTally]
+    if scheduler is not None:
+        partial_tallies = scheduler.schedule(tally_shard, arguments)
+    else:
+        scheduler = Scheduler()
+        partial_tallies = scheduler.schedule(tally_shard, arguments)
+        scheduler.close()
+
+    if len(partial_tallies) != len(arguments):
+        log_warning("tally ballot shards failed to tally every shard")
+        return None
+
+    return merge_tallies(partial_tallies)
+
+
+def tally_shard(
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    ballots: Iterable[SubmittedBallot],
+    verified: Optional[BallotVerificationCache] = None,
+) -> CiphertextTally:
+    """
+    Tally one shard of ballots, synchronously, so it can run inside a worker process.
+    Ballots that cannot be appended are skipped.
+    """
+    tally = CiphertextTally("election-results", internal_manifest, context)
+    for ballot in ballots:
+        tally.append(ballot, verified=verified)
+    return tally
+
+
+def _merge_contests(
+    contest_collections: List[Dict[CONTEST_ID, CiphertextTallyContest]],
+) -> Optional[Dict[CONTEST_ID, CiphertextTallyContest]]:
+    """
+    Multiply together the selection ciphertexts of tally contests with the same structure
+    """
+    first = contest_collections[0]
+    merged: Dict[CONTEST_ID, CiphertextTallyContest] = {}
+    for (contest_id, contest) in first.items():
+        if any(
+            contest_id not in contests
+            or contests[contest_id].selections.keys() != contest.selections.keys()
+            for contests in contest_collections
+        ):
+            log_warning(f"merge cannot combine mismatched contest {contest_id}")
+            return None
+
+        selections: Dict[SELECTION_ID, CiphertextTallySelection] = {}
+        for (selection_id, selection) in contest.selections.items():
+            selections[selection_id] = CiphertextTallySelection(
+                selection.object_id,
+                selection.sequence_order,
+                selection.description_hash,
+                elgamal_add(
+                    *[
+                        contests[contest_id].selections[selection_id].ciphertext
+                        for contests in contest_collections
+                    ]
+                ),
+            )
+        merged[contest_id] = CiphertextTallyContest(
+            contest.object_id,
+            contest.sequence_order,
+            contest.description_hash,
+            selections,
+        )
+
+    if any(contests.keys() != first.keys() for contests in contest_collections):
+        log_warning("merge cannot combine tallies with mismatched contests")
+        return None
+
+    return merged
@@ -0,0 +1,255 @@
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from random import SystemRandom
+from threading import Condition, Thread
+import traceback
+from typing import Callable, Deque, List, Optional
+
+from .ballot import CiphertextBallot
+from .election import CiphertextElectionContext
+from .group import ElementModQ, register_fixed_base
+from .logs import log_warning
+from .utils import get_optional
+
+_sampler = SystemRandom()
+
+
+class VerificationMode(Enum):
+    """
+    When the proofs of a freshly encrypted ballot are verified
+    """
+
+    ALWAYS = "always"
+    """Verify every ballot before returning it"""
+    NEVER = "never"
+    """Never verify the ballots"""
+    SAMPLED = "sampled"
+    """Verify a random sample of the ballots before returning them"""
+    DEFERRED = "deferred"
+    """Return every ballot at once and verify it later with a `DeferredVerifier`"""
+
+
+class DeferredVerifier:
+    """
+    A queue of encrypted ballots that are verified after they were returned to the device,
+    so the device can show the ballot code without waiting for the verification.
+
+    Verify the queue with a background thread by calling `start`, or call `verify_pending`.
+    A ballot that fails verification is kept in `failures` and passed to `on_failure`,
+    so it can be flagged before it is cast.
+    """
+
+    manifest_hash: ElementModQ
+    context: CiphertextElectionContext
+    on_failure: Optional[Callable[[CiphertextBallot], None]]
+
+    _pending: Deque[CiphertextBallot]
+    _condition: Condition
+    _thread: Optional[Thread]
+    _running: bool
+    _in_progress: int
+    _verified: int
+    _failures: List[CiphertextBallot]
+
+    def __init__(
+        self,
+        manifest_hash: ElementModQ,
+        context: CiphertextElectionContext,
+        on_failure: Optional[Callable[[CiphertextBallot], None]] = None,
+    ) -> None:
+        """
+        :param manifest_hash: the hash of the election manifest
+        :param context: the cryptographic context of the election
+        :param on_failure: called with each ballot that fails verification
+        """
+        register_fixed_base(context.elgamal_public_key)
+        self.manifest_hash = manifest_hash
+        self.context = context
+        self.on_failure = on_failure
+        self._pending = deque()
+        self._condition = Condition()
+        self._thread = None
+        self._running = False
+        self._in_progress = 0
+        self._verified = 0
+        self._failures = []
+
+    def submit(self, ballot: CiphertextBallot) -> None:
+        """Queue an encrypted ballot for verification."""
+        with self._condition:
+            self._pending.append(ballot)
+            self._condition.notify_all()
+
+    def pending(self) -> int:
+        """Get the number of ballots waiting to be verified."""
+        with self._condition:
+            return len(self._pending) + self._in_progress
+
+    def verified(self) -> int:
+        """Get the number of ballots verified so far, whether they passed or failed."""
+        with self._condition:
+            return self._verified
+
+    def failures(self) -> List[CiphertextBallot]:
+        """Get the ballots that failed verification."""
+        with self._condition:
+            return list(self._failures)
+
+    def start(self) -> None:
+        """Start a background thread that verifies the ballots as they are queued."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = Thread(
+                target=self._verify_forever, name="deferred-verifier", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, if it is running. Queued ballots stay queued."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            thread.join()
+
+    def verify_pending(self) -> int:
+        """
+        Verify the queued ballots in this thread.
+
+        :return: The number of ballots verified
+        """
+        count = 0
+        while True:
+            ballot = self._next(wait=False)
+            if ballot is None:
+                return count
+            self._verify(ballot)
+            count += 1
+
+    def wait(self) -> None:
+        """Wait until every queued ballot is verified, verifying them here if no thread is running."""
+        with self._condition:
+            running = self._running
+        if not running:
+            self.verify_pending()
+        with self._condition:
+            while self._pending or self._in_progress:
+                self._condition.wait()
+
+    def _verify_forever(self) -> None:
+        while True:
+            ballot = self._next(wait=True)
+            if ballot is None:
+                return
+            self._verify(ballot)
+
+    def _next(self, wait: bool) -> Optional[CiphertextBallot]:
+        with self._condition:
+            while wait and self._running and not self._pending:
+                self._condition.wait()
+            if (wait and not self._running) or not self._pending:
+                return None
+            self._in_progress += 1
+            return self._pending.popleft()
+
+    def _verify(self, ballot: CiphertextBallot) -> None:
+        is_valid = False
+        try:
+            is_valid = ballot.is_valid_encryption(
+                self.manifest_hash,
+                self.context.elgamal_public_key,
+                self.context.crypto_extended_base_hash,
+            )
+        except Exception:  # pylint: disable=broad-except
+            log_warning(
+                f"deferred verification raised for ballot {ballot.object_id} with \n {traceback.format_exc()}"
+            )
+        finally:
+            with self._condition:
+                self._in_progress -= 1
+                self._verified += 1
+                if not is_valid:
+                    self._failures.append(ballot)
+                self._condition.notify_all()
+        if not is_valid:
+            log_warning(f"deferred verification failed for ballot {ballot.object_id}")
+            if self.on_failure is not None:
+                try:
+                    self.on_failure(ballot)
+                except Exception:  # pylint: disable=broad-except
+                    log_warning(
+                        f"deferred verification failure handler raised for ballot {ballot.object_id} with \n {traceback.format_exc()}"
+                    )
+
+
+@dataclass(frozen=True)
+class VerificationPolicy:
+    """
+    When `encrypt_ballot` verifies the proofs of the ballots it encrypts.
+
+    Verifying a ballot costs about as much as encrypting it. Sampling keeps a statistical
+    guarantee that a faulty device is caught, and deferring keeps every ballot verified
+    without delaying the ballot code.
+    """
+
+    mode: VerificationMode = VerificationMode.ALWAYS
+    sample_rate: float = 1.0
+    """The fraction of the ballots verified in `SAMPLED` mode"""
+    verifier: Optional[DeferredVerifier] = field(default=None, compare=False)
+    """The verifier ballots are queued on in `DEFERRED` mode"""
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.sample_rate <= 1.0:
+            raise ValueError(f"sample rate {self.sample_rate} is not between 0 and 1")
+        if self.mode == VerificationMode.DEFERRED and self.verifier is None:
+            raise ValueError("deferred verification needs a verifier")
+
+    @staticmethod
+    def always() -> "VerificationPolicy":
+        """Verify every ballot."""
+        return VerificationPolicy(VerificationMode.ALWAYS)
+
+    @staticmethod
+    def never() -> "VerificationPolicy":
+        """Verify no ballot."""
+        return VerificationPolicy(VerificationMode.NEVER)
+
+    @staticmethod
+    def sampled(sample_rate: float) -> "VerificationPolicy":
+        """Verify each ballot with the given probability."""
+        return VerificationPolicy(VerificationMode.SAMPLED, sample_rate)
+
+    @staticmethod
+    def deferred(verifier: DeferredVerifier) -> "VerificationPolicy":
+        """Queue every ballot on the verifier."""
+        return VerificationPolicy(VerificationMode.DEFERRED, verifier=verifier)
+
+    def check(
+        self,
+        ballot: CiphertextBallot,
+        manifest_hash: ElementModQ,
+        context: CiphertextElectionContext,
+    ) -> bool:
+        """
+        Apply the policy to a freshly encrypted ballot.
+
+        :return: False if the ballot was verified now and is invalid, otherwise True
+        """
+        if self.mode == VerificationMode.DEFERRED:
+            get_optional(self.verifier).submit(ballot)
+            return True
+        if self.mode == VerificationMode.ALWAYS or (
+            self.mode == VerificationMode.SAMPLED
+            and _sampler.random() < self.sample_rate
+        ):
+            return ballot.is_valid_encryption(
+                manifest_hash,
+                context.elgamal_public_key,
+                context.crypto_extended_base_hash,
+            )
+        return True
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Optional
+
+from .ballot import (
+    CiphertextBallot,
+    CiphertextBallotSelection,
+    make_ciphertext_ballot_selection,
+)
+from .election import CiphertextElectionContext
+from .elgamal import elgamal_encrypt
+from .group import ElementModQ
+from .manifest import InternalManifest
+from .nonce_plan import plan_contest_nonces
+from .utils import get_optional
+
+
+@dataclass(frozen=True)
+class ZeroEncryption:
+    """
+    A selection encrypted as 0 with its proof, bound to the nonces it was encrypted with
+    """
+
+    selection: CiphertextBallotSelection
+    """The encrypted selection, whose nonce is the selection nonce"""
+
+    proof_seed: ElementModQ
+    """The seed the disjunctive Chaum-Pedersen proof nonces were drawn from"""
+
+
+class ZeroEncryptionStore:
+    """
+    Encryptions of 0, with their proofs, precomputed for the ballots about to be encrypted.
+
+    Most selections of a ballot are 0: the unselected choices and most placeholders. Every nonce
+    of a ballot is derived from its nonce seed, so once the ballot's id and master nonce are known,
+    such as while the voter marks the ballot, `prepare` can encrypt every selection of its style as 0.
+    `encrypt_ballot` then takes the entry bound to each planned selection nonce for the selections
+    that are 0, and only encrypts the others. The nonces are derived exactly as without the store,
+    so the ballot is identical and can still be decrypted and audited from its master nonce.
+    """
+
+    internal_manifest: InternalManifest
+    context: CiphertextElectionContext
+
+    _entries: Dict[ElementModQ, ZeroEncryption]
+    _entries_by_seed: Dict[ElementModQ, List[ElementModQ]]
+    _lock: Lock
+
+    def __init__(
+        self, internal_manifest: InternalManifest, context: CiphertextElectionContext
+    ) -> None:
+        """
+        :param internal_manifest: the `InternalManifest` of the election
+        :param context: the cryptographic context of the election
+        """
+        self.internal_manifest = internal_manifest
+        self.context = context
+        self._entries = {}
+        self._entries_by_seed = {}
+        self._lock = Lock()
+
+    def depth(self) -> int:
+        """Get the number of precomputed encryptions of 0 ready to use."""
+        with self._lock:
+            return len(self._entries)
+
+    def prepare(
+        self, ballot_id: str, style_id: str, master_nonce: ElementModQ
+    ) -> ElementModQ:
+        """
+        Encrypt every selection and placeholder of a ballot style as 0 for a ballot.
+
+        :param ballot_id: the object_id the ballot will have
+        :param style_id: the ballot style of the ballot
+        :param master_nonce: the master nonce the ballot will be encrypted with, see `master_nonce_for`
+        :return: the ballot's nonce seed, which the precomputed encryptions are bound to
+        """
+        nonce_seed = CiphertextBallot.nonce_seed(
+            self.internal_manifest.manifest_hash, ballot_id, master_nonce
+        )
+        entries: List[ZeroEncryption] = []
+        for contest in self.internal_manifest.get_contests_for(style_id):
+            contest_nonces = plan_contest_nonces(
+                contest, self.internal_manifest, nonce_seed
+            )
+            for description, is_placeholder in [
+                (selection, False) for selection in contest.ballot_selections
+            ] + [(selection, True) for selection in contest.placeholder_selections]:
+                nonces = contest_nonces.selections[description.object_id]
+                ciphertext = get_optional(
+                    elgamal_encrypt(
+                        0, nonces.selection_nonce, self.context.elgamal_public_key
+                    )
+                )
+                entries.append(
+                    ZeroEncryption(
+                        make_ciphertext_ballot_selection(
+                            description.object_id,
+                            description.sequence_order,
+                            get_optional(
+                                self.internal_manifest.selection_hash_for(
+                                    contest.object_id, description.object_id
+                                )
+                            ),
+                            ciphertext,
+                            self.context.elgamal_public_key,
+                            self.context.crypto_extended_base_hash,
+                            nonces.proof_seed,
+                            0,
+                            is_placeholder,
+                            nonces.selection_nonce,
+                        ),
+                        nonces.proof_seed,
+                    )
+                )
+
+        with self._lock:
+            for entry in entries:
+                self._entries[get_optional(entry.selection.nonce)] = entry
+            self._entries_by_seed.setdefault(nonce_seed, []).extend(
+                get_optional(entry.selection.nonce) for entry in entries
+            )
+        return nonce_seed
+
+    def take(self, selection_nonce: ElementModQ) -> Optional[ZeroEncryption]:
+        """
+        Remove the encryption of 0 bound to a selection nonce from the store.
+        Each entry is handed out at most once.
+        """
+        with self._lock:
+            return self._entries.pop(selection_nonce, None)
+
+    def release(self, nonce_seed: ElementModQ) -> int:
+        """
+        Discard the encryptions of 0 left for a ballot, such as for its selections that were not 0.
+
+        :param nonce_seed: the ballot's nonce seed, as returned by `prepare`
+        :return: the number of entries discarded
+        """
+        with self._lock:
+            selection_nonces = self._entries_by_seed.pop(nonce_seed, [])
+            return sum(
+                1
+                for selection_nonce in selection_nonces
+                if self._entries.pop(selection_nonce, None) is not None
+            )
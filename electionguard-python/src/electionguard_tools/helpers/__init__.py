@@ -1,10 +1,18 @@
+from electionguard_tools.helpers import encryption_server
 from electionguard_tools.helpers import export
 from electionguard_tools.helpers import identity_encrypt
 from electionguard_tools.helpers import key_ceremony_orchestrator
 from electionguard_tools.helpers import serialize
 from electionguard_tools.helpers import tally_accumulate
 from electionguard_tools.helpers import tally_ceremony_orchestrator
+from electionguard_tools.helpers import tally_shards
 
+from electionguard_tools.helpers.encryption_server import (
+    BALLOTS_PATH,
+    MAX_BODY_SIZE,
+    server_address,
+    start_encryption_server,
+)
 from electionguard_tools.helpers.export import (
     BALLOT_PREFIX,
     COEFFICIENTS_FILE_NAME,
@@ -52,8 +60,15 @@ from electionguard_tools.helpers.tally_accumulate import (
 from electionguard_tools.helpers.tally_ceremony_orchestrator import (
     TallyCeremonyOrchestrator,
 )
+from electionguard_tools.helpers.tally_shards import (
+    shard_ballot_files,
+    tally_ballot_directory,
+    tally_ballot_files,
+)
 
 __all__ = [
+    "BALLOTS_PATH",
+    "MAX_BODY_SIZE",
     "BALLOT_PREFIX",
     "COEFFICIENTS_FILE_NAME",
     "CONSTANTS_FILE_NAME",
@@ -79,6 +94,7 @@ __all__ = [
     "custom_encoder",
     "ElementModP_KEYS",
     "ElementModQ_KEYS",
+    "encryption_server",
     "export",
     "export_private_data",
     "from_file_to_dataclass",
@@ -90,8 +106,14 @@ __all__ = [
     "identity_encrypt",
     "key_ceremony_orchestrator",
     "serialize",
+    "server_address",
+    "shard_ballot_files",
+    "start_encryption_server",
     "tally_accumulate",
+    "tally_ballot_directory",
+    "tally_ballot_files",
     "tally_ceremony_orchestrator",
+    "tally_shards",
     "to_file",
     "to_raw",
 ]
@@ -0,0 +1,124 @@
+"""
+Sample local endpoint for an `AsyncEncryptionMediator`.
+
+Ballot-marking devices POST a plaintext ballot as JSON to `/devices/{device_id}/ballots`
+and receive the encrypted ballot as JSON. It speaks just enough HTTP/1.1 for local use
+over TCP or a Unix socket, one request per connection.
+
+WARNING: Not for production use.
+"""
+
+import asyncio
+import json
+from typing import Optional, Tuple
+
+from electionguard.ballot import PlaintextBallot
+from electionguard.encrypt_service import AsyncEncryptionMediator
+from electionguard.logs import log_warning
+
+from .serialize import from_raw, to_raw
+
+BALLOTS_PATH = "/devices/{device_id}/ballots"
+MAX_BODY_SIZE = 1 << 20
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+}
+
+
+async def start_encryption_server(
+    mediator: AsyncEncryptionMediator,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    unix_path: Optional[str] = None,
+) -> asyncio.AbstractServer:
+    """
+    Serve a started mediator over local HTTP.
+
+    :param mediator: the started `AsyncEncryptionMediator`
+    :param host: the host to listen on
+    :param port: the port to listen on, by default any free port
+    :param unix_path: the path of a Unix socket to listen on instead of TCP
+    :return: the server; close it with `close` and `wait_closed`
+    """
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            status, body = await _handle_request(mediator, reader)
+        except (asyncio.IncompleteReadError, ValueError) as error:
+            status, body = 400, _error_body(str(error))
+        try:
+            writer.write(
+                f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    if unix_path is not None:
+        return await asyncio.start_unix_server(handle, unix_path)
+    return await asyncio.start_server(handle, host, port)
+
+
+def server_address(server: asyncio.AbstractServer) -> Tuple[str, int]:
+    """Get the host and port a TCP server listens on, such as when started on port 0."""
+    host, port = server.sockets[0].getsockname()[:2]
+    return host, port
+
+
+async def _handle_request(
+    mediator: AsyncEncryptionMediator, reader: asyncio.StreamReader
+) -> Tuple[int, bytes]:
+    request_line = (await reader.readuntil(b"\r\n")).decode().split()
+    if len(request_line) != 3:
+        raise ValueError("malformed request line")
+    method, target, _version = request_line
+
+    content_length = 0
+    while True:
+        header = (await reader.readuntil(b"\r\n")).decode().strip()
+        if not header:
+            break
+        name, _, value = header.partition(":")
+        if name.strip().lower() == "content-length":
+            content_length = int(value.strip())
+
+    segments = target.strip("/").split("/")
+    if len(segments) != 3 or segments[0] != "devices" or segments[2] != "ballots":
+        return 404, _error_body(f"no route for {target}")
+    if method != "POST":
+        return 405, _error_body(f"{method} is not allowed")
+    if content_length > MAX_BODY_SIZE:
+        return 413, _error_body("ballot is too large")
+    try:
+        device_id = int(segments[1])
+    except ValueError:
+        return 404, _error_body(f"no device {segments[1]}")
+    if not mediator.is_registered(device_id):
+        return 404, _error_body(f"no device {device_id}")
+
+    body = await reader.readexactly(content_length)
+    try:
+        ballot = from_raw(PlaintextBallot, body)
+    except Exception as error:  # pylint: disable=broad-except
+        log_warning(f"encryption server received a malformed ballot: {error}")
+        return 400, _error_body("malformed ballot")
+
+    encrypted_ballot = await mediator.encrypt(device_id, ballot)
+    if encrypted_ballot is None:
+        return 422, _error_body(f"could not encrypt {ballot.object_id}")
+    return 200, to_raw(encrypted_ballot).encode()
+
+
+def _error_body(message: str) -> bytes:
+    return json.dumps({"error": message}).encode()
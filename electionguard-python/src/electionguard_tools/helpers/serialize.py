@@ -134,6 +134,8 @@ def from_list_in_file_to_dataclass(
     return cast(dataclass_type_, parse_obj_as(List[dataclass_type_], data))
 
 def replace_elements_from_key(key: str, item: Any) -> Any:
+    if item is None or isinstance(item, bool):
+        return item
     if key in INT_KEYS:
         return int(item)
     elif key in BOOLEAN_KEYS:
@@ -0,0 +1,95 @@
+"""
+Sample tool to tally a directory of exported ballots as independent shards.
+
+Each shard of ballot files is loaded and tallied in its own process, and the
+partial tallies are then merged, so the work scales with the number of processes.
+"""
+
+from os import listdir, path
+from typing import List, Optional
+
+from electionguard.ballot import SubmittedBallot
+from electionguard.election import CiphertextElectionContext
+from electionguard.logs import log_warning
+from electionguard.manifest import InternalManifest
+from electionguard.scheduler import Scheduler
+from electionguard.tally import CiphertextTally, merge_tallies, tally_shard
+
+from .export import BALLOT_PREFIX
+from .serialize import from_file_to_dataclass
+
+
+def shard_ballot_files(directory: str, shard_count: int) -> List[List[str]]:
+    """
+    Split the exported ballot files of a directory into shards of about the same size.
+
+    :param directory: directory of ballots exported with `BALLOT_PREFIX`
+    :param shard_count: the number of shards to split the ballot files into
+    :return: a list of shards, each a list of ballot file paths
+    """
+    file_paths = sorted(
+        path.join(directory, file_name)
+        for file_name in listdir(directory)
+        if file_name.startswith(BALLOT_PREFIX) and file_name.endswith(".json")
+    )
+    shard_count = max(1, min(shard_count, len(file_paths)))
+    return [file_paths[index::shard_count] for index in range(shard_count)]
+
+
+def tally_ballot_files(
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    file_paths: List[str],
+) -> CiphertextTally:
+    """
+    Load and tally one shard of ballot files.
+
+    :param internal_manifest: the internal manifest of the election
+    :param context: the ciphertext election context
+    :param file_paths: the ballot files of the shard
+    :return: the partial tally of the shard
+    """
+    ballots = [
+        from_file_to_dataclass(SubmittedBallot, file_path) for file_path in file_paths
+    ]
+    return tally_shard(internal_manifest, context, ballots)
+
+
+def tally_ballot_directory(
+    directory: str,
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    shard_count: Optional[int] = None,
+    scheduler: Optional[Scheduler] = None,
+) -> Optional[CiphertextTally]:
+    """
+    Tally a directory of exported ballots by tallying shards of it in parallel
+    and merging the partial tallies.
+
+    :param directory: directory of ballots exported with `BALLOT_PREFIX`
+    :param internal_manifest: the internal manifest of the election
+    :param context: the ciphertext election context
+    :param shard_count: the number of shards, by default one per CPU
+    :param scheduler: the scheduler to run the shards on
+    :return: a CiphertextTally or None if there is an error
+    """
+    shards = shard_ballot_files(
+        directory, shard_count if shard_count else Scheduler.cpu_count()
+    )
+    arguments = [(internal_manifest, context, shard) for shard in shards]
+
+    partial_tallies: List[CiphertextTally]
+    if scheduler is not None:
+        partial_tallies = scheduler.schedule(tally_ballot_files, arguments)
+    else:
+        scheduler = Scheduler()
+        partial_tallies = scheduler.schedule(tally_ballot_files, arguments)
+        scheduler.close()
+
+    if len(partial_tallies) != len(arguments):
+        log_warning(
+            f"tally ballot directory failed to tally every shard of {directory}"
+        )
+        return None
+
+    return merge_tallies(partial_tallies)
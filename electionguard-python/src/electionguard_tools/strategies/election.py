@@ -613,7 +613,7 @@ def plaintext_voted_ballot(draw: _DrawType, internal_manifest: InternalManifest)
     for contest in contests:
         assert contest.is_valid(), "every contest needs to be valid"
         n = contest.number_elected  # we need exactly this many 1's, and the rest 0's
-        ballot_selections = contest.ballot_selections
+        ballot_selections = list(contest.ballot_selections)
         assert len(ballot_selections) >= n
 
         random = Random(draw(integers()))
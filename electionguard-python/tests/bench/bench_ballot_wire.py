@@ -0,0 +1,57 @@
+from timeit import default_timer as timer
+
+from electionguard.ballot import CiphertextBallot
+from electionguard.ballot_wire import decode_ballot, encode_ballot
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import encrypt_ballot
+from electionguard.group import int_to_q
+from electionguard.utils import get_optional
+
+import electionguard_tools.factories.ballot_factory as BallotFactory
+import electionguard_tools.factories.election_factory as ElectionFactory
+from electionguard_tools.helpers.serialize import from_raw, to_raw
+
+if __name__ == "__main__":
+    runs = 20
+    keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+    election_factory = ElectionFactory.ElectionFactory()
+    internal_manifest, context = election_factory.get_fake_ciphertext_election(
+        election_factory.get_simple_manifest_from_file(), keypair.public_key
+    )
+    ballot = get_optional(
+        encrypt_ballot(
+            BallotFactory.BallotFactory().get_simple_ballot_from_file(),
+            internal_manifest,
+            context,
+            election_factory.get_encryption_device().get_hash(),
+        )
+    )
+
+    start = timer()
+    for _ in range(runs):
+        json = to_raw(ballot)
+    json_encode = (timer() - start) / runs
+    start = timer()
+    for _ in range(runs):
+        from_raw(CiphertextBallot, json)
+    json_decode = (timer() - start) / runs
+
+    start = timer()
+    for _ in range(runs):
+        wire = encode_ballot(ballot)
+    wire_encode = (timer() - start) / runs
+    view = memoryview(wire)
+    start = timer()
+    for _ in range(runs):
+        decode_ballot(view)
+    wire_decode = (timer() - start) / runs
+
+    print(f"Ballot of {len(ballot.contests)} contests")
+    print(f"  json: {len(json):8d} bytes")
+    print(f"  wire: {len(wire):8d} bytes ({len(json) / len(wire):.2f}x smaller)")
+    print(
+        f"  encode: json {json_encode * 1000:7.2f} ms, wire {wire_encode * 1000:7.2f} ms"
+    )
+    print(
+        f"  decode: json {json_decode * 1000:7.2f} ms, wire {wire_decode * 1000:7.2f} ms"
+    )
@@ -0,0 +1,42 @@
+from timeit import default_timer as timer
+
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import EncryptionMediator
+from electionguard.group import int_to_q
+from electionguard.scheduler import Scheduler
+from electionguard.utils import get_optional
+
+import electionguard_tools.factories.ballot_factory as BallotFactory
+import electionguard_tools.factories.election_factory as ElectionFactory
+
+if __name__ == "__main__":
+    ballot_count = 64
+    keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+    election_factory = ElectionFactory.ElectionFactory()
+    internal_manifest, context = election_factory.get_fake_ciphertext_election(
+        election_factory.get_simple_manifest_from_file(), keypair.public_key
+    )
+    samples = BallotFactory.BallotFactory().get_simple_ballots_from_file()
+    ballots = [samples[i % len(samples)] for i in range(ballot_count)]
+
+    with Scheduler() as scheduler:
+        mediator = EncryptionMediator(
+            internal_manifest,
+            context,
+            election_factory.get_encryption_device(),
+            scheduler=scheduler,
+        )
+
+        start = timer()
+        for ballot in ballots:
+            mediator.encrypt(ballot)
+        serial = timer() - start
+
+        for _ in mediator.encrypt_stream(ballots):
+            pass
+        stats = mediator.stream_stats()
+
+    print(f"Workers: {scheduler.cpu_count()}, ballots: {ballot_count}")
+    print(f"  one at a time: {ballot_count / serial:8.2f} ballots/sec")
+    print(f"  stream       : {stats.ballots_per_second:8.2f} ballots/sec")
+    print(f"  speedup      : {stats.ballots_per_second * serial / ballot_count:8.2f}x")
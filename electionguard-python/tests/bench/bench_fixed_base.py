@@ -0,0 +1,53 @@
+from timeit import default_timer as timer
+from typing import Callable, List
+
+from statistics import mean
+
+# pylint: disable=no-name-in-module
+from gmpy2 import mpz, powmod
+
+from electionguard.constants import get_generator, get_large_prime
+from electionguard.group import FixedBaseTable, ElementModQ, rand_q
+
+
+def time_per_call(
+    func: Callable[[ElementModQ], object], exponents: List[ElementModQ]
+) -> float:
+    """Average time (in seconds) to call the function once per exponent."""
+    timings = []
+    for exponent in exponents:
+        start = timer()
+        func(exponent)
+        timings.append(timer() - start)
+    return mean(timings)
+
+
+if __name__ == "__main__":
+    iterations = 500
+    window_sizes = (4, 6, 8, 10)
+    g = mpz(get_generator())
+    p = mpz(get_large_prime())
+    exponents = [rand_q() for _ in range(iterations)]
+
+    print(f"Benchmarking g^e mod p ({iterations} iterations)")
+    baseline = time_per_call(lambda e: powmod(g, mpz(e), p), exponents)
+    print(f"  gmpy2.powmod: {baseline * 1000:.3f} ms")
+
+    print()
+    print("Window / Build (sec) / Entries / Memory (MB) / Avg (ms) / Speedup")
+    for window_size in window_sizes:
+        build_start = timer()
+        table = FixedBaseTable(get_generator(), window_size)
+        build_time = timer() - build_start
+
+        for e in exponents[:10]:
+            assert int(table.pow(e)) == int(
+                powmod(g, mpz(e), p)
+            ), "Table result mismatch!"
+
+        average = time_per_call(table.pow, exponents)
+        print(
+            f"{window_size:6d} / {build_time:11.3f} / {table.entry_count():7d} / "
+            f"{table.memory_size() / 1_000_000:11.2f} / {average * 1000:8.3f} / "
+            f"{baseline / average:.2f}x"
+        )
@@ -0,0 +1,72 @@
+from timeit import default_timer as timer
+from typing import List
+
+from statistics import mean
+
+from electionguard.ballot import CiphertextBallot
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import encrypt_ballot
+from electionguard.group import ElementModQ, int_to_q
+from electionguard.manifest import InternalManifest
+from electionguard.nonce_plan import plan_ballot_nonces
+from electionguard.nonces import Nonces
+from electionguard.utils import get_optional
+
+import electionguard_tools.factories.ballot_factory as BallotFactory
+import electionguard_tools.factories.election_factory as ElectionFactory
+
+
+def derive_nonces_one_by_one(
+    internal_manifest: InternalManifest, style_id: str, nonce_seed: ElementModQ
+) -> List[ElementModQ]:
+    """Derive a ballot's nonces the way encryption did before the nonce planner."""
+    derived: List[ElementModQ] = []
+    for contest in internal_manifest.get_contests_for(style_id):
+        contest_sequence = Nonces(contest.crypto_hash(), nonce_seed)
+        contest_nonce = contest_sequence[contest.sequence_order]
+        derived += [contest_nonce, next(iter(contest_sequence))]
+        for selection in contest.ballot_selections + contest.placeholder_selections:
+            selection_sequence = Nonces(selection.crypto_hash(), contest_nonce)
+            derived += [
+                selection_sequence[selection.sequence_order],
+                next(iter(selection_sequence)),
+            ]
+    return derived
+
+
+if __name__ == "__main__":
+    iterations = 50
+    keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+    election_factory = ElectionFactory.ElectionFactory()
+    internal_manifest, context = election_factory.get_fake_ciphertext_election(
+        election_factory.get_simple_manifest_from_file(), keypair.public_key
+    )
+    ballot = BallotFactory.BallotFactory().get_simple_ballots_from_file()[0]
+    nonce_seed = CiphertextBallot.nonce_seed(
+        internal_manifest.manifest_hash, ballot.object_id, int_to_q(1)
+    )
+
+    timings = {}
+    for name, derive in (
+        ("one by one", derive_nonces_one_by_one),
+        ("planned", plan_ballot_nonces),
+    ):
+        samples = []
+        for _ in range(iterations):
+            start = timer()
+            derive(internal_manifest, ballot.style_id, nonce_seed)
+            samples.append(timer() - start)
+        timings[name] = mean(samples)
+
+    start = timer()
+    encrypt_ballot(ballot, internal_manifest, context, int_to_q(1))
+    encryption = timer() - start
+
+    print(f"Nonce derivation for one ballot ({iterations} iterations)")
+    for name, timing in timings.items():
+        print(f"  {name:10s}: {timing * 1000:8.3f} ms")
+    print(f"  speedup   : {timings['one by one'] / timings['planned']:8.2f}x")
+    print(
+        f"  planner share of ballot encryption ({encryption:.3f} sec): "
+        f"{timings['planned'] / encryption * 100:.2f}%"
+    )
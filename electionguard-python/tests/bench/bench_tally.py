@@ -0,0 +1,54 @@
+from timeit import default_timer as timer
+from typing import Dict, List
+
+from electionguard.elgamal import (
+    ElGamalCiphertext,
+    elgamal_add,
+    elgamal_encrypt,
+    elgamal_keypair_from_secret,
+)
+from electionguard.group import ONE_MOD_Q, int_to_q, rand_range_q
+from electionguard.scheduler import Scheduler
+from electionguard.tally import CiphertextTally
+from electionguard.utils import get_optional
+
+import electionguard_tools.factories.election_factory as ElectionFactory
+
+if __name__ == "__main__":
+    problem_sizes = (10_000, 50_000, 100_000)
+    keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+    election_factory = ElectionFactory.ElectionFactory()
+    internal_manifest, context = election_factory.get_fake_ciphertext_election(
+        election_factory.get_fake_manifest(), keypair.public_key
+    )
+
+    # encrypting is far slower than accumulating, so reuse a small set of ciphertexts
+    samples: List[ElGamalCiphertext] = [
+        get_optional(
+            elgamal_encrypt(i % 2, rand_range_q(ONE_MOD_Q), keypair.public_key)
+        )
+        for i in range(100)
+    ]
+
+    with Scheduler() as scheduler:
+        print(f"Workers: {scheduler.cpu_count()}")
+        print("Ballots / Serial (sec) / Parallel (sec) / Speedup")
+        for size in problem_sizes:
+            ciphertexts: Dict[str, ElGamalCiphertext] = {
+                f"ballot-{i}": samples[i % len(samples)] for i in range(size)
+            }
+
+            start = timer()
+            elgamal_add(*ciphertexts.values())
+            serial = timer() - start
+
+            tally = CiphertextTally("bench", internal_manifest, context)
+            selection_id = next(iter(next(iter(tally.contests.values())).selections))
+            start = timer()
+            # pylint: disable=protected-access
+            tally._execute_accumulate({selection_id: ciphertexts}, scheduler)
+            parallel = timer() - start
+
+            print(
+                f"{size:7d} / {serial:12.3f} / {parallel:14.3f} / {serial / parallel:.2f}x"
+            )
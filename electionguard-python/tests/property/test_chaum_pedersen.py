@@ -12,13 +12,22 @@ from electionguard.chaum_pedersen import (
     make_chaum_pedersen,
     make_constant_chaum_pedersen,
     make_disjunctive_chaum_pedersen,
+    verify_disjunctive_chaum_pedersen_batch,
 )
 from electionguard.elgamal import (
     ElGamalKeyPair,
+    elgamal_add,
     elgamal_encrypt,
     elgamal_keypair_from_secret,
 )
-from electionguard.group import ElementModQ, TWO_MOD_Q, ONE_MOD_Q, int_to_p, TWO_MOD_P
+from electionguard.group import (
+    ElementModQ,
+    TWO_MOD_Q,
+    ONE_MOD_Q,
+    int_to_p,
+    TWO_MOD_P,
+)
+from electionguard.nonces import Nonces
 from electionguard.utils import get_optional
 from electionguard_tools.strategies.elgamal import elgamal_keypairs
 from electionguard_tools.strategies.group import elements_mod_q_no_zero, elements_mod_q
@@ -129,6 +138,58 @@ class TestDisjunctiveChaumPedersen(BaseTestCase):
         self.assertFalse(proof.is_valid(message_bad, keypair.public_key, ONE_MOD_Q))
 
 
+class TestDisjunctiveChaumPedersenBatch(BaseTestCase):
+    """Disjunctive Chaum Pedersen batch verification tests"""
+
+    @settings(
+        deadline=timedelta(milliseconds=10000),
+        suppress_health_check=[HealthCheck.too_slow],
+        max_examples=5,
+    )
+    @given(elgamal_keypairs(), elements_mod_q(), integers(1, 8))
+    def test_djcp_batch(self, keypair: ElGamalKeyPair, seed: ElementModQ, size: int):
+        # Arrange
+        proofs = []
+        nonces = Nonces(seed, "djcp-batch")
+        for i in range(size):
+            nonce = nonces[i]
+            plaintext = i % 2
+            message = get_optional(
+                elgamal_encrypt(plaintext, nonce, keypair.public_key)
+            )
+            proof = make_disjunctive_chaum_pedersen(
+                message, nonce, keypair.public_key, ONE_MOD_Q, seed, plaintext
+            )
+            proofs.append((proof, message))
+
+        # Act
+        results = verify_disjunctive_chaum_pedersen_batch(
+            proofs, keypair.public_key, ONE_MOD_Q, batch_size=3
+        )
+
+        # Assert
+        self.assertEqual([True] * size, results)
+
+        # Arrange
+        (bad_proof, bad_message) = proofs[-1]
+        proofs[-1] = (bad_proof, elgamal_add(bad_message, bad_message))
+
+        # Act
+        results = verify_disjunctive_chaum_pedersen_batch(
+            proofs, keypair.public_key, ONE_MOD_Q, batch_size=3
+        )
+
+        # Assert
+        self.assertEqual([True] * (size - 1) + [False], results)
+
+    def test_djcp_batch_empty(self):
+        keypair = elgamal_keypair_from_secret(TWO_MOD_Q)
+        self.assertEqual(
+            [],
+            verify_disjunctive_chaum_pedersen_batch([], keypair.public_key, ONE_MOD_Q),
+        )
+
+
 class TestChaumPedersen(BaseTestCase):
     """Chaum Pedersen tests"""
 
@@ -1,4 +1,9 @@
+# pylint: disable=protected-access
 import asyncio
+from os import environ, path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
 from hypothesis import given
 from hypothesis.strategies import integers
 
@@ -9,6 +14,10 @@ from electionguard.discrete_log import (
     compute_discrete_log,
     discrete_log_async,
     DiscreteLog,
+    DiscreteLogTable,
+    DLOG_MAX,
+    DLOG_TABLE_ENV,
+    MappedDiscreteLogTable,
 )
 from electionguard.group import (
     ElementModP,
@@ -129,3 +138,78 @@ class TestDiscreteLogClass(BaseTestCase):
 
         # Assert
         self.assertEqual(plaintext, plaintext_again)
+
+
+class TestDiscreteLogTable(BaseTestCase):
+    """Baby-step giant-step discrete log tests"""
+
+    def setUp(self):
+        self.table = DiscreteLogTable(10_000)
+
+    @given(integers(0, 10_000))
+    def test_discrete_log(self, exp: int):
+        # Arrange
+        exp_plaintext = g_pow_p(ElementModQ(exp))
+
+        # Act
+        plaintext_again = self.table.discrete_log(exp_plaintext)
+
+        # Assert
+        self.assertEqual(exp, plaintext_again)
+
+    def test_discrete_log_above_upper_bound_fails(self):
+        with self.assertRaises(ValueError):
+            self.table.discrete_log(g_pow_p(ElementModQ(10_001)))
+
+    def test_save_and_load(self):
+        with TemporaryDirectory() as directory:
+            # Arrange
+            file_path = path.join(directory, "dlog.bin")
+
+            # Act
+            self.table.save(file_path)
+            loaded = DiscreteLogTable.load(file_path)
+
+            # Assert
+            self.assertIsInstance(loaded, MappedDiscreteLogTable)
+            self.assertEqual(self.table.upper_bound, loaded.upper_bound)
+            self.assertEqual(self.table.baby_step_count, loaded.baby_step_count)
+            self.assertEqual(1234, loaded.discrete_log(g_pow_p(ElementModQ(1234))))
+            loaded.close()
+
+    def test_load_invalid_file_fails(self):
+        with TemporaryDirectory() as directory:
+            # Arrange
+            file_path = path.join(directory, "dlog.bin")
+            with open(file_path, "wb") as table_file:
+                table_file.write(b"not a table")
+
+            # Act & Assert
+            with self.assertRaises(ValueError):
+                DiscreteLogTable.load(file_path)
+
+    def test_table_from_environment(self):
+        with TemporaryDirectory() as directory:
+            # Arrange
+            file_path = path.join(directory, "dlog.bin")
+            self.table.save(file_path)
+            DiscreteLog._table = None
+
+            # Act
+            with patch.dict(environ, {DLOG_TABLE_ENV: file_path}):
+                table = DiscreteLog().get_table()
+
+            # Assert
+            self.assertIsInstance(table, MappedDiscreteLogTable)
+            self.assertEqual(42, DiscreteLog().discrete_log(g_pow_p(ElementModQ(42))))
+            table.close()
+            DiscreteLog._table = None
+
+    def test_set_upper_bound(self):
+        # Act
+        table = DiscreteLog().set_upper_bound(500)
+
+        # Assert
+        self.assertEqual(500, table.upper_bound)
+        self.assertEqual(500, DiscreteLog().discrete_log(g_pow_p(ElementModQ(500))))
+        DiscreteLog().set_upper_bound(DLOG_MAX)
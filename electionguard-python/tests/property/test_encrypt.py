@@ -26,6 +26,7 @@ from electionguard.elgamal import (
     elgamal_add,
 )
 from electionguard.encrypt import (
+    EncryptionMediator,
     EncryptionDevice,
     contest_from,
     encrypt_ballot,
@@ -53,6 +54,8 @@ from electionguard.group import (
     add_q,
     TWO_MOD_P,
     mult_p,
+    get_fixed_base_table,
+    rand_q,
 )
 from electionguard.manifest import (
     ContestDescription,
@@ -62,6 +65,8 @@ from electionguard.manifest import (
     SelectionDescription,
     VoteVariationType,
 )
+from electionguard.scheduler import Scheduler
+from electionguard.verification import DeferredVerifier, VerificationPolicy
 
 from electionguard_tools.strategies.elgamal import elgamal_keypairs
 from electionguard_tools.strategies.group import elements_mod_q_no_zero
@@ -688,6 +693,146 @@ class TestEncrypt(BaseTestCase):
             )
         )
 
+    def test_encrypt_ballot_with_scheduler_matches_serial(self) -> None:
+        # Arrange
+        keypair = elgamal_keypair_from_secret(int_to_q(2))
+        manifest = election_factory.get_simple_manifest_from_file()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+        ballot = ballot_factory.get_simple_ballot_from_file()
+
+        # Act
+        serial = encrypt_ballot(ballot, internal_manifest, context, SEED, TWO_MOD_Q)
+        with Scheduler() as scheduler:
+            parallel = encrypt_ballot(
+                ballot,
+                internal_manifest,
+                context,
+                SEED,
+                TWO_MOD_Q,
+                scheduler=scheduler,
+            )
+
+        # Assert
+        self.assertIsNotNone(parallel)
+        self.assertEqual(serial.contests, parallel.contests)
+        self.assertEqual(serial.crypto_hash, parallel.crypto_hash)
+        self.assertTrue(
+            parallel.is_valid_encryption(
+                internal_manifest.manifest_hash,
+                keypair.public_key,
+                context.crypto_extended_base_hash,
+            )
+        )
+
+    def test_encrypt_stream_chains_ballot_codes_in_order(self) -> None:
+        # Arrange
+        keypair = elgamal_keypair_from_secret(int_to_q(2))
+        manifest = election_factory.get_simple_manifest_from_file()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+        ballots = ballot_factory.get_simple_ballots_from_file()
+        invalid_ballot = deepcopy(ballots[0])
+        invalid_ballot.style_id = "not-a-style"
+        stream = ballots[:2] + [invalid_ballot] + ballots[2:]
+
+        # Act
+        with Scheduler() as scheduler:
+            mediator = EncryptionMediator(
+                internal_manifest,
+                context,
+                election_factory.get_encryption_device(),
+                scheduler=scheduler,
+            )
+            encrypted_ballots = list(mediator.encrypt_stream(stream, batch_size=2))
+        stats = mediator.stream_stats()
+
+        # Assert
+        self.assertEqual(len(stream), len(encrypted_ballots))
+        self.assertIsNone(encrypted_ballots[2])
+        self.assertEqual(len(ballots), stats.encrypted)
+        self.assertEqual(1, stats.failed)
+        self.assertGreater(stats.ballots_per_second, 0.0)
+        code_seed = SEED
+        for ballot, encrypted in zip(
+            ballots, encrypted_ballots[:2] + encrypted_ballots[3:]
+        ):
+            serial = encrypt_ballot(ballot, internal_manifest, context, SEED)
+            self.assertEqual(ballot.object_id, encrypted.object_id)
+            self.assertEqual(serial.contests, encrypted.contests)
+            self.assertEqual(code_seed, encrypted.code_seed)
+            self.assertTrue(
+                encrypted.is_valid_encryption(
+                    internal_manifest.manifest_hash,
+                    keypair.public_key,
+                    context.crypto_extended_base_hash,
+                )
+            )
+            code_seed = encrypted.code
+
+    def test_encrypt_stream_applies_the_verification_policy(self) -> None:
+        # Arrange
+        keypair = elgamal_keypair_from_secret(int_to_q(2))
+        manifest = election_factory.get_simple_manifest_from_file()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+        ballots = ballot_factory.get_simple_ballots_from_file()
+        verifier = DeferredVerifier(internal_manifest.manifest_hash, context)
+
+        # Act
+        with Scheduler() as scheduler:
+            streams = [
+                list(
+                    EncryptionMediator(
+                        internal_manifest,
+                        context,
+                        election_factory.get_encryption_device(),
+                        scheduler=scheduler,
+                        verification=policy,
+                    ).encrypt_stream(ballots, batch_size=2)
+                )
+                for policy in (
+                    VerificationPolicy.never(),
+                    VerificationPolicy.deferred(verifier),
+                )
+            ]
+        pending = verifier.pending()
+        verifier.wait()
+
+        # Assert
+        for encrypted_ballots in streams:
+            self.assertEqual(len(ballots), len(encrypted_ballots))
+            for ballot, encrypted in zip(ballots, encrypted_ballots):
+                serial = encrypt_ballot(ballot, internal_manifest, context, SEED)
+                self.assertEqual(ballot.object_id, encrypted.object_id)
+                self.assertEqual(serial.contests, encrypted.contests)
+        self.assertEqual(len(ballots), pending)
+        self.assertEqual(len(ballots), verifier.verified())
+        self.assertEqual([], verifier.failures())
+
+    def test_encryption_mediator_registers_the_public_key_as_a_fixed_base(
+        self,
+    ) -> None:
+        # Arrange
+        keypair = elgamal_keypair_from_secret(rand_q())
+        manifest = election_factory.get_simple_manifest_from_file()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+        registered_with_context = get_fixed_base_table(keypair.public_key)
+
+        # Act
+        EncryptionMediator(
+            internal_manifest, context, election_factory.get_encryption_device()
+        )
+
+        # Assert
+        self.assertIsNone(registered_with_context)
+        self.assertIsNotNone(get_fixed_base_table(keypair.public_key))
+
     @settings(
         deadline=timedelta(milliseconds=4000),
         suppress_health_check=[HealthCheck.too_slow],
@@ -1,10 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional
 
-from hypothesis import given
+from hypothesis import given, settings
+from hypothesis.strategies import integers
 
 from tests.base_test_case import BaseTestCase
 
 from electionguard.constants import (
+    PrimeOption,
+    constants_context,
+    get_constants_for_option,
     get_small_prime,
     get_large_prime,
     get_generator,
@@ -24,9 +30,29 @@ from electionguard.group import (
     int_to_p,
     int_to_q,
     add_q,
+    negate_q,
+    mult_q,
+    pow_q,
     div_q,
     div_p,
     a_plus_bc_q,
+    pow_p,
+    DEFAULT_WINDOW_SIZE,
+    FixedBaseTable,
+    get_generator_table,
+    set_generator_table_window_size,
+    get_fixed_base_table,
+    register_fixed_base,
+    MAX_FIXED_BASE_TABLES,
+    multi_pow_p,
+    is_valid_residues,
+    is_known_residue,
+    clear_known_residues,
+    MAX_KNOWN_RESIDUES,
+    clear_hex_cache,
+    int_to_hex,
+    MAX_CACHED_HEX,
+    _hex_cache,
 )
 from electionguard.utils import (
     flatmap_optional,
@@ -117,6 +143,25 @@ class TestModularArithmetic(BaseTestCase):
     def test_add_noargs(self):
         self.assertEqual(ZERO_MOD_Q, add_q())
 
+    @given(elements_mod_q(), elements_mod_q())
+    def test_results_are_reduced_elements(self, q: ElementModQ, q2: ElementModQ):
+        for result in (
+            add_q(q, q2),
+            a_minus_b_q(q, q2),
+            a_plus_bc_q(q, q2, q),
+            negate_q(q),
+            mult_q(q, q2),
+            pow_q(q, q2),
+        ):
+            self.assertIsInstance(result, ElementModQ)
+            self.assertTrue(result.is_in_bounds())
+        self.assertEqual(ZERO_MOD_Q, add_q(q, negate_q(q)))
+
+    def test_elements_have_no_attributes(self):
+        self.assertFalse(hasattr(ONE_MOD_P, "__dict__"))
+        self.assertFalse(hasattr(ONE_MOD_Q, "__dict__"))
+        self.assertEqual(ZERO_MOD_Q, negate_q(ZERO_MOD_Q))
+
     def test_properties_for_constants(self):
         self.assertNotEqual(get_generator(), 1)
         self.assertEqual(
@@ -188,6 +233,196 @@ class TestModularArithmetic(BaseTestCase):
         self.assertEqual(None, int_to_q(oversize))
 
 
+class TestFixedBaseTable(BaseTestCase):
+    """Fixed-base exponentiation tests"""
+
+    @given(elements_mod_q())
+    def test_g_pow_p_matches_pow_p(self, e: ElementModQ):
+        self.assertEqual(pow_p(get_generator(), e), g_pow_p(e))
+
+    @given(elements_mod_p_no_zero(), elements_mod_q(), integers(1, 4))
+    def test_table_pow_matches_pow_p(
+        self, base: ElementModP, e: ElementModQ, window_size: int
+    ):
+        table = FixedBaseTable(base, window_size)
+        self.assertEqual(pow_p(base, e), table.pow(e))
+
+    @given(elements_mod_p())
+    def test_wide_exponents_fall_back(self, e: ElementModP):
+        self.assertEqual(pow_p(get_generator(), e), g_pow_p(e))
+
+    @settings(deadline=timedelta(milliseconds=2000), max_examples=10)
+    @given(elements_mod_p_no_zero(), elements_mod_q())
+    def test_registered_base_uses_table(self, base: ElementModP, e: ElementModQ):
+        expected = pow_p(base, e)
+        register_fixed_base(base)
+
+        table = get_fixed_base_table(base)
+
+        self.assertIsNotNone(table)
+        self.assertEqual(expected, get_optional(table).pow(e))
+        self.assertEqual(expected, pow_p(base, e))
+
+    def test_registered_bases_are_bounded(self):
+        bases = [ElementModP(3 + i) for i in range(MAX_FIXED_BASE_TABLES + 1)]
+        for base in bases:
+            register_fixed_base(base)
+
+        self.assertIsNone(get_fixed_base_table(bases[0]))
+        self.assertIsNotNone(get_fixed_base_table(bases[-1]))
+
+    def test_registered_bases_are_shared_across_threads(self):
+        bases = [ElementModP(3 + i) for i in range(4 * MAX_FIXED_BASE_TABLES)]
+        expected = [pow(int(base), 5, get_large_prime()) for base in bases]
+
+        def register_and_pow(base: ElementModP) -> ElementModP:
+            register_fixed_base(base)
+            return pow_p(base, 5)
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(register_and_pow, bases * 4))
+
+        self.assertEqual(expected * 4, results)
+
+    def test_window_size_is_kept_when_constants_change(self):
+        other_option = next(
+            option
+            for option in PrimeOption
+            if get_constants_for_option(option).large_prime != get_large_prime()
+        )
+        set_generator_table_window_size(4)
+        try:
+            with constants_context(other_option):
+                self.assertEqual(4, get_generator_table().window_size)
+            self.assertEqual(4, get_generator_table().window_size)
+        finally:
+            set_generator_table_window_size(DEFAULT_WINDOW_SIZE)
+
+    def test_table_size(self):
+        table = get_generator_table()
+        window_count = -(-get_small_prime().bit_length() // table.window_size)
+        self.assertEqual(table.entry_count(), window_count * (1 << table.window_size))
+        self.assertGreater(table.memory_size(), table.entry_count())
+
+
+class TestMultiExponentiation(BaseTestCase):
+    """Simultaneous multi-exponentiation tests"""
+
+    def test_multi_pow_p_noargs(self):
+        self.assertEqual(ONE_MOD_P, multi_pow_p([]))
+
+    @given(
+        elements_mod_p(),
+        elements_mod_p(),
+        elements_mod_p(),
+        elements_mod_q(),
+        elements_mod_q(),
+        elements_mod_q(),
+    )
+    def test_multi_pow_p_matches_product_of_powers(
+        self,
+        b1: ElementModP,
+        b2: ElementModP,
+        b3: ElementModP,
+        e1: ElementModQ,
+        e2: ElementModQ,
+        e3: ElementModQ,
+    ):
+        expected = mult_p(pow_p(b1, e1), pow_p(b2, e2), pow_p(b3, e3))
+        self.assertEqual(expected, multi_pow_p([(b1, e1), (b2, e2), (b3, e3)]))
+
+    @given(elements_mod_p(), elements_mod_q(), elements_mod_q(), integers(0, 100))
+    def test_multi_pow_p_mixed_terms(
+        self, b: ElementModP, e1: ElementModQ, e2: ElementModQ, small: int
+    ):
+        expected = mult_p(g_pow_p(e1), b, pow_p(b, e2), pow_p(b, small))
+        self.assertEqual(
+            expected,
+            multi_pow_p([(get_generator(), e1), (b, 1), (b, e2), (b, small)]),
+        )
+
+
+class TestResidues(BaseTestCase):
+    """Subgroup membership tests"""
+
+    def test_is_valid_residues_noargs(self):
+        self.assertTrue(is_valid_residues([]))
+
+    @settings(deadline=timedelta(milliseconds=2000), max_examples=10)
+    @given(elements_mod_q_no_zero(), elements_mod_q_no_zero(), elements_mod_q_no_zero())
+    def test_is_valid_residues(self, e1: ElementModQ, e2: ElementModQ, e3: ElementModQ):
+        residues = [g_pow_p(e1), g_pow_p(e2), g_pow_p(e3)]
+        clear_known_residues()
+
+        self.assertTrue(is_valid_residues(residues))
+        for residue in residues:
+            self.assertTrue(is_known_residue(residue))
+
+    def test_known_residues_are_shared_across_threads(self):
+        clear_known_residues()
+        residues = [g_pow_p(i) for i in range(1, 4 * MAX_KNOWN_RESIDUES)]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(
+                executor.map(lambda residue: residue.is_valid_residue(), residues)
+            )
+
+        self.assertTrue(all(results))
+        self.assertTrue(is_known_residue(residues[-1]))
+
+    @settings(deadline=timedelta(milliseconds=2000), max_examples=10)
+    @given(elements_mod_q_no_zero(), elements_mod_p_no_zero())
+    def test_non_residues_rejected(self, e: ElementModQ, x: ElementModP):
+        residue = g_pow_p(e)
+        negated = ElementModP(get_large_prime() - 1)
+        square = mult_p(x, x)
+
+        self.assertFalse(is_valid_residues([residue, negated]))
+        self.assertFalse(is_valid_residues([residue, ZERO_MOD_P]))
+        self.assertEqual(
+            is_valid_residues([residue, square]), square.is_valid_residue()
+        )
+        self.assertFalse(is_known_residue(negated))
+
+    def test_known_residues_are_bounded(self):
+        clear_known_residues()
+        residues = [g_pow_p(i + 1) for i in range(MAX_KNOWN_RESIDUES + 1)]
+        for residue in residues:
+            self.assertTrue(residue.is_valid_residue())
+
+        self.assertFalse(is_known_residue(residues[0]))
+        self.assertTrue(is_known_residue(residues[-1]))
+
+
+class TestHexCache(BaseTestCase):
+    """Hex encoding cache tests"""
+
+    @given(elements_mod_p())
+    def test_cached_hex_matches_int_to_hex(self, p: ElementModP):
+        clear_hex_cache()
+        self.assertEqual(p.to_hex(), int_to_hex(int(p)))
+        self.assertEqual(p.to_hex(), int_to_hex(int(p)))
+
+    def test_hex_cache_is_bounded(self):
+        clear_hex_cache()
+        elements = [int_to_p(i) for i in range(MAX_CACHED_HEX + 1)]
+        for element in elements:
+            self.assertEqual(element.to_hex(), int_to_hex(int(element)))
+        self.assertEqual(len(_hex_cache), MAX_CACHED_HEX)
+        self.assertNotIn(elements[0], _hex_cache)
+        self.assertIn(elements[-1], _hex_cache)
+
+    def test_hex_cache_is_shared_across_threads(self):
+        clear_hex_cache()
+        elements = [int_to_p(i) for i in range(4 * MAX_CACHED_HEX)]
+
+        with ThreadPoolExecutor(8) as executor:
+            encodings = list(executor.map(lambda element: element.to_hex(), elements))
+
+        self.assertEqual([int_to_hex(int(element)) for element in elements], encodings)
+        self.assertLessEqual(len(_hex_cache), MAX_CACHED_HEX)
+
+
 class TestOptionalFunctions(BaseTestCase):
     """Math Optional Functions tests"""
 
@@ -1,12 +1,13 @@
 from typing import List, Optional
 
 from hypothesis import given
+from hypothesis.strategies import integers, text
 
 from tests.base_test_case import BaseTestCase
 from tests.property.test_group import elements_mod_p, elements_mod_q
 
-from electionguard.group import ElementModQ
-from electionguard.hash import hash_elems
+from electionguard.group import ElementModP, ElementModQ
+from electionguard.hash import HashPrefix, hash_elems
 
 
 class TestHash(BaseTestCase):
@@ -67,3 +68,20 @@ class TestHash(BaseTestCase):
 
         self.assertNotEqual(nested_hash, non_nested_1)
         self.assertEqual(nested_hash, non_nested_2)
+
+    @given(elements_mod_q(), elements_mod_p(), integers(), text())
+    def test_hash_prefix_matches_hash_elems(
+        self, q: ElementModQ, p: ElementModP, i: int, s: str
+    ):
+        prefix = HashPrefix(q, p)
+
+        self.assertEqual(prefix.hash_elems(), hash_elems(q, p))
+        self.assertEqual(prefix.hash_elems(i, s), hash_elems(q, p, i, s))
+        self.assertEqual(prefix.extend(i).hash_elems(s), hash_elems(q, p, i, s))
+        # extending leaves the original prefix unchanged
+        self.assertEqual(prefix.hash_elems(s), hash_elems(q, p, s))
+        self.assertEqual(HashPrefix().hash_elems(q, [p, s]), hash_elems(q, [p, s]))
+        self.assertEqual(
+            prefix.hash_each([i, s], q),
+            [hash_elems(q, p, i, q), hash_elems(q, p, s, q)],
+        )
@@ -6,6 +6,7 @@ from hypothesis.strategies import integers
 from tests.base_test_case import BaseTestCase
 
 from electionguard.group import ElementModQ
+from electionguard.hash import hash_elems
 from electionguard.nonces import Nonces
 from electionguard_tools.strategies.group import elements_mod_q
 
@@ -59,3 +60,22 @@ class TestNonces(BaseTestCase):
         self.assertRaises(TypeError, len, n)
         self.assertRaises(TypeError, lambda: n[1:])
         self.assertRaises(TypeError, lambda: n.get_with_headers(-1))
+
+    @given(elements_mod_q(), integers(min_value=0, max_value=1000000))
+    def test_nonces_match_hash_of_seed_and_index(self, seed: ElementModQ, i: int):
+        n = Nonces(seed, "header")
+        self.assertEqual(
+            n.get_with_headers(i, "use"),
+            hash_elems(hash_elems(seed, "header"), i, "use"),
+        )
+
+    @given(elements_mod_q(), integers(min_value=0, max_value=1000000))
+    def test_nonces_batch_matches_items(self, seed: ElementModQ, i: int):
+        n = Nonces(seed)
+        indices = [i, 0, i + 1]
+        self.assertEqual(n.batch(indices), [n[index] for index in indices])
+        self.assertEqual(
+            n.batch(indices, "use"),
+            [n.get_with_headers(index, "use") for index in indices],
+        )
+        self.assertEqual(n[i : i + 3], n.batch(range(i, i + 3)))
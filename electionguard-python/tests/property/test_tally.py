@@ -1,5 +1,7 @@
+from copy import deepcopy
 from datetime import timedelta
-from typing import Dict
+from typing import Dict, List, Tuple
+from unittest.mock import MagicMock, patch
 
 from hypothesis import given, HealthCheck, settings, Phase
 from hypothesis.strategies import integers
@@ -15,7 +17,14 @@ from electionguard.data_store import DataStore
 
 from electionguard.encrypt import encrypt_ballot
 from electionguard.group import ElementModQ, ONE_MOD_Q
-from electionguard.tally import CiphertextTally, tally_ballots, tally_ballot
+from electionguard.tally import (
+    CiphertextTally,
+    merge_published_tallies,
+    merge_tallies,
+    tally_ballot_shards,
+    tally_ballots,
+    tally_ballot,
+)
 
 
 from electionguard_tools.strategies.election import (
@@ -24,16 +33,22 @@ from electionguard_tools.strategies.election import (
     ELECTIONS_AND_BALLOTS_TUPLE_TYPE,
 )
 from electionguard_tools.factories.election_factory import ElectionFactory
+from electionguard_tools.helpers.export import BALLOT_PREFIX
+from electionguard_tools.helpers.serialize import to_file
 from electionguard_tools.helpers.tally_accumulate import accumulate_plaintext_ballots
+from electionguard_tools.helpers.tally_shards import tally_ballot_directory
 
-from electionguard.elgamal import ElGamalKeyPair
+from electionguard.elgamal import ElGamalKeyPair, elgamal_encrypt
 from electionguard.group import (
     ElementModQ,
     TWO_MOD_P,
     ONE_MOD_Q,
     mult_p,
     g_pow_p,
+    rand_range_q,
 )
+from electionguard.scheduler import Scheduler
+from electionguard.utils import get_optional
 import electionguard_tools.factories.ballot_factory as BallotFactory
 from electionguard.manifest import InternalManifest
 from electionguard.manifest import Manifest
@@ -42,6 +57,7 @@ from electionguard.election import (
     make_ciphertext_election_context,
 )
 import os
+from tempfile import TemporaryDirectory
 
 election_factory = ElectionFactory()
 ballot_factory = BallotFactory.BallotFactory()
@@ -342,6 +358,223 @@ class TestTally(BaseTestCase):
         first_ballot.state = BallotBoxState.SPOILED
         self.assertFalse(tally.append(first_ballot))
 
+    def test_tally_accumulates_chunks_in_parallel(self):
+        # Arrange
+        keypair = ElGamalKeyPair(TWO_MOD_P, g_pow_p(TWO_MOD_P))
+        manifest = election_factory.get_fake_manifest()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+        tally = CiphertextTally("chunked-tally", internal_manifest, context)
+        selection_ids = [
+            selection_id
+            for contest in tally.contests.values()
+            for selection_id in contest.selections
+        ]
+        votes = {
+            selection_id: [(index + offset) % 2 for index in range(7)]
+            for (offset, selection_id) in enumerate(selection_ids)
+        }
+        ciphertexts = {
+            selection_id: {
+                f"ballot-{index}": get_optional(
+                    elgamal_encrypt(vote, rand_range_q(ONE_MOD_Q), keypair.public_key)
+                )
+                for (index, vote) in enumerate(selection_votes)
+            }
+            for (selection_id, selection_votes) in votes.items()
+        }
+
+        # Act
+        scheduler = Scheduler()
+        # pylint: disable=protected-access
+        result = tally._execute_accumulate(ciphertexts, scheduler, chunk_size=3)
+        scheduler.close()
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(
+            {
+                selection_id: sum(selection_votes)
+                for (selection_id, selection_votes) in votes.items()
+            },
+            self._decrypt_with_secret(tally, keypair.secret_key),
+        )
+
+    def test_batch_append_with_failing_scheduler_leaves_tally_unchanged(self):
+        # Arrange
+        keypair, internal_manifest, context, ballots = self._submitted_ballots(3)
+        ballots[2].state = BallotBoxState.SPOILED
+        invalid_ballot = deepcopy(ballots[0])
+        invalid_ballot.object_id = "invalid-ballot"
+        invalid_ballot.manifest_hash = ONE_MOD_Q
+        tally = CiphertextTally("batch-tally", internal_manifest, context)
+        contests = deepcopy(tally.contests)
+        failing_scheduler = MagicMock()
+        failing_scheduler.schedule.return_value = []
+
+        # Act
+        with patch("electionguard.tally.ACCUMULATE_CHUNK_SIZE", 1):
+            failed = tally.batch_append(
+                ((ballot.object_id, ballot) for ballot in ballots),
+                failing_scheduler,
+            )
+        failed_contests = deepcopy(tally.contests)
+        appended = tally.batch_append(
+            (
+                (ballot.object_id, ballot)
+                for ballot in [ballots[0], invalid_ballot, *ballots[1:]]
+            )
+        )
+
+        # Assert
+        self.assertFalse(failed)
+        self.assertEqual(contests, failed_contests)
+        self.assertTrue(appended)
+        self.assertEqual({"ballot-0", "ballot-1"}, tally.cast_ballot_ids)
+        self.assertEqual({"ballot-2"}, tally.spoiled_ballot_ids)
+        self.assertEqual(
+            self._decrypt_with_secret(tally, keypair.secret_key),
+            accumulate_plaintext_ballots(
+                [
+                    election_factory.get_fake_ballot(
+                        internal_manifest, f"ballot-{index}"
+                    )
+                    for index in range(2)
+                ]
+            ),
+        )
+
+    def test_merge_partial_tallies(self):
+        # Arrange
+        keypair, internal_manifest, context, ballots = self._submitted_ballots(4)
+        expected = CiphertextTally("election-results", internal_manifest, context)
+        for ballot in ballots:
+            self.assertTrue(expected.append(ballot))
+        first = CiphertextTally("election-results", internal_manifest, context)
+        second = CiphertextTally("election-results", internal_manifest, context)
+        for ballot in ballots[:2]:
+            self.assertTrue(first.append(ballot))
+        for ballot in ballots[2:]:
+            self.assertTrue(second.append(ballot))
+
+        # Act
+        result = merge_tallies([first, second])
+        published = merge_published_tallies([first.publish(), second.publish()])
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual(result.cast_ballot_ids, expected.cast_ballot_ids)
+        self.assertEqual(result.spoiled_ballot_ids, expected.spoiled_ballot_ids)
+        self.assertEqual(result.contests, expected.contests)
+        self.assertEqual(published.contests, expected.contests)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(
+            self._decrypt_with_secret(result, keypair.secret_key),
+            self._decrypt_with_secret(expected, keypair.secret_key),
+        )
+
+    def test_merge_overlapping_tallies_fails(self):
+        # Arrange
+        _keypair, internal_manifest, context, ballots = self._submitted_ballots(2)
+        first = CiphertextTally("election-results", internal_manifest, context)
+        second = CiphertextTally("election-results", internal_manifest, context)
+        self.assertTrue(first.append(ballots[0]))
+        self.assertTrue(second.append(ballots[0]))
+        self.assertTrue(second.append(ballots[1]))
+        contests = first.contests
+
+        # Act
+        result = first.merge(second)
+
+        # Assert
+        self.assertFalse(result)
+        self.assertIs(first.contests, contests)
+        self.assertEqual(first.cast(), 1)
+        self.assertIsNone(merge_tallies([first, second]))
+
+    def test_tally_ballot_shards(self):
+        # Arrange
+        keypair, internal_manifest, context, ballots = self._submitted_ballots(4)
+        expected = tally_ballots(
+            {ballot.object_id: ballot for ballot in ballots}.items(),
+            internal_manifest,
+            context,
+        )
+
+        # Act
+        with Scheduler() as scheduler:
+            result = tally_ballot_shards(
+                [ballots[:1], ballots[1:]], internal_manifest, context, scheduler
+            )
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual(result.cast(), 4)
+        self.assertEqual(
+            self._decrypt_with_secret(result, keypair.secret_key),
+            self._decrypt_with_secret(expected, keypair.secret_key),
+        )
+
+    def test_tally_ballot_directory(self):
+        # Arrange
+        keypair, internal_manifest, context, ballots = self._submitted_ballots(3)
+        expected = tally_ballots(
+            {ballot.object_id: ballot for ballot in ballots}.items(),
+            internal_manifest,
+            context,
+        )
+
+        with TemporaryDirectory() as directory:
+            for ballot in ballots:
+                to_file(ballot, BALLOT_PREFIX + ballot.object_id, directory)
+
+            # Act
+            with Scheduler() as scheduler:
+                result = tally_ballot_directory(
+                    directory, internal_manifest, context, 2, scheduler
+                )
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual(result.cast(), 3)
+        self.assertEqual(
+            self._decrypt_with_secret(result, keypair.secret_key),
+            self._decrypt_with_secret(expected, keypair.secret_key),
+        )
+
+    @staticmethod
+    def _submitted_ballots(
+        count: int,
+    ) -> Tuple[
+        ElGamalKeyPair, InternalManifest, CiphertextElectionContext, List[SubmittedBallot]
+    ]:
+        """
+        Encrypt and cast some ballots in a fake election
+        """
+        keypair = ElGamalKeyPair(TWO_MOD_P, g_pow_p(TWO_MOD_P))
+        manifest = election_factory.get_fake_manifest()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+        ballots = []
+        for index in range(count):
+            ballot = election_factory.get_fake_ballot(
+                internal_manifest, f"ballot-{index}"
+            )
+            encrypted_ballot = get_optional(
+                encrypt_ballot(
+                    ballot,
+                    internal_manifest,
+                    context,
+                    ElectionFactory.get_encryption_device().get_hash(),
+                )
+            )
+            ballots.append(
+                from_ciphertext_ballot(encrypted_ballot, BallotBoxState.CAST)
+            )
+        return keypair, internal_manifest, context, ballots
+
     @staticmethod
     def _decrypt_with_secret(
         tally: CiphertextTally, secret_key: ElementModQ
@@ -1,6 +1,9 @@
+from dataclasses import replace
+from unittest.mock import patch
+
 from tests.base_test_case import BaseTestCase
 
-from electionguard.ballot import BallotBoxState
+from electionguard.ballot import BallotBoxState, CiphertextBallot
 from electionguard.data_store import DataStore
 
 from electionguard.ballot_box import (
@@ -11,7 +14,9 @@ from electionguard.ballot_validator import ballot_is_valid_for_election
 from electionguard.constants import get_small_prime
 from electionguard.elgamal import elgamal_keypair_from_secret
 from electionguard.encrypt import encrypt_ballot
+from electionguard.elgamal import ElGamalCiphertext
 from electionguard.group import int_to_q
+from electionguard.tally import CiphertextTally
 
 import electionguard_tools.factories.ballot_factory as BallotFactory
 import electionguard_tools.factories.election_factory as ElectionFactory
@@ -144,3 +149,48 @@ class TestBallotBox(BaseTestCase):
         self.assertIsNone(
             accept_ballot(data, BallotBoxState.CAST, internal_manifest, context, store)
         )  # cannot cast a ballot already spoiled
+
+    def test_ballot_box_records_verified_ballots(self):
+        # Arrange
+        keypair = elgamal_keypair_from_secret(int_to_q(2))
+        manifest = election_factory.get_fake_manifest()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+        subject = BallotBox(internal_manifest, context)
+        data = encrypt_ballot(
+            election_factory.get_fake_ballot(internal_manifest),
+            internal_manifest,
+            context,
+            SEED,
+        )
+
+        # Act
+        result = subject.cast(data)
+        tally = CiphertextTally("verified-tally", internal_manifest, context)
+        with patch.object(CiphertextBallot, "is_valid_encryption") as verify:
+            appended = tally.append(result, verified=subject.verified())
+
+        # Assert
+        self.assertEqual(len(subject.verified()), 1)
+        self.assertEqual(
+            subject.verified().get(result.object_id).crypto_hash, result.crypto_hash
+        )
+        self.assertTrue(appended)
+        verify.assert_not_called()
+
+        # A ballot changed after it was verified no longer matches its record
+        selection = result.contests[0].ballot_selections[0]
+        tampered = replace(
+            selection,
+            ciphertext=ElGamalCiphertext(
+                selection.ciphertext.data, selection.ciphertext.pad
+            ),
+        )
+        result.contests[0].ballot_selections[0] = tampered
+        self.assertFalse(subject.verified().is_verified(result, context))
+        self.assertFalse(
+            ballot_is_valid_for_election(
+                result, internal_manifest, context, subject.verified()
+            )
+        )
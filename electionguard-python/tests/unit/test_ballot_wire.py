@@ -0,0 +1,86 @@
+from tests.base_test_case import BaseTestCase
+
+from electionguard.ballot import BallotBoxState, SubmittedBallot, from_ciphertext_ballot
+from electionguard.ballot_wire import (
+    ELEMENT_MOD_P_SIZE,
+    WIRE_MAGIC,
+    decode_ballot,
+    encode_ballot,
+)
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import encrypt_ballot
+from electionguard.group import int_to_q
+from electionguard.utils import get_optional
+from electionguard_tools.factories.ballot_factory import BallotFactory
+from electionguard_tools.factories.election_factory import ElectionFactory
+from electionguard_tools.helpers.serialize import to_raw
+
+election_factory = ElectionFactory()
+SEED = election_factory.get_encryption_device().get_hash()
+
+
+class TestBallotWire(BaseTestCase):
+    """Ballot wire format tests"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            election_factory.get_simple_manifest_from_file(), keypair.public_key
+        )
+        self.ballot = get_optional(
+            encrypt_ballot(
+                BallotFactory().get_simple_ballot_from_file(),
+                internal_manifest,
+                context,
+                SEED,
+            )
+        )
+
+    def test_ciphertext_ballot_round_trips(self) -> None:
+        # Act
+        encoded = encode_ballot(self.ballot)
+        decoded = decode_ballot(encoded)
+
+        # Assert
+        self.assertEqual(WIRE_MAGIC, encoded[: len(WIRE_MAGIC)])
+        self.assertNotIsInstance(decoded, SubmittedBallot)
+        self.assertEqual(self.ballot, decoded)
+        self.assertLess(len(encoded) * 2, len(to_raw(self.ballot)))
+
+    def test_submitted_ballot_round_trips_from_a_view_of_a_larger_buffer(
+        self,
+    ) -> None:
+        # Arrange
+        submitted = from_ciphertext_ballot(self.ballot, BallotBoxState.SPOILED)
+        encoded = encode_ballot(submitted)
+        buffer = bytearray(b"\x00" * 16) + encoded + bytearray(b"\x00" * 16)
+
+        # Act
+        decoded = decode_ballot(memoryview(buffer)[16 : 16 + len(encoded)])
+
+        # Assert
+        self.assertIsInstance(decoded, SubmittedBallot)
+        self.assertEqual(submitted, decoded)
+        self.assertEqual(submitted.contests, decoded.contests)
+        self.assertEqual(submitted.crypto_hash, decoded.crypto_hash)
+        self.assertEqual(submitted.code, decoded.code)
+        self.assertEqual(BallotBoxState.SPOILED, decoded.state)
+        self.assertIsNone(decoded.nonce)
+
+    def test_malformed_data_is_rejected(self) -> None:
+        # Arrange
+        encoded = encode_ballot(self.ballot)
+        newer_version = bytearray(encoded)
+        newer_version[len(WIRE_MAGIC)] += 1
+
+        # Act & Assert
+        for data in (
+            b"",
+            b"not a ballot",
+            bytes(newer_version),
+            encoded[:-ELEMENT_MOD_P_SIZE],
+            encoded + b"\x00",
+        ):
+            with self.assertRaises(ValueError):
+                decode_ballot(data)
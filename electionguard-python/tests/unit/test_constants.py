@@ -7,9 +7,15 @@ from tests.base_test_case import BaseTestCase
 from electionguard.constants import (
     PrimeOption,
     LARGE_TEST_CONSTANTS,
+    MEDIUM_TEST_CONSTANTS,
+    constants_context,
     get_constants,
+    reset_constants,
+    set_constants,
     STANDARD_CONSTANTS,
 )
+from electionguard.elgamal import elgamal_encrypt, elgamal_keypair_from_secret
+from electionguard.group import ONE_MOD_Q, g_pow_p, int_to_q
 
 from electionguard.constants import (
     get_small_prime,
@@ -22,10 +28,17 @@ from electionguard.constants import (
 class TestConstants(BaseTestCase):
     """Election constant tests."""
 
+    def setUp(self):
+        self.constants = get_constants()
+
+    def tearDown(self):
+        set_constants(self.constants)
+
     @patch.dict(os.environ, {"PRIME_OPTION": PrimeOption.Standard.value})
     def test_get_standard_primes(self):
         """Test getting standard constants with large primes."""
         # Act
+        reset_constants()
         constants = get_constants()
 
         # Assert
@@ -40,6 +53,7 @@ class TestConstants(BaseTestCase):
     def test_get_test_primes(self):
         """Test getting test only constants with small primes."""
         # Act
+        reset_constants()
         constants = get_constants()
 
         # Assert
@@ -49,3 +63,36 @@ class TestConstants(BaseTestCase):
         self.assertEqual(constants.small_prime, get_small_prime())
         self.assertEqual(constants.cofactor, get_cofactor())
         self.assertEqual(constants.generator, get_generator())
+
+    @patch.dict(os.environ, {"PRIME_OPTION": PrimeOption.TestOnly.value})
+    def test_constants_are_resolved_once(self):
+        """Test the constants do not follow the environment after they are resolved."""
+        # Arrange
+        reset_constants()
+        constants = get_constants()
+
+        # Act
+        with patch.dict(os.environ, {"PRIME_OPTION": PrimeOption.Standard.value}):
+            unchanged = get_constants()
+
+        # Assert
+        self.assertIs(constants, LARGE_TEST_CONSTANTS)
+        self.assertIs(unchanged, LARGE_TEST_CONSTANTS)
+
+    def test_constants_context(self):
+        """Test swapping to medium test primes and back."""
+        # Act
+        with constants_context(PrimeOption.MediumTestOnly) as constants:
+            keypair = elgamal_keypair_from_secret(int_to_q(2))
+            ciphertext = elgamal_encrypt(1, int_to_q(3), keypair.public_key)
+            plaintext = ciphertext.decrypt(keypair.secret_key)
+            generator = g_pow_p(ONE_MOD_Q)
+            large_prime = get_large_prime()
+
+        # Assert
+        self.assertEqual(constants, MEDIUM_TEST_CONSTANTS)
+        self.assertEqual(plaintext, 1)
+        self.assertEqual(generator, MEDIUM_TEST_CONSTANTS.generator)
+        self.assertEqual(large_prime, MEDIUM_TEST_CONSTANTS.large_prime)
+        self.assertIs(get_constants(), self.constants)
+        self.assertEqual(g_pow_p(ONE_MOD_Q), self.constants.generator)
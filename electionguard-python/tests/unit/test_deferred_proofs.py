@@ -0,0 +1,92 @@
+from tests.base_test_case import BaseTestCase
+
+from electionguard.ballot_box import BallotBox
+from electionguard.deferred_proofs import complete_ballot_proofs, complete_proofs
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import encrypt_ballot
+from electionguard.group import int_to_q
+from electionguard.scheduler import Scheduler
+from electionguard.utils import get_optional
+from electionguard_tools.factories.ballot_factory import BallotFactory
+from electionguard_tools.factories.election_factory import ElectionFactory
+
+election_factory = ElectionFactory()
+SEED = election_factory.get_encryption_device().get_hash()
+
+
+class TestDeferredProofs(BaseTestCase):
+    """Deferred proof tests"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+        (
+            self.internal_manifest,
+            self.context,
+        ) = election_factory.get_fake_ciphertext_election(
+            election_factory.get_simple_manifest_from_file(), keypair.public_key
+        )
+        self.ballots = BallotFactory().get_simple_ballots_from_file()
+
+    def test_completed_ballot_matches_eager_encryption(self) -> None:
+        # Arrange
+        ballot = self.ballots[0]
+        eager = get_optional(
+            encrypt_ballot(ballot, self.internal_manifest, self.context, SEED)
+        )
+
+        # Act
+        deferred = get_optional(
+            encrypt_ballot(
+                ballot, self.internal_manifest, self.context, SEED, defer_proofs=True
+            )
+        )
+        completed = complete_ballot_proofs(
+            deferred, self.internal_manifest, self.context
+        )
+
+        # Assert
+        for contest in deferred.contests:
+            self.assertIsNone(contest.proof)
+            for selection in contest.ballot_selections:
+                self.assertIsNone(selection.proof)
+        self.assertEqual(eager.crypto_hash, deferred.crypto_hash)
+        self.assertIsNotNone(completed)
+        self.assertEqual(eager.contests, completed.contests)
+        self.assertEqual(deferred.code, completed.code)
+
+    def test_ballot_box_accepts_ballots_only_once_proven(self) -> None:
+        # Arrange
+        deferred = [
+            get_optional(
+                encrypt_ballot(
+                    ballot,
+                    self.internal_manifest,
+                    self.context,
+                    SEED,
+                    defer_proofs=True,
+                )
+            )
+            for ballot in self.ballots
+        ]
+        ballot_box = BallotBox(self.internal_manifest, self.context)
+
+        # Act
+        unproven = ballot_box.cast(deferred[0])
+        with Scheduler() as scheduler:
+            completed = complete_proofs(
+                deferred, self.internal_manifest, self.context, scheduler
+            )
+
+        # Assert
+        self.assertIsNone(unproven)
+        self.assertEqual(
+            [ballot.object_id for ballot in deferred],
+            [ballot.object_id for ballot in completed],
+        )
+        self.assertEqual(
+            completed,
+            complete_proofs(deferred, self.internal_manifest, self.context),
+        )
+        for ballot in completed:
+            self.assertIsNotNone(ballot_box.cast(ballot))
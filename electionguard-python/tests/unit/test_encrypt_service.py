@@ -0,0 +1,153 @@
+import asyncio
+import json
+from copy import deepcopy
+from os import path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List, Optional, Tuple
+
+from tests.base_test_case import BaseTestCase
+
+from electionguard.ballot import CiphertextBallot, PlaintextBallot
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import EncryptionDevice, encrypt_ballot
+from electionguard.encrypt_service import AsyncEncryptionMediator
+from electionguard.group import int_to_q
+from electionguard.utils import get_optional
+from electionguard_tools.factories.ballot_factory import BallotFactory
+from electionguard_tools.factories.election_factory import ElectionFactory
+from electionguard_tools.helpers.encryption_server import (
+    BALLOTS_PATH,
+    server_address,
+    start_encryption_server,
+)
+from electionguard_tools.helpers.serialize import to_raw
+
+
+async def _post(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, target: str, body: str
+) -> Tuple[int, Dict[str, Any]]:
+    payload = body.encode()
+    writer.write(
+        f"POST {target} HTTP/1.1\r\nContent-Length: {len(payload)}\r\n\r\n".encode()
+        + payload
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(content)
+
+
+class TestEncryptService(BaseTestCase):
+    """Encryption service tests"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+        election_factory = ElectionFactory()
+        (
+            self.internal_manifest,
+            self.context,
+        ) = election_factory.get_fake_ciphertext_election(
+            election_factory.get_simple_manifest_from_file(), keypair.public_key
+        )
+        self.ballots = BallotFactory().get_simple_ballots_from_file()
+        self.devices = [
+            EncryptionDevice(device_id, 12345, 45, "polling-place")
+            for device_id in (1, 2)
+        ]
+
+    def test_encrypt_chains_codes_per_device_in_order(self) -> None:
+        # Arrange
+        invalid_ballot = deepcopy(self.ballots[0])
+        invalid_ballot.style_id = "not-a-style"
+        requests: List[Tuple[EncryptionDevice, PlaintextBallot]] = [
+            (self.devices[index % 2], ballot)
+            for index, ballot in enumerate(self.ballots + [invalid_ballot])
+        ]
+
+        async def encrypt_all() -> List[Optional[CiphertextBallot]]:
+            async with AsyncEncryptionMediator(
+                self.internal_manifest, self.context, max_workers=2, max_queued=1
+            ) as mediator:
+                for device in self.devices:
+                    mediator.register_device(device)
+                unregistered = await mediator.encrypt(99, self.ballots[0])
+                self.assertIsNone(unregistered)
+                return await asyncio.gather(
+                    *(mediator.encrypt(device.device_id, b) for device, b in requests)
+                )
+
+        # Act
+        loop = asyncio.new_event_loop()
+        encrypted_ballots = loop.run_until_complete(encrypt_all())
+        loop.close()
+
+        # Assert
+        self.assertIsNone(encrypted_ballots[-1])
+        for device in self.devices:
+            code_seed = device.get_hash()
+            for (requested_device, ballot), encrypted in zip(
+                requests[:-1], encrypted_ballots[:-1]
+            ):
+                if requested_device is not device:
+                    continue
+                serial = encrypt_ballot(
+                    ballot, self.internal_manifest, self.context, code_seed
+                )
+                self.assertEqual(ballot.object_id, encrypted.object_id)
+                self.assertEqual(serial.contests, encrypted.contests)
+                self.assertEqual(code_seed, encrypted.code_seed)
+                code_seed = encrypted.code
+
+    def test_server_encrypts_over_tcp_and_unix_socket(self) -> None:
+        # Arrange
+        device = self.devices[0]
+        ballot = self.ballots[0]
+
+        async def serve() -> List[Tuple[int, Dict[str, Any]]]:
+            async with AsyncEncryptionMediator(
+                self.internal_manifest, self.context, max_workers=1
+            ) as mediator:
+                mediator.register_device(device)
+                with TemporaryDirectory() as directory:
+                    tcp_server = await start_encryption_server(mediator)
+                    unix_path = path.join(directory, "encrypt.sock")
+                    unix_server = await start_encryption_server(
+                        mediator, unix_path=unix_path
+                    )
+                    target = BALLOTS_PATH.format(device_id=device.device_id)
+                    responses = [
+                        await _post(
+                            *await asyncio.open_connection(*server_address(tcp_server)),
+                            target,
+                            to_raw(ballot),
+                        ),
+                        await _post(
+                            *await asyncio.open_unix_connection(unix_path),
+                            target,
+                            to_raw(ballot),
+                        ),
+                        await _post(
+                            *await asyncio.open_unix_connection(unix_path),
+                            BALLOTS_PATH.format(device_id=99),
+                            to_raw(ballot),
+                        ),
+                    ]
+                    for server in (tcp_server, unix_server):
+                        server.close()
+                        await server.wait_closed()
+                return responses
+
+        # Act
+        loop = asyncio.new_event_loop()
+        responses = loop.run_until_complete(serve())
+        loop.close()
+
+        # Assert
+        (first_status, first), (second_status, second), (missing_status, _) = responses
+        self.assertEqual(200, first_status)
+        self.assertEqual(200, second_status)
+        self.assertEqual(404, missing_status)
+        self.assertEqual(ballot.object_id, first["object_id"])
+        self.assertEqual(first["code"], second["code_seed"])
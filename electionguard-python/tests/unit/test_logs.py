@@ -1,13 +1,21 @@
+import logging
+from unittest.mock import MagicMock, patch
+
 from tests.base_test_case import BaseTestCase
 
+from electionguard import elgamal
+from electionguard.group import ONE_MOD_P, ONE_MOD_Q
 from electionguard.logs import (
+    HOT_PATH_LOGGING_ENV,
     get_stream_handler,
+    hot_path_logging_from_env,
     log_add_handler,
     log_remove_handler,
     log_handlers,
     log_debug,
     log_error,
     log_info,
+    log_is_enabled,
     log_warning,
 )
 
@@ -50,3 +58,56 @@ class TestLogs(BaseTestCase):
 
         # Assert
         self.assertEqual(len(added_handlers), 1)
+
+    def test_log_skips_disabled_levels(self):
+        # Arrange
+        message = MagicMock(return_value="lazy log message")
+
+        # Act
+        log_debug(message)
+
+        # Assert
+        self.assertFalse(log_is_enabled(logging.DEBUG))
+        message.assert_not_called()
+
+    def test_hot_path_logging_is_read_from_env(self):
+        # Act & Assert
+        for value, is_enabled in (
+            ("1", True),
+            ("true", True),
+            ("TRUE", True),
+            ("", False),
+            ("0", False),
+            ("false", False),
+        ):
+            with patch.dict("os.environ", {HOT_PATH_LOGGING_ENV: value}):
+                self.assertEqual(is_enabled, hot_path_logging_from_env())
+
+    def test_hot_path_logs_only_when_enabled(self):
+        # Act & Assert
+        for is_enabled in (True, False):
+            with patch.object(elgamal, "HOT_PATH_LOGGING", is_enabled), patch.object(
+                elgamal, "log_info"
+            ) as log_info_mock:
+                elgamal.elgamal_encrypt(0, ONE_MOD_Q, ONE_MOD_P)
+            self.assertEqual(is_enabled, log_info_mock.called)
+
+    def test_log_lazy_message_with_caller(self):
+        # Arrange
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        log_add_handler(handler)
+
+        # Act
+        log_warning(lambda: "lazy log message")
+        log_remove_handler(handler)
+
+        # Assert
+        self.assertEqual(len(records), 1)
+        self.assertTrue(
+            records[0]
+            .getMessage()
+            .startswith("test_logs.py.test_log_lazy_message_with_caller:#L")
+        )
+        self.assertTrue(records[0].getMessage().endswith(": lazy log message"))
@@ -84,6 +84,68 @@ class TestManifest(BaseTestCase):
                 if expected.object_id == actual.object_id:
                     self.assertEqual(expected.crypto_hash(), actual.crypto_hash())
 
+    def test_internal_manifest_precomputes_description_hashes(self):
+        # Arrange
+        subject = InternalManifest(election_factory.get_simple_manifest_from_file())
+
+        # Assert
+        for contest in subject.contests:
+            self.assertEqual(
+                subject.contest_hash_for(contest.object_id), contest.crypto_hash()
+            )
+            for selection in contest.ballot_selections + contest.placeholder_selections:
+                self.assertEqual(
+                    subject.selection_hash_for(contest.object_id, selection.object_id),
+                    selection.crypto_hash(),
+                )
+        self.assertIsNone(subject.contest_hash_for("missing-contest"))
+        self.assertIsNone(subject.selection_hash_for("missing-contest", "missing"))
+
+    def test_internal_manifest_indexes_styles_contests_and_selections(self):
+        # Arrange
+        subject = InternalManifest(election_factory.get_simple_manifest_from_file())
+
+        # Assert
+        for style in subject.ballot_styles:
+            self.assertIs(subject.get_ballot_style(style.object_id), style)
+            gp_unit_ids = style.geopolitical_unit_ids or []
+            self.assertEqual(
+                subject.get_contests_for(style.object_id),
+                [
+                    contest
+                    for contest in subject.contests
+                    if contest.electoral_district_id in gp_unit_ids
+                ],
+            )
+        for contest in subject.contests:
+            self.assertIs(subject.contest_for(contest.object_id), contest)
+            for selection in contest.ballot_selections + contest.placeholder_selections:
+                self.assertIs(contest.selection_for(selection.object_id), selection)
+        self.assertIsNone(subject.contest_for("missing-contest"))
+        self.assertIsNone(subject.contests[0].selection_for("missing"))
+
+    def test_internal_manifest_indexes_the_first_of_duplicate_ids(self):
+        # Arrange
+        manifest = election_factory.get_simple_manifest_from_file()
+        first_contest = manifest.contests[0]
+        duplicate_contest = from_raw(type(first_contest), to_raw(first_contest))
+        duplicate_contest.sequence_order = len(manifest.contests)
+        manifest.contests.append(duplicate_contest)
+        first_style = manifest.ballot_styles[0]
+        duplicate_style = from_raw(type(first_style), to_raw(first_style))
+        duplicate_style.geopolitical_unit_ids = []
+        manifest.ballot_styles.append(duplicate_style)
+
+        # Act
+        subject = InternalManifest(manifest)
+
+        # Assert
+        self.assertIs(subject.contest_for(first_contest.object_id), subject.contests[0])
+        self.assertIs(
+            subject.get_ballot_style(first_style.object_id), subject.ballot_styles[0]
+        )
+        self.assertNotEqual(subject.get_contests_for(first_style.object_id), [])
+
     def test_contest_description_valid_input_succeeds(self):
         description = ContestDescriptionWithPlaceholders(
             object_id="0@A.com-contest",
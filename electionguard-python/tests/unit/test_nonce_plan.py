@@ -0,0 +1,86 @@
+from tests.base_test_case import BaseTestCase
+
+from electionguard.ballot import CiphertextBallot
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import encrypt_ballot
+from electionguard.group import int_to_q
+from electionguard.nonce_plan import plan_ballot_nonces
+from electionguard.nonces import Nonces
+from electionguard.utils import get_optional
+
+import electionguard_tools.factories.ballot_factory as BallotFactory
+import electionguard_tools.factories.election_factory as ElectionFactory
+
+election_factory = ElectionFactory.ElectionFactory()
+ballot_factory = BallotFactory.BallotFactory()
+
+
+class TestNoncePlan(BaseTestCase):
+    """Ballot nonce planner tests"""
+
+    def setUp(self):
+        keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+        (
+            self.internal_manifest,
+            self.context,
+        ) = election_factory.get_fake_ciphertext_election(
+            election_factory.get_simple_manifest_from_file(), keypair.public_key
+        )
+        self.ballot = ballot_factory.get_simple_ballots_from_file()[0]
+
+    def test_planned_nonces_match_derivation_by_description(self):
+        # Arrange
+        nonce_seed = int_to_q(42)
+
+        # Act
+        plan = plan_ballot_nonces(
+            self.internal_manifest, self.ballot.style_id, nonce_seed
+        )
+
+        # Assert
+        contests = self.internal_manifest.get_contests_for(self.ballot.style_id)
+        self.assertEqual(len(plan.contests), len(contests))
+        for contest in contests:
+            contest_sequence = Nonces(contest.crypto_hash(), nonce_seed)
+            planned = plan.contests[contest.object_id]
+            self.assertEqual(
+                planned.contest_nonce, contest_sequence[contest.sequence_order]
+            )
+            self.assertEqual(planned.proof_seed, contest_sequence[0])
+            for selection in contest.ballot_selections + contest.placeholder_selections:
+                selection_sequence = Nonces(
+                    selection.crypto_hash(), planned.contest_nonce
+                )
+                planned_selection = planned.selections[selection.object_id]
+                self.assertEqual(
+                    planned_selection.selection_nonce,
+                    selection_sequence[selection.sequence_order],
+                )
+                self.assertEqual(planned_selection.proof_seed, selection_sequence[0])
+
+    def test_encrypted_ballot_uses_planned_nonces(self):
+        # Act
+        encrypted = get_optional(
+            encrypt_ballot(
+                self.ballot, self.internal_manifest, self.context, int_to_q(1)
+            )
+        )
+        plan = plan_ballot_nonces(
+            self.internal_manifest,
+            self.ballot.style_id,
+            CiphertextBallot.nonce_seed(
+                self.internal_manifest.manifest_hash,
+                encrypted.object_id,
+                get_optional(encrypted.nonce),
+            ),
+        )
+
+        # Assert
+        for contest in encrypted.contests:
+            planned = plan.contests[contest.object_id]
+            self.assertEqual(contest.nonce, planned.contest_nonce)
+            for selection in contest.ballot_selections:
+                self.assertEqual(
+                    selection.nonce,
+                    planned.selections[selection.object_id].selection_nonce,
+                )
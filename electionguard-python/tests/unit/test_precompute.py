@@ -0,0 +1,137 @@
+from time import sleep
+
+from tests.base_test_case import BaseTestCase
+
+from electionguard.ballot_validator import ballot_is_valid_for_election
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import EncryptionMediator
+from electionguard.group import ONE_MOD_Q, int_to_q
+from electionguard.precompute import (
+    EncryptionPool,
+    SELECTION_EXPONENTIATIONS,
+)
+
+import electionguard_tools.factories.ballot_factory as BallotFactory
+import electionguard_tools.factories.election_factory as ElectionFactory
+
+election_factory = ElectionFactory.ElectionFactory()
+ballot_factory = BallotFactory.BallotFactory()
+
+
+class TestPrecompute(BaseTestCase):
+    """Encryption precomputation tests"""
+
+    def setUp(self):
+        self.keypair = elgamal_keypair_from_secret(int_to_q(2))
+
+    def test_fill_pool_to_target_depth(self):
+        # Arrange
+        pool = EncryptionPool(self.keypair.public_key, target_depth=8)
+
+        # Act
+        added = pool.fill()
+
+        # Assert
+        self.assertEqual(added, 8)
+        self.assertEqual(pool.fill(), 0)
+        stats = pool.stats()
+        self.assertEqual(stats.depth, 8)
+        self.assertEqual(stats.produced, 8)
+        self.assertGreater(stats.refill_rate, 0)
+
+    def test_empty_pool_computes_on_demand(self):
+        # Arrange
+        pool = EncryptionPool(self.keypair.public_key, target_depth=2)
+        pool.fill()
+
+        # Act
+        pool.take_selection()
+
+        # Assert
+        stats = pool.stats()
+        self.assertEqual(stats.depth, 0)
+        self.assertEqual(stats.consumed, SELECTION_EXPONENTIATIONS)
+        self.assertEqual(stats.misses, SELECTION_EXPONENTIATIONS - 2)
+
+    def test_background_refill(self):
+        # Arrange
+        pool = EncryptionPool(self.keypair.public_key, target_depth=4)
+
+        # Act
+        pool.start()
+        for _ in range(100):
+            if pool.depth() == 4:
+                break
+            sleep(0.1)
+        pool.stop()
+
+        # Assert
+        self.assertEqual(pool.depth(), 4)
+        self.assertEqual(pool.stats().produced, 4)
+
+    def test_precomputed_selection_encrypts_and_proves(self):
+        pool = EncryptionPool(self.keypair.public_key)
+        for plaintext in (0, 1):
+            # Act
+            precomputed = pool.take_selection()
+            message = precomputed.encrypt(plaintext)
+            proof = precomputed.prove(message, plaintext, ONE_MOD_Q)
+
+            # Assert
+            self.assertEqual(
+                message.decrypt_known_nonce(
+                    self.keypair.public_key, precomputed.encryption.exponent
+                ),
+                plaintext,
+            )
+            self.assertTrue(proof.is_valid(message, self.keypair.public_key, ONE_MOD_Q))
+
+    def test_encrypt_ballot_with_pool(self):
+        # Arrange
+        manifest = election_factory.get_fake_manifest()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, self.keypair.public_key
+        )
+        pool = EncryptionPool(self.keypair.public_key, target_depth=64)
+        pool.fill()
+        mediator = EncryptionMediator(
+            internal_manifest,
+            context,
+            election_factory.get_encryption_device(),
+            pool,
+        )
+        source = election_factory.get_fake_ballot(internal_manifest)
+
+        # Act
+        result = mediator.encrypt(source)
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertTrue(
+            ballot_is_valid_for_election(result, internal_manifest, context)
+        )
+        self.assertIsNone(result.nonce)
+        self.assertLess(pool.depth(), 64)
+        for contest in result.contests:
+            for selection in contest.ballot_selections:
+                self.assertIsNotNone(selection.nonce)
+
+    def test_encrypt_ballot_with_pool_for_other_key_fails(self):
+        # Arrange
+        manifest = election_factory.get_fake_manifest()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, self.keypair.public_key
+        )
+        other_keypair = elgamal_keypair_from_secret(int_to_q(3))
+        mediator = EncryptionMediator(
+            internal_manifest,
+            context,
+            election_factory.get_encryption_device(),
+            EncryptionPool(other_keypair.public_key),
+        )
+
+        # Act
+        result = mediator.encrypt(election_factory.get_fake_ballot(internal_manifest))
+
+        # Assert
+        self.assertIsNone(result)
@@ -0,0 +1,132 @@
+from typing import List
+from unittest.mock import MagicMock
+
+from tests.base_test_case import BaseTestCase
+
+from electionguard.ballot import CiphertextBallot
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import encrypt_ballot
+from electionguard.group import TWO_MOD_Q, int_to_q
+from electionguard.utils import get_optional
+from electionguard.verification import (
+    DeferredVerifier,
+    VerificationMode,
+    VerificationPolicy,
+)
+from electionguard_tools.factories.ballot_factory import BallotFactory
+from electionguard_tools.factories.election_factory import ElectionFactory
+
+election_factory = ElectionFactory()
+SEED = election_factory.get_encryption_device().get_hash()
+
+
+class TestVerification(BaseTestCase):
+    """Verification policy tests"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+        (
+            self.internal_manifest,
+            self.context,
+        ) = election_factory.get_fake_ciphertext_election(
+            election_factory.get_simple_manifest_from_file(), keypair.public_key
+        )
+        self.ballot = BallotFactory().get_simple_ballot_from_file()
+        self.encrypted = get_optional(
+            encrypt_ballot(self.ballot, self.internal_manifest, self.context, SEED)
+        )
+
+    def test_policy_requires_a_valid_rate_and_a_verifier(self) -> None:
+        with self.assertRaises(ValueError):
+            VerificationPolicy.sampled(1.5)
+        with self.assertRaises(ValueError):
+            VerificationPolicy(VerificationMode.DEFERRED)
+
+    def test_check_verifies_by_mode(self) -> None:
+        # Arrange
+        wrong_manifest_hash = TWO_MOD_Q
+
+        # Act & Assert
+        for policy, is_verified in (
+            (VerificationPolicy.always(), True),
+            (VerificationPolicy.never(), False),
+            (VerificationPolicy.sampled(1.0), True),
+            (VerificationPolicy.sampled(0.0), False),
+        ):
+            self.assertTrue(
+                policy.check(
+                    self.encrypted, self.internal_manifest.manifest_hash, self.context
+                )
+            )
+            self.assertEqual(
+                not is_verified,
+                policy.check(self.encrypted, wrong_manifest_hash, self.context),
+            )
+
+    def test_encrypt_ballot_is_the_same_under_every_policy(self) -> None:
+        # Arrange
+        verifier = DeferredVerifier(self.internal_manifest.manifest_hash, self.context)
+
+        # Act & Assert
+        for policy in (
+            VerificationPolicy.always(),
+            VerificationPolicy.never(),
+            VerificationPolicy.sampled(0.5),
+            VerificationPolicy.deferred(verifier),
+        ):
+            encrypted = encrypt_ballot(
+                self.ballot,
+                self.internal_manifest,
+                self.context,
+                SEED,
+                verification=policy,
+            )
+            self.assertIsNotNone(encrypted)
+            self.assertEqual(self.encrypted.contests, encrypted.contests)
+        self.assertEqual(1, verifier.pending())
+        verifier.wait()
+        self.assertEqual(1, verifier.verified())
+        self.assertEqual([], verifier.failures())
+
+    def test_deferred_verifier_flags_failures_in_background(self) -> None:
+        # Arrange
+        flagged: List[CiphertextBallot] = []
+        verifier = DeferredVerifier(TWO_MOD_Q, self.context, flagged.append)
+        policy = VerificationPolicy.deferred(verifier)
+
+        # Act
+        verifier.start()
+        is_accepted = policy.check(
+            self.encrypted, self.internal_manifest.manifest_hash, self.context
+        )
+        verifier.wait()
+        verifier.stop()
+
+        # Assert
+        self.assertTrue(is_accepted)
+        self.assertEqual(0, verifier.pending())
+        self.assertEqual([self.encrypted], verifier.failures())
+        self.assertEqual([self.encrypted], flagged)
+
+    def test_deferred_verifier_survives_a_verification_that_raises(self) -> None:
+        # Arrange
+        raising = MagicMock(object_id="raising-ballot")
+        raising.is_valid_encryption.side_effect = RuntimeError("verification raised")
+        flagged: List[CiphertextBallot] = []
+        verifier = DeferredVerifier(
+            self.internal_manifest.manifest_hash, self.context, flagged.append
+        )
+
+        # Act
+        verifier.start()
+        verifier.submit(raising)
+        verifier.submit(self.encrypted)
+        verifier.wait()
+        verifier.stop()
+
+        # Assert
+        self.assertEqual(0, verifier.pending())
+        self.assertEqual(2, verifier.verified())
+        self.assertEqual([raising], verifier.failures())
+        self.assertEqual([raising], flagged)
@@ -0,0 +1,106 @@
+from tests.base_test_case import BaseTestCase
+
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import encrypt_ballot, master_nonce_for
+from electionguard.group import int_to_q
+from electionguard.nonce_plan import plan_contest_nonces
+from electionguard.utils import get_optional
+from electionguard.zero_encryption import ZeroEncryptionStore
+from electionguard_tools.factories.ballot_factory import BallotFactory
+from electionguard_tools.factories.election_factory import ElectionFactory
+
+election_factory = ElectionFactory()
+SEED = election_factory.get_encryption_device().get_hash()
+
+
+class TestZeroEncryption(BaseTestCase):
+    """Precomputed encryption of 0 tests"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        keypair = get_optional(elgamal_keypair_from_secret(int_to_q(2)))
+        (
+            self.internal_manifest,
+            self.context,
+        ) = election_factory.get_fake_ciphertext_election(
+            election_factory.get_simple_manifest_from_file(), keypair.public_key
+        )
+        self.ballot = BallotFactory().get_simple_ballot_from_file()
+        self.selection_count = sum(
+            len(contest.ballot_selections) + len(contest.placeholder_selections)
+            for contest in self.internal_manifest.get_contests_for(self.ballot.style_id)
+        )
+
+    def test_ballot_encrypted_from_store_matches_ballot_encrypted_without(
+        self,
+    ) -> None:
+        # Arrange
+        expected = get_optional(
+            encrypt_ballot(self.ballot, self.internal_manifest, self.context, SEED)
+        )
+        store = ZeroEncryptionStore(self.internal_manifest, self.context)
+        store.prepare(self.ballot.object_id, self.ballot.style_id, master_nonce_for())
+
+        # Act
+        encrypted = encrypt_ballot(
+            self.ballot,
+            self.internal_manifest,
+            self.context,
+            SEED,
+            zero_store=store,
+        )
+
+        # Assert
+        self.assertIsNotNone(encrypted)
+        self.assertEqual(expected.contests, encrypted.contests)
+        self.assertEqual(expected.crypto_hash, encrypted.crypto_hash)
+        self.assertEqual(0, store.depth())
+
+    def test_store_hands_out_each_entry_once_and_releases_the_rest(self) -> None:
+        # Arrange
+        store = ZeroEncryptionStore(self.internal_manifest, self.context)
+
+        # Act
+        nonce_seed = store.prepare(
+            self.ballot.object_id, self.ballot.style_id, master_nonce_for()
+        )
+        depth = store.depth()
+        contest = self.internal_manifest.get_contests_for(self.ballot.style_id)[0]
+        selection_nonce = (
+            plan_contest_nonces(contest, self.internal_manifest, nonce_seed)
+            .selections[contest.ballot_selections[0].object_id]
+            .selection_nonce
+        )
+        taken = store.take(selection_nonce)
+        taken_again = store.take(selection_nonce)
+        released = store.release(nonce_seed)
+
+        # Assert
+        self.assertEqual(self.selection_count, depth)
+        self.assertIsNotNone(taken)
+        self.assertIsNone(taken_again)
+        self.assertEqual(self.selection_count - 1, released)
+        self.assertEqual(0, store.depth())
+        self.assertEqual(0, store.release(nonce_seed))
+
+    def test_store_for_another_ballot_is_not_used(self) -> None:
+        # Arrange
+        expected = get_optional(
+            encrypt_ballot(self.ballot, self.internal_manifest, self.context, SEED)
+        )
+        store = ZeroEncryptionStore(self.internal_manifest, self.context)
+        store.prepare("another-ballot", self.ballot.style_id, master_nonce_for())
+
+        # Act
+        encrypted = encrypt_ballot(
+            self.ballot,
+            self.internal_manifest,
+            self.context,
+            SEED,
+            zero_store=store,
+        )
+
+        # Assert
+        self.assertIsNotNone(encrypted)
+        self.assertEqual(expected.contests, encrypted.contests)
+        self.assertEqual(self.selection_count, store.depth())